@@ -0,0 +1,39 @@
+"""Throwaway company trees for the benchmarks.
+
+Copies the real org config and templates into a temporary root and drops
+the absolute ``paths:`` block from ``company.yaml`` so every path resolves
+under the temporary root instead of the live company.
+"""
+
+from __future__ import annotations
+
+import shutil
+import sys
+from pathlib import Path
+
+import yaml
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def make_company(dest: Path) -> Path:
+    """Create a scratch company tree under *dest* and return its root."""
+    dest.mkdir(parents=True, exist_ok=True)
+    with (ROOT / "company.yaml").open("r", encoding="utf-8") as fh:
+        company = yaml.safe_load(fh)
+    company.pop("paths", None)
+    with (dest / "company.yaml").open("w", encoding="utf-8") as fh:
+        yaml.dump(company, fh, allow_unicode=True, sort_keys=False)
+
+    shutil.copytree(ROOT / "org", dest / "org")
+    shutil.copytree(ROOT / "employees", dest / "employees")
+    for div_dir in (ROOT / "divisions").iterdir():
+        target = dest / "divisions" / div_dir.name
+        target.mkdir(parents=True)
+        for name in ("DIVISION.md", "HEARTBEAT.md"):
+            if (div_dir / name).exists():
+                shutil.copy2(div_dir / name, target / name)
+    (dest / "board").mkdir()
+    return dest
@@ -0,0 +1,143 @@
+"""Benchmark workspace provisioning for a large hiring batch.
+
+Renders the ``employees/_template`` files for N synthetic employees (1,000
+by default) in a scratch company tree, comparing the legacy two-pass
+``str.replace`` fill against the compiled templates, then times writing
+the rendered workspaces to disk and a full ``create_employees`` batch at
+two sizes to check that the time per employee stays flat.
+
+Usage::
+
+    python benchmarks/bench_hire.py
+    python benchmarks/bench_hire.py --count 5000
+    pixi run bench-hire
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+from pathlib import Path
+
+import click
+
+from _fixtures import make_company
+
+from lib import CompanyConfig, EmployeeManager
+from lib.employee import _PLACEHOLDERS, _TEMPLATE_FILES, EmployeeSpec
+
+
+def _legacy_fill(content: str, replacements: dict[str, str]) -> str:
+    """The original 12 + 12 ``str.replace`` passes, kept for comparison."""
+    for raw_token, fmt_key in _PLACEHOLDERS.items():
+        content = content.replace(raw_token, fmt_key)
+    for key, value in replacements.items():
+        content = content.replace(key, value)
+    return content
+
+
+def _replacement_sets(cfg: CompanyConfig, count: int) -> list[dict[str, str]]:
+    division = next(iter(cfg.divisions))
+    role = next(iter(cfg.roles))
+    return [
+        EmployeeManager._build_replacements(
+            cfg,
+            employee_id=f"bench-{i:05d}",
+            name=f"Bench {i}",
+            role=role,
+            division=division,
+            emoji="",
+            agent_id=f"vwork-bench-{i:05d}",
+        )
+        for i in range(count)
+    ]
+
+
+def _bulk_hire(tmp: Path, count: int) -> float:
+    """Hire *count* employees in one batch into a fresh tree; return seconds."""
+    cfg = CompanyConfig(make_company(tmp / f"bulk-{count}"))
+    division = next(iter(cfg.divisions))
+    role = next(iter(cfg.roles))
+    specs = [
+        EmployeeSpec(
+            id=f"bulk-{i:05d}", name=f"Bulk {i}", role=role, division=division
+        )
+        for i in range(count)
+    ]
+    mgr = EmployeeManager(cfg)
+    start = time.perf_counter()
+    mgr.create_employees(specs)
+    return time.perf_counter() - start
+
+
+@click.command()
+@click.option(
+    "--count",
+    default=1000,
+    show_default=True,
+    help="Number of employees to provision.",
+)
+def main(count: int) -> None:
+    """Time template rendering and workspace provisioning for COUNT hires."""
+    with tempfile.TemporaryDirectory(prefix="vwork-bench-") as tmp:
+        root = make_company(Path(tmp) / "company")
+        cfg = CompanyConfig(root)
+        mgr = EmployeeManager(cfg)
+        template_dir = cfg.paths.employees / "_template"
+        sources = {
+            name: (template_dir / name).read_text(encoding="utf-8")
+            for name in _TEMPLATE_FILES
+            if (template_dir / name).exists()
+        }
+        replacement_sets = _replacement_sets(cfg, count)
+
+        start = time.perf_counter()
+        for replacements in replacement_sets:
+            for content in sources.values():
+                _legacy_fill(content, replacements)
+        legacy_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for replacements in replacement_sets:
+            for content in sources.values():
+                mgr._apply_placeholders(content, replacements)
+        compiled_s = time.perf_counter() - start
+
+        workspaces = root / "bench-workspaces"
+        start = time.perf_counter()
+        for i, replacements in enumerate(replacement_sets):
+            workspace = workspaces / f"bench-{i:05d}"
+            (workspace / "memory").mkdir(parents=True)
+            mgr._write_templates(workspace, sources, replacements)
+        provision_s = time.perf_counter() - start
+
+        small = max(1, count // 10)
+        bulk_small_s = _bulk_hire(Path(tmp), small)
+        bulk_s = _bulk_hire(Path(tmp), count)
+
+    files = count * len(sources)
+    click.echo(f"employees: {count}  template files: {len(sources)}")
+    click.echo(
+        f"render (legacy replace)  {legacy_s * 1000:9.1f} ms  "
+        f"{legacy_s / files * 1e6:7.2f} us/file"
+    )
+    click.echo(
+        f"render (compiled)        {compiled_s * 1000:9.1f} ms  "
+        f"{compiled_s / files * 1e6:7.2f} us/file"
+    )
+    click.echo(
+        f"provision workspaces     {provision_s * 1000:9.1f} ms  "
+        f"{provision_s / count * 1e3:7.2f} ms/employee"
+    )
+    click.echo(
+        f"create_employees({small:>5})  {bulk_small_s * 1000:9.1f} ms  "
+        f"{bulk_small_s / small * 1e3:7.2f} ms/employee"
+    )
+    click.echo(
+        f"create_employees({count:>5})  {bulk_s * 1000:9.1f} ms  "
+        f"{bulk_s / count * 1e3:7.2f} ms/employee"
+    )
+
+
+if __name__ == "__main__":
+    main()
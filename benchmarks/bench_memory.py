@@ -0,0 +1,115 @@
+"""Benchmark full-text memory search across many memory files.
+
+Writes N synthetic memory files (5,000 by default) spread over every
+employee of a scratch company, then times the first indexing pass, an
+incremental refresh with nothing changed, and
+:meth:`EmployeeManager.search_memory` (refresh + query, what the CLI pays).
+Fails when the median search exceeds the latency budget.
+
+Usage::
+
+    python benchmarks/bench_memory.py
+    python benchmarks/bench_memory.py --files 20000 --budget-ms 100
+    pixi run bench-memory
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import click
+
+from _fixtures import make_company
+
+from lib import CompanyConfig, EmployeeManager
+from lib.memory import MemoryIndex
+
+_WORDS = (
+    "render budget deadline review storyboard gpu audio script client "
+    "预算 渲染 交付 客户 进度 分镜 配音 排期"
+).split()
+
+
+def _write_memory(cfg: CompanyConfig, count: int) -> None:
+    rng = random.Random(0)
+    employees = list(cfg.employees)
+    for i in range(count):
+        eid = employees[i % len(employees)]
+        memory = cfg.employee_workspace(eid) / "memory"
+        memory.mkdir(parents=True, exist_ok=True)
+        body = " ".join(rng.choice(_WORDS) for _ in range(300))
+        (memory / f"note-{i:05d}.md").write_text(body, encoding="utf-8")
+    # One needle to look for.
+    (cfg.employee_workspace(employees[0]) / "memory" / "needle.md").write_text(
+        "The Zephyr launch moved to 三月十五日 after the 渲染农场 outage.\n",
+        encoding="utf-8",
+    )
+
+
+def _time_ms(fn, repeat: int) -> float:
+    """Return the median wall time of *fn* in milliseconds."""
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        runs.append((time.perf_counter() - start) * 1000)
+    return statistics.median(runs)
+
+
+@click.command()
+@click.option(
+    "--files",
+    "count",
+    default=5_000,
+    show_default=True,
+    help="Number of synthetic memory files.",
+)
+@click.option(
+    "--budget-ms",
+    default=100.0,
+    show_default=True,
+    help="Maximum median latency (ms) of a search including the refresh.",
+)
+@click.option(
+    "--repeat",
+    default=20,
+    show_default=True,
+    help="Timed runs per case; the median is reported.",
+)
+def main(count: int, budget_ms: float, repeat: int) -> None:
+    """Time memory indexing and search over COUNT files; enforce the budget."""
+    with tempfile.TemporaryDirectory(prefix="vwork-bench-") as tmp:
+        cfg = CompanyConfig(make_company(Path(tmp) / "company"))
+        _write_memory(cfg, count)
+
+        with MemoryIndex(cfg) as index:
+            start = time.perf_counter()
+            stats = index.refresh()
+            cold_ms = (time.perf_counter() - start) * 1000
+            refresh_ms = _time_ms(index.refresh, repeat)
+            query_ms = _time_ms(lambda: index.search("渲染农场 zephyr"), repeat)
+
+        mgr = EmployeeManager(cfg)
+        hits = mgr.search_memory("渲染农场 zephyr")
+        search_ms = _time_ms(lambda: mgr.search_memory("渲染农场 zephyr"), repeat)
+
+    click.echo(f"memory files: {stats.files}, needle hits: {len(hits)}")
+    click.echo(f"cold (index all)        {cold_ms:8.2f} ms")
+    click.echo(f"refresh (unchanged)     {refresh_ms:8.2f} ms")
+    click.echo(f"query only              {query_ms:8.2f} ms")
+    click.echo(f"search_memory           {search_ms:8.2f} ms")
+
+    if search_ms > budget_ms:
+        click.echo(
+            f"\nSearch budget violated: {search_ms:.2f} ms > {budget_ms:.2f} ms",
+            err=True,
+        )
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Startup import-time benchmark for the ``vwork`` CLI.
+
+Runs the entry point under ``python -X importtime`` for a set of cheap
+invocations, sums the per-module import times and fails when the total
+exceeds the budget or when a lazily-loaded dependency (rich) was imported
+on a path that should not need it.
+
+Usage::
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --budget-ms 80 --repeat 5
+    pixi run bench-startup
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+import click
+
+
+ROOT = Path(__file__).resolve().parent.parent
+VWORK = ROOT / "scripts" / "vwork.py"
+
+# (label, argv, modules that must not be imported on this path)
+_CASES: tuple[tuple[str, tuple[str, ...], tuple[str, ...]], ...] = (
+    ("help", ("--help",), ("rich",)),
+    ("status --help", ("status", "--help"), ("rich",)),
+    ("--json status", ("--json", "status"), ("rich",)),
+    ("status --format prom", ("status", "--format", "prom"), ("rich",)),
+)
+
+# ``import time:      self [us] |  cumulative | imported package``
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+@dataclass(slots=True)
+class ImportProfile:
+    """Import-time totals for one CLI invocation."""
+
+    total_us: int
+    modules: set[str]
+    returncode: int
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_us / 1000
+
+
+def profile(argv: tuple[str, ...]) -> ImportProfile:
+    """Run ``vwork <argv>`` under ``-X importtime`` and parse stderr."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", str(VWORK), *argv],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+    )
+    total_us = 0
+    modules: set[str] = set()
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match is None:
+            continue
+        total_us += int(match.group(1))
+        modules.add(match.group(4))
+    return ImportProfile(
+        total_us=total_us, modules=modules, returncode=proc.returncode
+    )
+
+
+@click.command()
+@click.option(
+    "--budget-ms",
+    default=120.0,
+    show_default=True,
+    help="Maximum total import time (ms) allowed per invocation.",
+)
+@click.option(
+    "--repeat",
+    default=3,
+    show_default=True,
+    help="Runs per case; the fastest run is compared to the budget.",
+)
+def main(budget_ms: float, repeat: int) -> None:
+    """Enforce the vwork CLI import-time budget."""
+    failures: list[str] = []
+
+    for label, argv, forbidden in _CASES:
+        runs = [profile(argv) for _ in range(max(1, repeat))]
+        best = min(runs, key=lambda p: p.total_us)
+        leaked = sorted(
+            m for m in forbidden
+            if any(mod == m or mod.startswith(m + ".") for mod in best.modules)
+        )
+        verdict = "ok"
+        if best.returncode != 0:
+            verdict = f"exit {best.returncode}"
+            failures.append(f"{label}: command exited {best.returncode}")
+        if best.total_ms > budget_ms:
+            verdict = "over budget"
+            failures.append(
+                f"{label}: {best.total_ms:.1f} ms > {budget_ms:.1f} ms budget"
+            )
+        if leaked:
+            verdict = "leaked imports"
+            failures.append(f"{label}: imported {', '.join(leaked)}")
+        click.echo(
+            f"{label:<22} {best.total_ms:8.1f} ms  "
+            f"{len(best.modules):4d} modules  {verdict}"
+        )
+
+    if failures:
+        click.echo("\nStartup budget violated:", err=True)
+        for failure in failures:
+            click.echo(f"  - {failure}", err=True)
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Benchmark the monitoring status endpoint on a large board.
+
+Fills a scratch company's ``board/active.yaml`` with N synthetic tasks
+(10,000 by default) and times :func:`lib.metrics.collect_metrics` in three
+states: cold (the board has to be parsed), a fresh process with the
+persisted board index (what a monitoring scrape pays), and warm in-process.
+Fails when the fresh-process scrape exceeds the latency budget.
+
+Usage::
+
+    python benchmarks/bench_status.py
+    python benchmarks/bench_status.py --tasks 50000 --budget-ms 50
+    pixi run bench-status
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import click
+import yaml
+
+from _fixtures import make_company
+
+from lib import CompanyConfig
+from lib.board import BoardIndex
+from lib.metrics import collect_metrics, format_prometheus
+
+
+def _write_board(cfg: CompanyConfig, count: int) -> None:
+    rng = random.Random(0)
+    employees = list(cfg.employees.values())
+    statuses = ("active", "active", "active", "blocked")
+    tasks = []
+    for i in range(count):
+        emp = rng.choice(employees)
+        tasks.append({
+            "id": f"2026-01-01-{i:05d}",
+            "title": f"Synthetic task {i}",
+            "assignee": emp.id,
+            "status": rng.choice(statuses),
+            "created": "2026-01-01",
+            "division": emp.division,
+            "description": "",
+        })
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    with (cfg.paths.board / "active.yaml").open("w", encoding="utf-8") as fh:
+        yaml.dump({"tasks": tasks}, fh, Dumper=dumper, sort_keys=False)
+
+
+def _time_ms(fn, repeat: int) -> float:
+    """Return the median wall time of *fn* in milliseconds."""
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        runs.append((time.perf_counter() - start) * 1000)
+    return statistics.median(runs)
+
+
+@click.command()
+@click.option(
+    "--tasks",
+    "count",
+    default=10_000,
+    show_default=True,
+    help="Number of tasks on the synthetic board.",
+)
+@click.option(
+    "--budget-ms",
+    default=50.0,
+    show_default=True,
+    help="Maximum median latency (ms) of a scrape with the board index.",
+)
+@click.option(
+    "--repeat",
+    default=20,
+    show_default=True,
+    help="Timed runs per case; the median is reported.",
+)
+def main(count: int, budget_ms: float, repeat: int) -> None:
+    """Time status counters on a COUNT-task board and enforce the budget."""
+    with tempfile.TemporaryDirectory(prefix="vwork-bench-") as tmp:
+        cfg = CompanyConfig(make_company(Path(tmp) / "company"))
+        _write_board(cfg, count)
+
+        start = time.perf_counter()
+        metrics = collect_metrics(cfg)
+        cold_ms = (time.perf_counter() - start) * 1000
+
+        # A new BoardIndex per call, like a separate scrape process.
+        scrape_ms = _time_ms(
+            lambda: format_prometheus(
+                collect_metrics(cfg, board=BoardIndex(cfg))
+            ),
+            repeat,
+        )
+        board = BoardIndex(cfg)
+        warm_ms = _time_ms(
+            lambda: format_prometheus(collect_metrics(cfg, board=board)),
+            repeat,
+        )
+
+    click.echo(f"tasks: {metrics['tasks']['total']}")
+    click.echo(f"cold (parse board)      {cold_ms:8.2f} ms")
+    click.echo(f"scrape (board index)    {scrape_ms:8.2f} ms")
+    click.echo(f"warm (in-process)       {warm_ms:8.2f} ms")
+
+    if scrape_ms > budget_ms:
+        click.echo(
+            f"\nStatus budget violated: {scrape_ms:.2f} ms > {budget_ms:.2f} ms",
+            err=True,
+        )
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,29 @@
-"""VWork -- AI-powered virtual company management library."""
+"""VWork -- AI-powered virtual company management library.
+
+Public classes are imported lazily on first attribute access so that
+``import lib.config`` (or a CLI ``--help``) does not pay for every module.
+"""
 
 from __future__ import annotations
 
-from .config import CompanyConfig
-from .division import DivisionManager
-from .employee import EmployeeManager
-from .openclaw import OpenClawGateway
-from .orchestrator import Orchestrator
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import CompanyConfig
+    from .division import DivisionManager
+    from .employee import EmployeeManager
+    from .openclaw import OpenClawGateway
+    from .orchestrator import Orchestrator
+
+# Public name -> submodule that defines it
+_EXPORTS: dict[str, str] = {
+    "CompanyConfig": ".config",
+    "DivisionManager": ".division",
+    "EmployeeManager": ".employee",
+    "OpenClawGateway": ".openclaw",
+    "Orchestrator": ".orchestrator",
+}
 
 __all__ = [
     "CompanyConfig",
@@ -15,3 +32,17 @@ __all__ = [
     "OpenClawGateway",
     "Orchestrator",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,259 @@
+"""Cached task counters for ``board/active.yaml``.
+
+Parsing a large board is by far the most expensive part of answering
+"how many tasks does X have?".  :class:`BoardIndex` parses the board only
+when its ``(mtime_ns, size)`` signature changes and keeps the aggregated
+counts both in memory and in ``.vwork/board-index.json``, so a fresh
+process pays one ``stat`` and one small JSON read.  Completed-task counts
+and work durations per assignee for the monthly archives
+(``board/archive/YYYY-MM.yaml``) are cached the same way, one signature
+per archive file.
+
+Usage::
+
+    index = BoardIndex(cfg)
+    counts = index.counts()
+    counts.by_status["active"]
+    counts.by_assignee.get("director-chen", {})
+    index.throughput().get("director-chen", 0)  # completed, last 2 months
+    index.durations().get("director-chen", [])  # hours per task, last 6 months
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from .config import CompanyConfig
+from .state import load_json, save_json
+
+
+INDEX_FILENAME = "board-index.json"
+
+# Bump when the on-disk layout changes; older indexes are rebuilt.
+_INDEX_FORMAT = 3
+
+
+@dataclass(frozen=True, slots=True)
+class BoardCounts:
+    """Aggregated task counts for the active board."""
+
+    total: int = 0
+    by_status: dict[str, int] = field(default_factory=dict)
+    by_division: dict[str, dict[str, int]] = field(default_factory=dict)
+    by_assignee: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    def load(
+        self,
+        assignee: str,
+        *,
+        statuses: tuple[str, ...] = ("active",),
+    ) -> int:
+        """Return how many of *assignee*'s tasks have one of *statuses*."""
+        per_status = self.by_assignee.get(assignee, {})
+        return sum(per_status.get(s, 0) for s in statuses)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total": self.total,
+            "by_status": self.by_status,
+            "by_division": self.by_division,
+            "by_assignee": self.by_assignee,
+        }
+
+
+class BoardIndex:
+    """Stat-validated, persisted task counts for ``board/active.yaml``."""
+
+    def __init__(self, config: CompanyConfig, path: Path | None = None) -> None:
+        self._board = config.paths.board / "active.yaml"
+        self._archive_dir = config.paths.board / "archive"
+        self._path = path or config.paths.state / INDEX_FILENAME
+        self._signature: tuple[int, int] | None = None
+        self._counts = BoardCounts()
+        self.rebuilds = 0
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def counts(self) -> BoardCounts:
+        """Return the counts, re-parsing the board only if it changed."""
+        signature = _signature(self._board)
+        if signature == self._signature:
+            return self._counts
+
+        raw = self._read()
+        if tuple(raw.get("source") or ()) == signature:
+            counts = BoardCounts(
+                total=raw["total"],
+                by_status=raw["by_status"],
+                by_division=raw["by_division"],
+                by_assignee=raw["by_assignee"],
+            )
+        else:
+            counts = _count(_load_tasks(self._board))
+            self.rebuilds += 1
+            raw.update(source=signature, **counts.to_dict())
+            self._write(raw)
+
+        self._signature = signature
+        self._counts = counts
+        return counts
+
+    def throughput(self, *, months: int = 2) -> dict[str, int]:
+        """Return completed tasks per assignee in the latest *months* archives.
+
+        Only archive files whose signature changed since they were last
+        summarised are parsed.
+        """
+        done: dict[str, int] = {}
+        for stats in self._archive(months):
+            for assignee, n in stats["done"].items():
+                done[assignee] = done.get(assignee, 0) + n
+        return done
+
+    def durations(self, *, months: int = 6) -> dict[str, list[float]]:
+        """Return the hours from start to completion of archived tasks.
+
+        Keyed by assignee, over the latest *months* archives; tasks that
+        were never started (or completed before completion times were
+        recorded) are left out.
+        """
+        hours: dict[str, list[float]] = {}
+        for stats in self._archive(months):
+            for assignee, values in stats["hours"].items():
+                hours.setdefault(assignee, []).extend(values)
+        return hours
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _archive(self, months: int) -> list[dict[str, Any]]:
+        """Per-file summaries of the latest *months* archives, oldest first."""
+        try:
+            names = sorted(
+                entry.name
+                for entry in os.scandir(self._archive_dir)
+                if entry.name.endswith(".yaml")
+            )
+        except FileNotFoundError:
+            names = []
+
+        raw = self._read()
+        cached = raw.get("archive") or {}
+        # Forget deleted files, keep the rest for queries over other ranges.
+        archive = {name: cached[name] for name in names if name in cached}
+        changed = len(archive) != len(cached)
+        out: list[dict[str, Any]] = []
+        for name in names[-months:] if months > 0 else []:
+            signature = list(_signature(self._archive_dir / name))
+            entry = archive.get(name)
+            if entry is None or entry[:2] != signature:
+                entry = [*signature, _summarise(_load_tasks(self._archive_dir / name))]
+                archive[name] = entry
+                changed = True
+                self.rebuilds += 1
+            out.append(entry[2])
+        if changed:
+            raw["archive"] = archive
+            self._write(raw)
+        return out
+
+    def _read(self) -> dict[str, Any]:
+        raw = load_json(self._path, default={})
+        if not isinstance(raw, dict) or raw.get("format") != _INDEX_FORMAT:
+            return {"format": _INDEX_FORMAT}
+        return raw
+
+    def _write(self, raw: dict[str, Any]) -> None:
+        try:
+            save_json(self._path, raw)
+        except OSError:
+            pass  # read-only state dir: still answer from memory
+
+    # ------------------------------------------------------------------
+    # Dunder helpers
+    # ------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return f"BoardIndex(board={self._board}, rebuilds={self.rebuilds})"
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _signature(path: Path) -> tuple[int, int]:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return (0, -1)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _load_tasks(path: Path) -> list[dict[str, Any]]:
+    """Parse the board with libyaml when available (much faster on 10k tasks)."""
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        with path.open("r", encoding="utf-8") as fh:
+            data = yaml.load(fh, Loader=loader)
+    except FileNotFoundError:
+        return []
+    tasks = (data or {}).get("tasks") or []
+    return [t for t in tasks if isinstance(t, dict)]
+
+
+def _tally(values: Any) -> dict[str, int]:
+    out: dict[str, int] = {}
+    for value in values:
+        out[value] = out.get(value, 0) + 1
+    return out
+
+
+def _summarise(tasks: list[dict[str, Any]]) -> dict[str, Any]:
+    """Completed count and start-to-completion hours per assignee."""
+    hours: dict[str, list[float]] = {}
+    for task in tasks:
+        try:
+            started = datetime.fromisoformat(str(task.get("started") or ""))
+            completed = datetime.fromisoformat(str(task.get("completed") or ""))
+        except ValueError:
+            continue
+        elapsed = (completed - started).total_seconds() / 3600
+        if elapsed >= 0:
+            hours.setdefault(str(task.get("assignee", "")), []).append(
+                round(elapsed, 3)
+            )
+    return {
+        "done": _tally(str(t.get("assignee", "")) for t in tasks),
+        "hours": hours,
+    }
+
+
+def _count(tasks: list[dict[str, Any]]) -> BoardCounts:
+    by_status: dict[str, int] = {}
+    by_division: dict[str, dict[str, int]] = {}
+    by_assignee: dict[str, dict[str, int]] = {}
+    for task in tasks:
+        status = str(task.get("status", "active"))
+        division = str(task.get("division", ""))
+        assignee = str(task.get("assignee", ""))
+        by_status[status] = by_status.get(status, 0) + 1
+        per_div = by_division.setdefault(division, {})
+        per_div[status] = per_div.get(status, 0) + 1
+        per_emp = by_assignee.setdefault(assignee, {})
+        per_emp[status] = per_emp.get(status, 0) + 1
+    return BoardCounts(
+        total=len(tasks),
+        by_status=by_status,
+        by_division=by_division,
+        by_assignee=by_assignee,
+    )
@@ -0,0 +1,418 @@
+"""Memory compaction: roll old ``memory/`` files into compressed segments.
+
+Agents append to ``memory/`` without limit and every turn reads it, so
+files older than ``runtime.memory_hot_days`` are moved into one zip
+segment per month under ``memory/archive/`` (``2026-01.zip`` ...).  The
+newest ``runtime.memory_hot_files`` files always stay uncompressed, and if
+the remaining hot files still exceed the employee's memory budget (see
+:meth:`CompanyConfig.memory_budget`) the oldest of them are archived too.
+
+Cold entries stay reachable: :class:`~lib.memory.MemoryIndex` indexes
+every segment member as ``memory/archive/<segment>.zip#<name>``,
+:func:`read_memory` reads such a path back, and ``memory/archive/INDEX.md``
+lists what was archived for agents browsing their workspace.
+
+Segments are rewritten to a temporary file and renamed into place before
+any original is deleted, so an interrupted run never loses an entry.
+
+Usage::
+
+    compactor = MemoryCompactor(cfg)
+    for report in compactor.compact_all():
+        print(report.employee, report.files, report.reclaimed)
+
+    text = read_memory(cfg, "director-chen", "memory/archive/2026-01.zip#notes.md")
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+import zipfile
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .config import CompanyConfig
+from .workspace import walk_files
+
+
+ARCHIVE_DIR = "archive"  # under memory/
+INDEX_NAME = "INDEX.md"
+SEGMENT_SUFFIX = ".zip"
+
+_DAY = 86400.0
+
+
+@dataclass(frozen=True, slots=True)
+class CompactionReport:
+    """What compacting one employee's ``memory/`` did (or would do)."""
+
+    employee: str
+    files: int  # files moved into segments
+    archived_bytes: int  # their uncompressed size
+    segments: list[str] = field(default_factory=list)  # written, relative to memory/
+    hot_files: int = 0  # uncompressed files left in memory/
+    hot_bytes_before: int = 0
+    hot_bytes_after: int = 0
+    archive_bytes_before: int = 0
+    archive_bytes_after: int = 0
+    budget: int = 0  # bytes, 0 = unlimited
+    dry_run: bool = False
+
+    @property
+    def reclaimed(self) -> int:
+        """Bytes of disk freed (hot and archive totals, before vs after)."""
+        before = self.hot_bytes_before + self.archive_bytes_before
+        return before - (self.hot_bytes_after + self.archive_bytes_after)
+
+    @property
+    def over_budget(self) -> bool:
+        """True if the hot files still exceed the budget (hot tail too big)."""
+        return self.budget > 0 and self.hot_bytes_after > self.budget
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "employee": self.employee,
+            "files": self.files,
+            "archived_bytes": self.archived_bytes,
+            "segments": self.segments,
+            "hot_files": self.hot_files,
+            "hot_bytes_before": self.hot_bytes_before,
+            "hot_bytes_after": self.hot_bytes_after,
+            "archive_bytes_before": self.archive_bytes_before,
+            "archive_bytes_after": self.archive_bytes_after,
+            "reclaimed": None if self.dry_run else self.reclaimed,
+            "budget": self.budget,
+            "over_budget": self.over_budget,
+            "dry_run": self.dry_run,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class _HotFile:
+    rel: str  # relative to memory/
+    path: Path
+    size: int
+    mtime_ns: int
+
+
+class MemoryCompactor:
+    """Archive old memory files into monthly compressed segments.
+
+    *hot_days* and *hot_files* default to the runtime settings.
+    """
+
+    def __init__(
+        self,
+        config: CompanyConfig,
+        *,
+        hot_days: float | None = None,
+        hot_files: int | None = None,
+        dry_run: bool = False,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._cfg = config
+        self.hot_days = (
+            config.runtime.memory_hot_days if hot_days is None else hot_days
+        )
+        self.hot_files = (
+            config.runtime.memory_hot_files if hot_files is None else hot_files
+        )
+        self.dry_run = dry_run
+        self._clock = clock
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def compact(self, employee_id: str) -> CompactionReport:
+        """Archive *employee_id*'s old memory files and report the result."""
+        memory = self._memory_dir(employee_id)
+        budget = self._cfg.memory_budget(employee_id)
+        hot = _hot_files(memory)
+        selected = self._select(hot, budget)
+        hot_before = sum(f.size for f in hot)
+        archive_before = _archive_size(memory)
+        archived_bytes = sum(f.size for f in selected)
+
+        if self.dry_run or not selected:
+            return CompactionReport(
+                employee=employee_id,
+                files=len(selected),
+                archived_bytes=archived_bytes,
+                hot_files=len(hot) - len(selected),
+                hot_bytes_before=hot_before,
+                hot_bytes_after=hot_before - archived_bytes,
+                archive_bytes_before=archive_before,
+                archive_bytes_after=archive_before,
+                budget=budget,
+                dry_run=self.dry_run,
+            )
+
+        by_segment: dict[str, list[_HotFile]] = {}
+        for f in selected:
+            month = time.strftime("%Y-%m", time.localtime(f.mtime_ns / 1e9))
+            by_segment.setdefault(f"{month}{SEGMENT_SUFFIX}", []).append(f)
+
+        archive = memory / ARCHIVE_DIR
+        archive.mkdir(exist_ok=True)
+        moved = 0
+        for name, files in sorted(by_segment.items()):
+            _write_segment(archive / name, files)
+            for f in files:
+                if _unchanged(f):
+                    f.path.unlink()
+                    moved += 1
+        _prune_dirs(memory)
+        _write_index(archive)
+
+        remaining = _hot_files(memory)
+        return CompactionReport(
+            employee=employee_id,
+            files=moved,
+            archived_bytes=archived_bytes,
+            segments=[f"{ARCHIVE_DIR}/{name}" for name in sorted(by_segment)],
+            hot_files=len(remaining),
+            hot_bytes_before=hot_before,
+            hot_bytes_after=sum(f.size for f in remaining),
+            archive_bytes_before=archive_before,
+            archive_bytes_after=_archive_size(memory),
+            budget=budget,
+        )
+
+    def compact_all(
+        self,
+        employee_ids: list[str] | None = None,
+        *,
+        max_workers: int = 8,
+    ) -> list[CompactionReport]:
+        """Compact several employees in parallel (all by default)."""
+        ids = list(self._cfg.employees) if employee_ids is None else employee_ids
+        if not ids:
+            return []
+        workers = max(1, min(max_workers, len(ids)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self.compact, ids))
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _memory_dir(self, employee_id: str) -> Path:
+        return self._cfg.employee_workspace(employee_id) / "memory"
+
+    def _select(self, hot: list[_HotFile], budget: int) -> list[_HotFile]:
+        """Pick files to archive: past the age cut-off, then over budget."""
+        newest_first = sorted(hot, key=lambda f: f.mtime_ns, reverse=True)
+        candidates = newest_first[max(0, self.hot_files):]
+        candidates.reverse()  # oldest first
+        cutoff_ns = int((self._clock() - self.hot_days * _DAY) * 1e9)
+
+        selected = [f for f in candidates if f.mtime_ns < cutoff_ns]
+        if budget > 0:
+            remaining = sum(f.size for f in hot) - sum(f.size for f in selected)
+            chosen = {f.rel for f in selected}
+            for f in candidates:
+                if remaining <= budget:
+                    break
+                if f.rel not in chosen:
+                    selected.append(f)
+                    remaining -= f.size
+        selected.sort(key=lambda f: f.mtime_ns)
+        return selected
+
+    # ------------------------------------------------------------------
+    # Dunder helpers
+    # ------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return (
+            f"MemoryCompactor(hot_days={self.hot_days}, "
+            f"hot_files={self.hot_files}, dry_run={self.dry_run})"
+        )
+
+
+# ---------------------------------------------------------------------------
+# Segment access
+# ---------------------------------------------------------------------------
+
+
+def is_segment(rel: str) -> bool:
+    """Return whether a workspace-relative path is an archive segment."""
+    return rel.startswith(f"memory/{ARCHIVE_DIR}/") and rel.endswith(SEGMENT_SUFFIX)
+
+
+def is_archive_metadata(rel: str) -> bool:
+    """Return whether *rel* is archive bookkeeping rather than memory.
+
+    That is ``memory/archive/INDEX.md`` and segments set aside as
+    ``*.corrupt``; neither should turn up in memory search.
+    """
+    if not rel.startswith(f"memory/{ARCHIVE_DIR}/"):
+        return False
+    return rel == f"memory/{ARCHIVE_DIR}/{INDEX_NAME}" or rel.endswith(".corrupt")
+
+
+def iter_segment(path: Path) -> Iterator[tuple[str, int, int, bytes]]:
+    """Yield ``(name, size, mtime_ns, data)`` for each member of a segment.
+
+    A corrupt segment yields nothing.
+    """
+    try:
+        with zipfile.ZipFile(path) as zf:
+            for info in zf.infolist():
+                if info.is_dir():
+                    continue
+                mtime = time.mktime((*info.date_time, 0, 0, -1))
+                yield info.filename, info.file_size, int(mtime * 1e9), zf.read(info)
+    except zipfile.BadZipFile:
+        return
+
+
+def read_memory(cfg: CompanyConfig, employee_id: str, path: str) -> str:
+    """Return the text of a memory entry, hot or archived.
+
+    *path* is workspace-relative as reported by memory search, e.g.
+    ``memory/notes.md`` or ``memory/archive/2026-01.zip#notes.md``.
+    Raises ``FileNotFoundError`` if there is no such entry.
+    """
+    workspace = cfg.employee_workspace(employee_id).resolve()
+    segment, sep, member = path.partition("#")
+    target = (workspace / segment).resolve()
+    if not target.is_relative_to(workspace / "memory"):
+        raise FileNotFoundError(f"Not a memory path: {path}")
+    if not sep:
+        return target.read_text(encoding="utf-8", errors="replace")
+    try:
+        with zipfile.ZipFile(target) as zf:
+            data = zf.read(member)
+    except (KeyError, zipfile.BadZipFile) as exc:
+        raise FileNotFoundError(f"No archived entry {path}") from exc
+    return data.decode("utf-8", errors="replace")
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _hot_files(memory: Path) -> list[_HotFile]:
+    out: list[_HotFile] = []
+    for rel, entry in walk_files(memory):
+        if rel.startswith(f"{ARCHIVE_DIR}/"):
+            continue
+        try:
+            st = entry.stat(follow_symlinks=False)
+        except FileNotFoundError:
+            continue
+        out.append(_HotFile(rel, Path(entry.path), st.st_size, st.st_mtime_ns))
+    return out
+
+
+def _archive_size(memory: Path) -> int:
+    total = 0
+    for _rel, entry in walk_files(memory / ARCHIVE_DIR):
+        try:
+            total += entry.stat(follow_symlinks=False).st_size
+        except FileNotFoundError:
+            continue
+    return total
+
+
+def _unchanged(f: _HotFile) -> bool:
+    """True if *f* was not written to while its segment was being built."""
+    try:
+        st = os.stat(f.path, follow_symlinks=False)
+    except FileNotFoundError:
+        return False
+    return st.st_size == f.size and st.st_mtime_ns == f.mtime_ns
+
+
+def _write_segment(path: Path, files: list[_HotFile]) -> None:
+    """Add *files* to the segment at *path*, replacing it atomically.
+
+    A member whose name is already taken by different content is stored
+    under ``name~N`` so nothing archived earlier is overwritten.
+    """
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}-", dir=path.parent)
+    os.close(fd)
+    try:
+        with zipfile.ZipFile(
+            tmp_name, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=9
+        ) as out:
+            existing: dict[str, bytes] = {}
+            if path.exists():
+                try:
+                    with zipfile.ZipFile(path) as src:
+                        for info in src.infolist():
+                            data = src.read(info)
+                            out.writestr(info, data)
+                            existing[info.filename] = data
+                except zipfile.BadZipFile:
+                    # Keep the unreadable segment aside rather than drop it.
+                    os.replace(path, path.with_suffix(".corrupt"))
+            for f in files:
+                data = f.path.read_bytes()
+                name = f.rel
+                n = 1
+                while name in existing and existing[name] != data:
+                    name, n = f"{f.rel}~{n}", n + 1
+                if name in existing:
+                    continue  # already archived by an interrupted run
+                info = zipfile.ZipInfo(
+                    name, date_time=_zip_time(f.mtime_ns)
+                )
+                info.compress_type = zipfile.ZIP_DEFLATED
+                out.writestr(info, data)
+                existing[name] = data
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _write_index(archive: Path) -> None:
+    """Regenerate ``archive/INDEX.md`` listing every archived entry."""
+    lines = [
+        "# Archived memory",
+        "",
+        "Older memory entries are compressed here. Search them with",
+        "`vwork memory search <words> --employee <id>` and read one with",
+        "`vwork memory show <id> memory/archive/<segment>#<name>`.",
+        "",
+    ]
+    for segment in sorted(archive.glob(f"*{SEGMENT_SUFFIX}")):
+        lines.append(f"## {segment.name}")
+        lines.append("")
+        try:
+            with zipfile.ZipFile(segment) as zf:
+                infos = [i for i in zf.infolist() if not i.is_dir()]
+        except zipfile.BadZipFile:
+            infos = []
+        for info in infos:
+            day = "%04d-%02d-%02d" % info.date_time[:3]
+            lines.append(
+                f"- `{segment.name}#{info.filename}` ({day}, {info.file_size} bytes)"
+            )
+        lines.append("")
+    (archive / INDEX_NAME).write_text("\n".join(lines), encoding="utf-8")
+
+
+def _prune_dirs(memory: Path) -> None:
+    """Remove subdirectories of *memory* left empty by compaction."""
+    for dirpath, _dirnames, _filenames in os.walk(memory, topdown=False):
+        path = Path(dirpath)
+        if path == memory or path == memory / ARCHIVE_DIR:
+            continue
+        try:
+            path.rmdir()  # only succeeds when empty
+        except OSError:
+            pass
+
+
+def _zip_time(mtime_ns: int) -> tuple[int, int, int, int, int, int]:
+    t = time.localtime(max(mtime_ns / 1e9, 315532800.0))  # zip epoch: 1980
+    return (t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec)
@@ -15,6 +15,9 @@ from typing import Any
 
 import yaml
 
+# libyaml's loader when available: same results, several times faster.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 # ---------------------------------------------------------------------------
 # Low-level dataclasses mirroring the YAML structures
@@ -29,6 +32,23 @@ class RuntimeConfig:
     default_model: str
     premium_model: str
     max_concurrent_agents: int = 4
+    heartbeat_sla_minutes: int = 120  # default for roles without their own
+    redispatch_stale: bool = False  # watchdog expires the leases of stale agents
+    memory_hot_days: int = 14  # memory files younger than this stay uncompressed
+    memory_hot_files: int = 5  # newest files always kept uncompressed
+    memory_budget_kb: int = 0  # uncompressed memory/ budget, 0 = unlimited
+    rebalance_min_queue: int = 2  # a donor keeps at least one of this many tasks
+    rebalance_same_role: bool = True  # only steal between employees of one role
+    rebalance_blocked: bool = False  # blocked (not just active) tasks may move
+    priority_aging_hours: int = 24  # waiting this long = one priority level, 0 = off
+    lease_minutes: int = 0  # dispatch lease length, 0 = the role's heartbeat SLA
+    lease_max_retries: int = 2  # re-dispatches after an expired lease
+    lease_fallback: str = ""  # employee who gets tasks out of retries ("" = block)
+    model_routing: bool = True  # send some messages on premium_model (lib/routing.py)
+    premium_priority: int = 0  # tasks this urgent or more go premium, -1 = never
+    premium_roles: tuple[str, ...] = ()  # roles whose messages always go premium
+    premium_after_attempts: int = 1  # re-sends after this many attempts go premium
+    premium_min_tokens: int = 6000  # messages this long go premium, 0 = never
 
 
 @dataclass(frozen=True, slots=True)
@@ -50,6 +70,7 @@ class PathsConfig:
     board: Path
     scripts: Path
     lib: Path
+    state: Path  # local caches and snapshots (not version-controlled)
 
     @classmethod
     def from_dict(cls, data: dict[str, str]) -> PathsConfig:
@@ -90,6 +111,8 @@ class RoleConfig:
     permissions: list[str] = field(default_factory=list)
     responsibilities: list[str] = field(default_factory=list)
     model: str = ""
+    heartbeat_sla_minutes: int = 0  # 0 = use the runtime default
+    memory_budget_kb: int = 0  # 0 = use the runtime default
 
 
 @dataclass(frozen=True, slots=True)
@@ -154,6 +177,39 @@ class CompanyConfig:
         self.roles: dict[str, RoleConfig] = self._parse_roles()
         self.employees: dict[str, EmployeeConfig] = self._parse_employees()
 
+    @classmethod
+    def _from_parsed(
+        cls,
+        root: Path,
+        *,
+        company: CompanyInfo,
+        runtime: RuntimeConfig,
+        channels: ChannelsConfig,
+        paths: PathsConfig,
+        divisions: dict[str, DivisionConfig],
+        roles: dict[str, RoleConfig],
+        employees: dict[str, EmployeeConfig],
+    ) -> CompanyConfig:
+        """Build a config from already-parsed objects, skipping all YAML I/O.
+
+        Used when rehydrating a config that was parsed elsewhere (e.g. a
+        published snapshot); *root* is trusted as-is.
+        """
+        self = cls.__new__(cls)
+        self._root = root
+        self._raw_company = {}
+        self._raw_divisions = {}
+        self._raw_roles = {}
+        self._raw_employees = {}
+        self.company = company
+        self.runtime = runtime
+        self.channels = channels
+        self.paths = paths
+        self.divisions = divisions
+        self.roles = roles
+        self.employees = employees
+        return self
+
     # ------------------------------------------------------------------
     # Public helpers
     # ------------------------------------------------------------------
@@ -175,6 +231,42 @@ class CompanyConfig:
         """Fetch a single role by ID, raising ``KeyError`` if missing."""
         return self.roles[role_id]
 
+    def employee_model(self, employee_id: str) -> str:
+        """Return the model an employee's agent runs on.
+
+        The role's configured model wins, falling back to the company
+        default model.
+        """
+        emp = self.employee(employee_id)
+        role_cfg = self.roles.get(emp.role)
+        if role_cfg is not None and role_cfg.model:
+            return role_cfg.model
+        return self.runtime.default_model
+
+    def heartbeat_sla(self, employee_id: str) -> float:
+        """Return how many seconds an employee's heartbeat may go quiet.
+
+        The role's ``heartbeat_sla_minutes`` wins, falling back to the
+        runtime default.
+        """
+        emp = self.employee(employee_id)
+        role_cfg = self.roles.get(emp.role)
+        if role_cfg is not None and role_cfg.heartbeat_sla_minutes > 0:
+            return role_cfg.heartbeat_sla_minutes * 60.0
+        return self.runtime.heartbeat_sla_minutes * 60.0
+
+    def memory_budget(self, employee_id: str) -> int:
+        """Return the uncompressed ``memory/`` budget in bytes (0 = none).
+
+        The role's ``memory_budget_kb`` wins, falling back to the runtime
+        default.
+        """
+        emp = self.employee(employee_id)
+        role_cfg = self.roles.get(emp.role)
+        if role_cfg is not None and role_cfg.memory_budget_kb > 0:
+            return role_cfg.memory_budget_kb * 1024
+        return self.runtime.memory_budget_kb * 1024
+
     def employee_workspace(self, employee_id: str) -> Path:
         """Return the absolute workspace path for an employee."""
         emp = self.employee(employee_id)
@@ -218,7 +310,7 @@ class CompanyConfig:
     @staticmethod
     def _load_yaml(path: Path) -> dict[str, Any]:
         with path.open("r", encoding="utf-8") as fh:
-            data = yaml.safe_load(fh)
+            data = yaml.load(fh, Loader=_YAML_LOADER)
         if not isinstance(data, dict):
             raise ValueError(f"Expected a YAML mapping in {path}")
         return data
@@ -250,6 +342,23 @@ class CompanyConfig:
             default_model=rt.get("default_model", ""),
             premium_model=rt.get("premium_model", ""),
             max_concurrent_agents=int(rt.get("max_concurrent_agents", 4)),
+            heartbeat_sla_minutes=int(rt.get("heartbeat_sla_minutes", 120)),
+            redispatch_stale=bool(rt.get("redispatch_stale", False)),
+            memory_hot_days=int(rt.get("memory_hot_days", 14)),
+            memory_hot_files=int(rt.get("memory_hot_files", 5)),
+            memory_budget_kb=int(rt.get("memory_budget_kb", 0)),
+            rebalance_min_queue=int(rt.get("rebalance_min_queue", 2)),
+            rebalance_same_role=bool(rt.get("rebalance_same_role", True)),
+            rebalance_blocked=bool(rt.get("rebalance_blocked", False)),
+            priority_aging_hours=int(rt.get("priority_aging_hours", 24)),
+            lease_minutes=int(rt.get("lease_minutes", 0)),
+            lease_max_retries=int(rt.get("lease_max_retries", 2)),
+            lease_fallback=str(rt.get("lease_fallback") or ""),
+            model_routing=bool(rt.get("model_routing", True)),
+            premium_priority=int(rt.get("premium_priority", 0)),
+            premium_roles=tuple(str(r) for r in rt.get("premium_roles") or ()),
+            premium_after_attempts=int(rt.get("premium_after_attempts", 1)),
+            premium_min_tokens=int(rt.get("premium_min_tokens", 6000)),
         )
 
     def _parse_channels(self) -> ChannelsConfig:
@@ -270,6 +379,7 @@ class CompanyConfig:
             "board": str(self._root / "board"),
             "scripts": str(self._root / "scripts"),
             "lib": str(self._root / "lib"),
+            "state": str(self._root / ".vwork"),
         }
         merged = {**defaults, **raw}
         return PathsConfig.from_dict(merged)
@@ -308,6 +418,10 @@ class CompanyConfig:
                 permissions=role_data.get("permissions", []),
                 responsibilities=role_data.get("responsibilities", []),
                 model=role_data.get("model", ""),
+                heartbeat_sla_minutes=int(
+                    role_data.get("heartbeat_sla_minutes", 0)
+                ),
+                memory_budget_kb=int(role_data.get("memory_budget_kb", 0)),
             )
         return out
 
@@ -0,0 +1,292 @@
+"""Content-hashed agent context bundles.
+
+Every agent turn loads the same standing context: the workspace's
+``SOUL.md``, ``IDENTITY.md``, ``ROLE.md`` and ``TOOLS.md`` plus the shared
+``employees/_shared/COMPANY_HANDBOOK.md`` and ``COMMUNICATION.md``.
+:class:`ContextBundler` assembles those into one bundle per employee,
+dropping paragraphs that an earlier part already contained, and estimates
+the token count of each part so oversized prompts can be found and
+trimmed.
+
+Bundles are stored content-addressed in ``.vwork/context/<key>.md``, where
+the key hashes the input digests, so employees with identical inputs share
+one file.  Inputs are re-hashed only when their ``(size, mtime_ns)``
+changes and a bundle is rebuilt only when an input's content changed; the
+bookkeeping lives in ``.vwork/context-index.json``.
+
+Usage::
+
+    bundler = ContextBundler(cfg)
+    for bundle in bundler.build_all():
+        print(bundle.employee, bundle.tokens, bundle.rebuilt)
+    bundler.save()
+
+    bundle = bundler.build("director-chen")
+    text = bundle.path.read_text()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .config import CompanyConfig
+from .state import atomic_write, load_json, save_json
+
+
+INDEX_FILENAME = "context-index.json"
+BUNDLE_DIRNAME = "context"
+
+# Bundle parts in order: the workspace files, then the shared documents.
+WORKSPACE_PARTS = ("SOUL.md", "IDENTITY.md", "ROLE.md", "TOOLS.md")
+SHARED_PARTS = ("COMPANY_HANDBOOK.md", "COMMUNICATION.md")
+
+# Bump when the bundle layout or the token estimate changes.
+_INDEX_FORMAT = 1
+
+# Paragraphs shorter than this are never treated as duplicates (headings,
+# separators and one-word lines legitimately repeat).
+_MIN_DEDUP_CHARS = 40
+
+# CJK ideographs, kana and hangul: roughly one token per character.
+_WIDE = re.compile(
+    "[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af"
+    "\uf900-\ufaff\uff00-\uffef]"
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the model tokens in *text* without a tokenizer.
+
+    About four characters per token for Latin text and one per character
+    for CJK; close enough to rank and budget prompts.
+    """
+    wide = len(_WIDE.findall(text))
+    narrow = len(text) - wide
+    return wide + (narrow + 3) // 4
+
+
+@dataclass(frozen=True, slots=True)
+class BundlePart:
+    """One input file's contribution to a bundle."""
+
+    name: str  # e.g. "ROLE.md" or "_shared/COMMUNICATION.md"
+    sha256: str
+    bytes: int
+    tokens: int  # after de-duplication
+    duplicate_tokens: int  # removed because an earlier part had them
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "name": self.name,
+            "sha256": self.sha256,
+            "bytes": self.bytes,
+            "tokens": self.tokens,
+            "duplicate_tokens": self.duplicate_tokens,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ContextBundle:
+    """An employee's assembled context."""
+
+    employee: str
+    key: str  # content hash of the inputs; names the bundle file
+    path: Path
+    parts: list[BundlePart] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)  # inputs not found
+    rebuilt: bool = False
+
+    @property
+    def tokens(self) -> int:
+        return sum(p.tokens for p in self.parts)
+
+    @property
+    def duplicate_tokens(self) -> int:
+        return sum(p.duplicate_tokens for p in self.parts)
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "employee": self.employee,
+            "key": self.key,
+            "path": str(self.path),
+            "tokens": self.tokens,
+            "duplicate_tokens": self.duplicate_tokens,
+            "parts": [p.to_dict() for p in self.parts],
+            "missing": self.missing,
+            "rebuilt": self.rebuilt,
+        }
+
+
+class ContextBundler:
+    """Build and cache per-employee context bundles."""
+
+    def __init__(self, config: CompanyConfig, path: Path | None = None) -> None:
+        self._cfg = config
+        self._path = path or config.paths.state / INDEX_FILENAME
+        self._dir = self._path.parent / BUNDLE_DIRNAME
+        raw = load_json(self._path, default={})
+        if not isinstance(raw, dict) or raw.get("format") != _INDEX_FORMAT:
+            raw = {}
+        # absolute path -> [size, mtime_ns, sha256]
+        self._inputs: dict[str, list] = raw.get("inputs", {})
+        # employee -> {"key": ..., "parts": [...], "missing": [...]}
+        self._bundles: dict[str, dict] = raw.get("bundles", {})
+        self.rebuilds = 0
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def build(self, employee_id: str) -> ContextBundle:
+        """Return *employee_id*'s bundle, rebuilding it only if stale."""
+        sources = self._sources(employee_id)
+        digests: dict[str, str] = {}
+        missing: list[str] = []
+        for name, path in sources:
+            digest = self._digest(path)
+            if digest is None:
+                missing.append(name)
+            else:
+                digests[name] = digest
+
+        key = hashlib.sha256(
+            "\n".join(f"{n}:{d}" for n, d in digests.items()).encode("utf-8")
+        ).hexdigest()[:32]
+        bundle_path = self._dir / f"{key}.md"
+        cached = self._bundles.get(employee_id)
+        if cached is not None and cached["key"] == key and bundle_path.exists():
+            return ContextBundle(
+                employee=employee_id,
+                key=key,
+                path=bundle_path,
+                parts=[BundlePart(**p) for p in cached["parts"]],
+                missing=cached["missing"],
+            )
+
+        texts = [
+            (name, path.read_text(encoding="utf-8", errors="replace"))
+            for name, path in sources
+            if name in digests
+        ]
+        body, parts = _assemble(key, texts, digests)
+        if not bundle_path.exists():
+            atomic_write(bundle_path, body.encode("utf-8"))
+        self._bundles[employee_id] = {
+            "key": key,
+            "parts": [p.to_dict() for p in parts],
+            "missing": missing,
+        }
+        self.rebuilds += 1
+        return ContextBundle(
+            employee=employee_id,
+            key=key,
+            path=bundle_path,
+            parts=parts,
+            missing=missing,
+            rebuilt=True,
+        )
+
+    def build_all(self, employee_ids: list[str] | None = None) -> list[ContextBundle]:
+        """Build bundles for several employees (all by default)."""
+        ids = list(self._cfg.employees) if employee_ids is None else employee_ids
+        return [self.build(eid) for eid in ids]
+
+    def save(self) -> None:
+        """Persist the index and delete bundle files no employee uses."""
+        self._bundles = {
+            eid: b for eid, b in self._bundles.items() if eid in self._cfg.employees
+        }
+        live = {b["key"] for b in self._bundles.values()}
+        save_json(
+            self._path,
+            {
+                "format": _INDEX_FORMAT,
+                "inputs": self._inputs,
+                "bundles": self._bundles,
+            },
+        )
+        try:
+            for entry in os.scandir(self._dir):
+                if entry.name.endswith(".md") and entry.name[:-3] not in live:
+                    os.unlink(entry.path)
+        except FileNotFoundError:
+            pass
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _sources(self, employee_id: str) -> list[tuple[str, Path]]:
+        workspace = self._cfg.employee_workspace(employee_id)
+        shared = self._cfg.paths.employees / "_shared"
+        return [(name, workspace / name) for name in WORKSPACE_PARTS] + [
+            (f"_shared/{name}", shared / name) for name in SHARED_PARTS
+        ]
+
+    def _digest(self, path: Path) -> str | None:
+        """Return the file's SHA-256, re-hashing only if its stat changed."""
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            self._inputs.pop(str(path), None)
+            return None
+        known = self._inputs.get(str(path))
+        if known is not None and known[:2] == [st.st_size, st.st_mtime_ns]:
+            return known[2]
+        with open(path, "rb") as fh:
+            digest = hashlib.file_digest(fh, "sha256").hexdigest()
+        self._inputs[str(path)] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+
+    # ------------------------------------------------------------------
+    # Dunder helpers
+    # ------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return (
+            f"ContextBundler(bundles={len(self._bundles)}, "
+            f"rebuilds={self.rebuilds})"
+        )
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _assemble(
+    key: str,
+    texts: list[tuple[str, str]],
+    digests: dict[str, str],
+) -> tuple[str, list[BundlePart]]:
+    """Join *texts* into one bundle, skipping already-seen paragraphs."""
+    seen: set[str] = set()
+    sections = [f"<!-- vwork context bundle {key} -->\n"]
+    parts: list[BundlePart] = []
+    for name, text in texts:
+        kept: list[str] = []
+        dropped = 0
+        for para in re.split(r"\n\s*\n", text.strip()):
+            normalized = " ".join(para.split())
+            if len(normalized) >= _MIN_DEDUP_CHARS:
+                if normalized in seen:
+                    dropped += estimate_tokens(para)
+                    continue
+                seen.add(normalized)
+            kept.append(para)
+        body = "\n\n".join(kept)
+        sections.append(f"<!-- part: {name} -->\n{body}\n")
+        parts.append(
+            BundlePart(
+                name=name,
+                sha256=digests[name],
+                bytes=len(text.encode("utf-8")),
+                tokens=estimate_tokens(body),
+                duplicate_tokens=dropped,
+            )
+        )
+    return "\n".join(sections), parts
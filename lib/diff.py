@@ -0,0 +1,259 @@
+"""Structural diff between two VWork config snapshots.
+
+Compares two :class:`CompanyConfig` objects field by field and derives the
+minimal re-provisioning work: which agents must be re-registered (their
+resolved model or workspace changed) and which workspace files must be
+re-rendered (a placeholder they use now renders differently).
+
+Usage::
+
+    old = ConfigSnapshot(baseline_path).config
+    new = CompanyConfig()
+
+    diff = diff_configs(old, new)
+    for eid, changes in diff.employees.changed.items():
+        print(eid, [c.field for c in changes])
+
+    plan = plan_sync(old, new, EmployeeManager(new), diff)
+    plan.register     # employee IDs to re-register
+    plan.rerender     # {employee_id: [template filenames]}
+
+    for eid, files in plan.rerender.items():
+        manager.rerender_files(eid, files, previous=plan.previous.get(eid))
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field, fields
+from typing import Any
+
+from .config import CompanyConfig
+from .employee import _TEMPLATE_FILES, EmployeeManager
+
+
+@dataclass(frozen=True, slots=True)
+class FieldChange:
+    """One changed field of a config entity."""
+
+    field: str
+    old: Any
+    new: Any
+
+
+@dataclass(slots=True)
+class SectionDiff:
+    """Added, removed and changed entity IDs within one config section."""
+
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    changed: dict[str, list[FieldChange]] = field(default_factory=dict)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    def changed_fields(self, entity_id: str) -> set[str]:
+        """Return the names of fields that changed for *entity_id*."""
+        return {c.field for c in self.changed.get(entity_id, [])}
+
+
+@dataclass(slots=True)
+class ConfigDiff:
+    """Structural differences between two config snapshots."""
+
+    employees: SectionDiff
+    roles: SectionDiff
+    divisions: SectionDiff
+    runtime: list[FieldChange]
+
+    @property
+    def is_empty(self) -> bool:
+        return (
+            self.employees.is_empty
+            and self.roles.is_empty
+            and self.divisions.is_empty
+            and not self.runtime
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable view (values rendered with ``str``)."""
+        def section(d: SectionDiff) -> dict[str, Any]:
+            return {
+                "added": d.added,
+                "removed": d.removed,
+                "changed": {
+                    eid: [
+                        {"field": c.field, "old": str(c.old), "new": str(c.new)}
+                        for c in changes
+                    ]
+                    for eid, changes in d.changed.items()
+                },
+            }
+
+        return {
+            "employees": section(self.employees),
+            "roles": section(self.roles),
+            "divisions": section(self.divisions),
+            "runtime": [
+                {"field": c.field, "old": str(c.old), "new": str(c.new)}
+                for c in self.runtime
+            ],
+        }
+
+
+@dataclass(slots=True)
+class SyncPlan:
+    """Minimal provisioning work implied by a :class:`ConfigDiff`."""
+
+    register: list[str] = field(default_factory=list)
+    rerender: dict[str, list[str]] = field(default_factory=dict)
+    removed: list[str] = field(default_factory=list)
+    # Placeholder values each re-rendered workspace was last rendered with.
+    previous: dict[str, dict[str, str]] = field(default_factory=dict)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.register or self.rerender)
+
+
+# ---------------------------------------------------------------------------
+# Diffing
+# ---------------------------------------------------------------------------
+
+
+def _field_changes(old: Any, new: Any) -> list[FieldChange]:
+    return [
+        FieldChange(f.name, getattr(old, f.name), getattr(new, f.name))
+        for f in fields(old)
+        if getattr(old, f.name) != getattr(new, f.name)
+    ]
+
+
+def _diff_section(old: Mapping[str, Any], new: Mapping[str, Any]) -> SectionDiff:
+    out = SectionDiff(
+        added=[k for k in new if k not in old],
+        removed=[k for k in old if k not in new],
+    )
+    for key, new_obj in new.items():
+        old_obj = old.get(key)
+        if old_obj is None or old_obj == new_obj:
+            continue
+        out.changed[key] = _field_changes(old_obj, new_obj)
+    return out
+
+
+def diff_configs(old: CompanyConfig, new: CompanyConfig) -> ConfigDiff:
+    """Compare two configs and list every added, removed and changed entity."""
+    return ConfigDiff(
+        employees=_diff_section(old.employees, new.employees),
+        roles=_diff_section(old.roles, new.roles),
+        divisions=_diff_section(old.divisions, new.divisions),
+        runtime=(
+            _field_changes(old.runtime, new.runtime)
+            if old.runtime != new.runtime
+            else []
+        ),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Sync planning
+# ---------------------------------------------------------------------------
+
+
+def _affected_employees(
+    old: CompanyConfig,
+    new: CompanyConfig,
+    diff: ConfigDiff,
+) -> set[str]:
+    """Return employees whose rendered state could depend on the diff."""
+    affected = set(diff.employees.added) | set(diff.employees.changed)
+    # Workspace files use no runtime setting; the only one an agent
+    # depends on is the default model, and only without a role model.
+    if any(c.field == "default_model" for c in diff.runtime):
+        for eid, emp in new.employees.items():
+            role = new.roles.get(emp.role)
+            if role is None or not role.model:
+                affected.add(eid)
+
+    roles = set(diff.roles.changed) | set(diff.roles.added) | set(diff.roles.removed)
+    divisions = (
+        set(diff.divisions.changed)
+        | set(diff.divisions.added)
+        | set(diff.divisions.removed)
+    )
+    # A director's name appears in every report's ROLE.md.
+    for div in new.divisions.values():
+        if div.director in diff.employees.changed:
+            divisions.add(div.id)
+    if roles or divisions:
+        affected.update(
+            eid for eid, emp in new.employees.items()
+            if emp.role in roles or emp.division in divisions
+        )
+    return affected
+
+
+def _safe_replacements(
+    mgr: EmployeeManager,
+    employee_id: str,
+    cfg: CompanyConfig,
+) -> dict[str, str] | None:
+    try:
+        return mgr.render_replacements(employee_id, cfg)
+    except KeyError:
+        # Employee, role or division missing in this snapshot
+        return None
+
+
+def plan_sync(
+    old: CompanyConfig,
+    new: CompanyConfig,
+    manager: EmployeeManager,
+    diff: ConfigDiff | None = None,
+    *,
+    template_files: Iterable[str] = _TEMPLATE_FILES,
+) -> SyncPlan:
+    """Work out which agents to re-register and which files to re-render.
+
+    Only employees touched by the diff (directly, or through their role,
+    division or director) are examined, so the cost is proportional to the
+    size of the change rather than to headcount.  *manager* must be bound
+    to *new*.
+    """
+    if diff is None:
+        diff = diff_configs(old, new)
+
+    plan = SyncPlan(removed=list(diff.employees.removed))
+    keys_by_file = {name: manager.template_keys(name) for name in template_files}
+
+    for eid in sorted(_affected_employees(old, new, diff)):
+        if eid not in old.employees:
+            plan.register.append(eid)
+            continue
+
+        if (
+            old.employee_model(eid) != new.employee_model(eid)
+            or old.employee_workspace(eid) != new.employee_workspace(eid)
+        ):
+            plan.register.append(eid)
+
+        before = _safe_replacements(manager, eid, old)
+        after = _safe_replacements(manager, eid, new)
+        if after is None:
+            continue
+        if before is None:
+            changed_keys = set(after)
+        else:
+            changed_keys = {k for k, v in after.items() if before.get(k) != v}
+        files = [
+            name for name, keys in keys_by_file.items()
+            if keys & changed_keys
+        ]
+        if files:
+            plan.rerender[eid] = files
+            if before is not None:
+                plan.previous[eid] = before
+
+    return plan
@@ -0,0 +1,265 @@
+"""Dispatch ready tasks to idle agents in priority order.
+
+An employee is *busy* while one of their active tasks is started; tasks
+from boards older than the ``started`` field count as started, so their
+assignees are not sent more work on the first pass after upgrading.  Each
+pass picks one ready task per idle employee -- a task on the critical path
+of the dependency graph (see :mod:`lib.plan`) if they have one, otherwise
+the head of their ready queue (see :mod:`lib.ready`) -- and serves those
+candidates critical-path first, then most urgent first, while fewer than
+``runtime.max_concurrent_agents`` agents are busy, sends each task through
+:class:`~lib.openclaw.OpenClawGateway`, and, once the message went out,
+starts it under a lease (see :mod:`lib.lease`).  A task whose message
+fails stays ready for the next pass; one that left the board while its
+message was being sent is not leased.
+
+:meth:`Dispatcher.tick` first sweeps expired leases, so a task whose
+agent died is put back in the queue and sent again in the same pass.
+
+Usage::
+
+    dispatcher = Dispatcher(cfg)
+    report = dispatcher.tick()           # sweep leases, then dispatch
+    for d in report.dispatched:
+        print(d.task.id, "->", d.task.assignee, d.ok)
+
+    dispatcher.run(interval=60)          # daemon
+    dispatcher.plan()                    # what the next pass would send
+"""
+
+from __future__ import annotations
+
+import heapq
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from .config import CompanyConfig
+from .lease import Expiry, LeaseManager
+from .openclaw import CommandResult, OpenClawGateway
+from .orchestrator import Orchestrator, Task
+from .plan import ProjectPlanner
+from .ready import ReadyQueues, priority_key
+
+
+@dataclass(frozen=True, slots=True)
+class Dispatch:
+    """One task sent to its assignee."""
+
+    task: Task
+    result: CommandResult | None = None  # None for a dry run
+
+    @property
+    def ok(self) -> bool:
+        return self.result is not None and self.result.ok
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "task": self.task.id,
+            "title": self.task.title,
+            "assignee": self.task.assignee,
+            "priority": self.task.priority_name,
+            "sent": None if self.result is None else self.result.ok,
+        }
+
+
+@dataclass(slots=True)
+class DispatchReport:
+    """The outcome of one dispatcher tick."""
+
+    expired: list[Expiry] = field(default_factory=list)
+    dispatched: list[Dispatch] = field(default_factory=list)
+    dry_run: bool = False
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "dry_run": self.dry_run,
+            "expired": [e.to_dict() for e in self.expired],
+            "dispatched": [d.to_dict() for d in self.dispatched],
+        }
+
+
+class Dispatcher:
+    """Start the most urgent ready task of each idle employee.
+
+    *max_active* caps how many agents may be busy at once; it defaults to
+    ``runtime.max_concurrent_agents`` (0 = no cap).
+    """
+
+    def __init__(
+        self,
+        config: CompanyConfig,
+        *,
+        gateway: OpenClawGateway | None = None,
+        leases: LeaseManager | None = None,
+        max_active: int | None = None,
+        aging_hours: float | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        rt = config.runtime
+        self._cfg = config
+        self._orch = Orchestrator(config)
+        self._gateway = gateway
+        self.leases = leases or LeaseManager(config, orchestrator=self._orch)
+        self._planner = ProjectPlanner(config)
+        self._sleep = sleep
+        self.max_active = (
+            rt.max_concurrent_agents if max_active is None else max_active
+        )
+        self.aging_hours = (
+            rt.priority_aging_hours if aging_hours is None else aging_hours
+        )
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def plan(self, division_ids: list[str] | None = None) -> list[Task]:
+        """Return the tasks the next pass would dispatch, in dispatch order."""
+        tasks = self._orch.list_tasks()
+        busy = {t.assignee for t in tasks if t.status == "active" and t.started}
+        open_ids = {t.id for t in tasks}
+        critical = self._critical(tasks)
+        if division_ids is not None:
+            tasks = [t for t in tasks if t.division in division_ids]
+        queues = ReadyQueues.from_tasks(tasks, self.aging_hours, open_ids=open_ids)
+
+        # Each idle employee's most urgent ready task on the critical path.
+        on_path: dict[str, Task] = {}
+        for task in tasks:
+            if task.id in critical and task.id in queues:
+                best = on_path.get(task.assignee)
+                if best is None or self._key(task) < self._key(best):
+                    on_path[task.assignee] = task
+
+        # One candidate per idle, active employee.
+        heads: list[tuple[tuple[bool, tuple[float, str]], Task]] = []
+        for eid in queues.assignees():
+            emp = self._cfg.employees.get(eid)
+            if eid in busy or emp is None or emp.status != "active":
+                continue
+            task = on_path.get(eid) or queues.peek(assignee=eid)
+            if task is not None:
+                heads.append(((task.id not in critical, self._key(task)), task))
+        heapq.heapify(heads)
+
+        slots = len(heads)
+        if self.max_active > 0:
+            slots = min(slots, max(0, self.max_active - len(busy)))
+        return [heapq.heappop(heads)[1] for _ in range(slots)]
+
+    def dispatch_once(
+        self,
+        division_ids: list[str] | None = None,
+        *,
+        dry_run: bool = False,
+    ) -> list[Dispatch]:
+        """Send the planned tasks and lease the delivered ones."""
+        planned = self.plan(division_ids)
+        if dry_run:
+            return [Dispatch(task) for task in planned]
+
+        gateway = self._gateway
+        if gateway is None:
+            gateway = self._gateway = OpenClawGateway(self._cfg)
+        sent: list[Dispatch] = []
+        for task in planned:
+            lease = self.leases.duration(task.assignee)
+            result = gateway.send_message(
+                task.assignee, task_message(task, lease), task=task
+            )
+            if result.ok:
+                try:
+                    task = self.leases.grant(task.id)
+                except KeyError:
+                    pass  # completed or removed while the message was sent
+            sent.append(Dispatch(task, result))
+        return sent
+
+    def tick(
+        self,
+        division_ids: list[str] | None = None,
+        *,
+        dry_run: bool = False,
+    ) -> DispatchReport:
+        """Expire overdue leases, then dispatch one pass."""
+        expired = self.leases.sweep(division_ids, dry_run=dry_run)
+        return DispatchReport(
+            expired=expired,
+            dispatched=self.dispatch_once(division_ids, dry_run=dry_run),
+            dry_run=dry_run,
+        )
+
+    def run(
+        self,
+        *,
+        interval: float = 60.0,
+        iterations: int | None = None,
+        division_ids: list[str] | None = None,
+        on_report: Callable[[DispatchReport], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> None:
+        """Tick every *interval* seconds until interrupted.
+
+        With *on_error*, a tick that raises is reported to it and the loop
+        carries on with the next tick; without it the error propagates.
+        """
+        rounds = 0
+        while iterations is None or rounds < iterations:
+            try:
+                report = self.tick(division_ids)
+            except Exception as exc:
+                if on_error is None:
+                    raise
+                on_error(exc)
+            else:
+                if (report.expired or report.dispatched) and on_report is not None:
+                    on_report(report)
+            rounds += 1
+            if iterations is None or rounds < iterations:
+                self._sleep(interval)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _key(self, task: Task) -> tuple[float, str]:
+        return priority_key(task, self.aging_hours)
+
+    def _critical(self, tasks: list[Task]) -> set[str]:
+        """IDs of zero-slack tasks; empty if the graph has a cycle."""
+        if not any(t.depends_on for t in tasks):
+            return set()
+        try:
+            plan = self._planner.plan(tasks)
+        except ValueError:
+            return set()
+        return {tid for tid, s in plan.tasks.items() if s.critical}
+
+    # ------------------------------------------------------------------
+    # Dunder helpers
+    # ------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return (
+            f"Dispatcher(max_active={self.max_active}, "
+            f"aging_hours={self.aging_hours:g})"
+        )
+
+
+def task_message(task: Task, lease: float | None = None) -> str:
+    """Return the OpenClaw message that hands *task* to its assignee.
+
+    *lease* is the lease length in seconds, if the task is leased.
+    """
+    message = (
+        f"Start this task now ({task.priority_name} priority): {task.title}\n\n"
+        f"ID: {task.id}\n"
+        f"Description: {task.description}\n\n"
+    )
+    if lease is None:
+        return message + "Please update your HEARTBEAT.md as you work."
+    return message + (
+        f"Update your HEARTBEAT.md (or run `vwork task renew {task.id}`) at "
+        f"least every {lease / 60:.0f} min, or the task will be handed out again."
+    )
@@ -10,6 +10,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from .config import CompanyConfig, DivisionConfig, EmployeeConfig, ProjectRef
+from .heartbeat import HeartbeatCache, HeartbeatSummary, shared_cache
 
 
 @dataclass(slots=True)
@@ -41,10 +42,21 @@ class DivisionManager:
 
         status = dm.get_status("content-studio")
         print(status.heartbeat)
+
+    Heartbeat files are read through a :class:`HeartbeatCache` (the shared
+    process-wide one by default), so unchanged files are only ``stat``-ed.
     """
 
-    def __init__(self, config: CompanyConfig) -> None:
+    def __init__(
+        self,
+        config: CompanyConfig,
+        *,
+        heartbeat_cache: HeartbeatCache | None = None,
+    ) -> None:
         self._cfg = config
+        self._heartbeats = (
+            heartbeat_cache if heartbeat_cache is not None else shared_cache()
+        )
 
     # ------------------------------------------------------------------
     # Queries
@@ -76,14 +88,43 @@ class DivisionManager:
 
     def get_heartbeat(self, division_id: str) -> str:
         """Read and return the raw HEARTBEAT.md content (or a default)."""
-        heartbeat_path = self._heartbeat_path(division_id)
-        if heartbeat_path.exists():
-            return heartbeat_path.read_text(encoding="utf-8")
+        hb = self._heartbeats.read(self.heartbeat_path(division_id))
+        if hb is not None:
+            return hb.text
         return f"No HEARTBEAT.md found for division '{division_id}'."
 
+    def get_heartbeat_summary(
+        self,
+        division_id: str,
+        *,
+        max_lines: int | None = None,
+        max_chars: int | None = None,
+    ) -> HeartbeatSummary:
+        """Return the start of HEARTBEAT.md within the given limits.
+
+        Only the bytes needed for *max_lines* / *max_chars* are read, so the
+        cost does not grow with the size of the file.
+        """
+        summary = self._heartbeats.summary(
+            self.heartbeat_path(division_id),
+            max_lines=max_lines,
+            max_chars=max_chars,
+        )
+        if summary is not None:
+            return summary
+        return HeartbeatSummary(
+            text=f"No HEARTBEAT.md found for division '{division_id}'.",
+            truncated=False,
+            exists=False,
+        )
+
+    def heartbeat_path(self, division_id: str) -> Path:
+        """Return where the division's HEARTBEAT.md lives (it may not exist)."""
+        return self._division_abs_path(division_id) / "HEARTBEAT.md"
+
     def has_heartbeat(self, division_id: str) -> bool:
         """Return whether a HEARTBEAT.md file exists for the division."""
-        return self._heartbeat_path(division_id).exists()
+        return self._heartbeats.exists(self.heartbeat_path(division_id))
 
     def get_director(self, division_id: str) -> EmployeeConfig | None:
         """Return the director employee config, or ``None`` if unset."""
@@ -102,17 +143,14 @@ class DivisionManager:
     def _division_abs_path(self, division_id: str) -> Path:
         return self._cfg.division_path(division_id)
 
-    def _heartbeat_path(self, division_id: str) -> Path:
-        return self._division_abs_path(division_id) / "HEARTBEAT.md"
-
     def _build_status(self, division_id: str) -> DivisionStatus:
         div = self._cfg.division(division_id)
         employees = self._cfg.employees_in_division(division_id)
-        hb_path = self._heartbeat_path(division_id)
-        hb_exists = hb_path.exists()
+        hb = self._heartbeats.read(self.heartbeat_path(division_id))
+        hb_exists = hb is not None
         heartbeat = (
-            hb_path.read_text(encoding="utf-8")
-            if hb_exists
+            hb.text
+            if hb is not None
             else f"No HEARTBEAT.md for '{division_id}'."
         )
         return DivisionStatus(
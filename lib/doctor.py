@@ -0,0 +1,262 @@
+"""Workspace integrity checks against the employee templates.
+
+For every employee, each file rendered from ``employees/_template/`` must
+exist, must not contain unfilled placeholders, and its config-managed
+lines and sections must still carry the values from ``org/``:
+
+* a line such as ``- **Role:** [role title]`` in the template must still
+  start the same way and mention the role title;
+* a section such as ``## Division`` whose body is a placeholder must still
+  exist and mention the division name.
+
+Everything else in a workspace file belongs to the agent and is ignored.
+
+File hashes come from :class:`~lib.workspace.WorkspaceIndex` (parallel,
+cached by ``(size, mtime_ns)``) and verdicts are cached in
+``.vwork/doctor.json`` by file hash and expected values, so a re-check of
+an unchanged fleet reads no workspace file at all.  :meth:`WorkspaceDoctor.fix`
+re-renders missing files; in the others it rewrites only the drifted value
+lines (agent notes in the same section are kept) and inserts missing
+lines and sections at their template position.
+
+Usage::
+
+    doctor = WorkspaceDoctor(cfg)
+    problems = [c for c in doctor.check() if not c.ok]
+    doctor.fix(problems)
+    doctor.save()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+
+from .config import CompanyConfig
+from .employee import EmployeeManager
+from .state import load_json, save_json
+from .templates import (
+    Anchor,
+    CompiledTemplate,
+    anchor_span,
+    template_anchors,
+    update_anchors,
+)
+from .workspace import WorkspaceIndex
+
+
+STATE_FILENAME = "doctor.json"
+
+# Bump when the checks change; cached verdicts are discarded.
+_STATE_FORMAT = 1
+
+# Placeholders whose values come from org/*.yaml and must not drift.
+CHECKED_KEYS = (
+    "{employee_name}",
+    "{role_title}",
+    "{division_name}",
+    "{manager_name}",
+    "{agent_id}",
+)
+
+STATUSES = ("ok", "missing", "unrendered", "drift", "error")
+
+
+@dataclass(frozen=True, slots=True)
+class FileCheck:
+    """The verdict for one template file in one workspace."""
+
+    employee: str
+    file: str
+    status: str  # one of STATUSES
+    problems: list[str] = field(default_factory=list)
+    fixed: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "employee": self.employee,
+            "file": self.file,
+            "status": self.status,
+            "problems": self.problems,
+            "fixed": self.fixed,
+        }
+
+
+class WorkspaceDoctor:
+    """Check (and repair) employee workspaces against their templates."""
+
+    def __init__(
+        self,
+        config: CompanyConfig,
+        *,
+        index: WorkspaceIndex | None = None,
+        max_workers: int = 8,
+    ) -> None:
+        self._cfg = config
+        self._mgr = EmployeeManager(config)
+        self._index = index if index is not None else WorkspaceIndex(config)
+        self.max_workers = max_workers
+        self._path = config.paths.state / STATE_FILENAME
+        raw = load_json(self._path, default={})
+        results = raw.get("results") if isinstance(raw, dict) else None
+        if not isinstance(results, dict) or raw.get("format") != _STATE_FORMAT:
+            results = {}
+        # employee -> file -> [sha256, expectation key, status, problems]
+        self._results: dict[str, dict[str, list]] = results
+        self._templates: dict[str, CompiledTemplate] = {}
+        self._anchors: dict[str, list[Anchor]] = {}
+        self.reads = 0  # workspace files read by the last check
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def check(self, employee_ids: list[str] | None = None) -> list[FileCheck]:
+        """Return one :class:`FileCheck` per template file per employee."""
+        self._templates = self._mgr.templates()
+        self._anchors = {
+            name: template_anchors(tpl, CHECKED_KEYS)
+            for name, tpl in self._templates.items()
+        }
+        self._index.scan(employee_ids, max_workers=self.max_workers)
+        ids = list(self._cfg.employees) if employee_ids is None else employee_ids
+        self.reads = 0
+        workers = max(1, min(self.max_workers, len(ids)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            per_employee = list(pool.map(self._check_employee, ids))
+        return [check for checks in per_employee for check in checks]
+
+    def fix(self, checks: list[FileCheck]) -> list[FileCheck]:
+        """Repair the broken files among *checks*; return their new verdicts.
+
+        Missing files are rendered from the template.  Other files keep
+        their content: unfilled placeholders are filled and only drifted
+        lines and sections are replaced with their rendered form.
+        Config errors (e.g. an unknown role) cannot be fixed here.
+        """
+        if not self._templates:
+            self._templates = self._mgr.templates()
+            self._anchors = {
+                name: template_anchors(tpl, CHECKED_KEYS)
+                for name, tpl in self._templates.items()
+            }
+        out: list[FileCheck] = []
+        for check in checks:
+            if check.ok or check.status == "error":
+                out.append(check)
+                continue
+            eid, name = check.employee, check.file
+            values = self._mgr.render_replacements(eid)
+            workspace = self._cfg.employee_workspace(eid)
+            if check.status == "missing":
+                (workspace / "memory").mkdir(parents=True, exist_ok=True)
+                self._mgr.rerender_files(eid, [name])
+            else:
+                path = workspace / name
+                text = path.read_text(encoding="utf-8")
+                patched = update_anchors(
+                    self._mgr.compile_text(text).render(values),
+                    self._templates[name].render(values),
+                    self._anchors[name],
+                    values,
+                )
+                path.write_text(patched, encoding="utf-8")
+            self._index.scan([eid], max_workers=self.max_workers)
+            verdict = self._check_file(eid, name, values)
+            out.append(replace(verdict, fixed=verdict.ok))
+        return out
+
+    def save(self) -> None:
+        """Persist cached verdicts and the workspace index."""
+        self._index.save()
+        save_json(self._path, {"format": _STATE_FORMAT, "results": self._results})
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _check_employee(self, employee_id: str) -> list[FileCheck]:
+        try:
+            values = self._mgr.render_replacements(employee_id)
+        except KeyError as exc:
+            problem = f"cannot render templates: unknown {exc.args[0]!r} in org config"
+            return [FileCheck(employee_id, "*", "error", [problem])]
+        return [
+            self._check_file(employee_id, name, values) for name in self._templates
+        ]
+
+    def _check_file(
+        self,
+        employee_id: str,
+        name: str,
+        values: dict[str, str],
+    ) -> FileCheck:
+        record = self._index.get(employee_id, name)
+        if record is None:
+            return FileCheck(employee_id, name, "missing", [f"{name} is missing"])
+
+        template = self._templates[name]
+        expect = hashlib.sha256(
+            "\0".join(
+                [template.digest, *(values.get(k, "") for k in CHECKED_KEYS)]
+            ).encode("utf-8")
+        ).hexdigest()[:16]
+        cached = self._results.get(employee_id, {}).get(name)
+        if cached is not None and cached[:2] == [record.sha256, expect]:
+            return FileCheck(employee_id, name, cached[2], list(cached[3]))
+
+        path = self._cfg.employee_workspace(employee_id) / name
+        try:
+            text = path.read_text(encoding="utf-8", errors="replace")
+        except FileNotFoundError:
+            return FileCheck(employee_id, name, "missing", [f"{name} is missing"])
+        with self._lock:
+            self.reads += 1
+
+        problems: list[str] = []
+        leftover = sorted(set(self._mgr.compile_text(text).slots))
+        if leftover:
+            problems.append(f"unfilled placeholders: {', '.join(leftover)}")
+        lines = text.splitlines()
+        for anchor in self._anchors[name]:
+            value = values.get(anchor.key, "")
+            region = _region(lines, anchor)
+            if region is None:
+                problems.append(f"'{anchor.marker}' is missing (expected '{value}')")
+            elif value and value not in region:
+                problems.append(f"'{anchor.marker}' should mention '{value}'")
+
+        status = "unrendered" if leftover else "drift" if problems else "ok"
+        self._results.setdefault(employee_id, {})[name] = [
+            record.sha256, expect, status, problems,
+        ]
+        return FileCheck(employee_id, name, status, problems)
+
+    # ------------------------------------------------------------------
+    # Dunder helpers
+    # ------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return (
+            f"WorkspaceDoctor(templates={len(self._templates)}, "
+            f"cached={sum(len(v) for v in self._results.values())})"
+        )
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _region(lines: list[str], anchor: Anchor) -> str | None:
+    span = anchor_span(lines, anchor)
+    if span is None:
+        return None
+    return "\n".join(lines[span[0]:span[1]])
@@ -7,13 +7,25 @@ Handles listing, querying, and provisioning employee workspaces from the
 from __future__ import annotations
 
 import shutil
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import yaml
 
 from .config import CompanyConfig, EmployeeConfig, RoleConfig
+from .templates import (
+    CompiledTemplate,
+    TemplateCompiler,
+    template_anchors,
+    update_anchors,
+)
+
+if TYPE_CHECKING:
+    from .memory import MemoryHit
 
 
 # Template placeholder tokens (as they appear in the _template/ files).
@@ -38,6 +50,9 @@ _PLACEHOLDERS: dict[str, str] = {
 # Template files that get copied into every new employee workspace
 _TEMPLATE_FILES = ("AGENTS.md", "SOUL.md", "IDENTITY.md", "ROLE.md", "TOOLS.md")
 
+# Shared across managers: templates are compiled once per content hash.
+_COMPILER = TemplateCompiler(_PLACEHOLDERS)
+
 
 @dataclass(slots=True)
 class EmployeeSummary:
@@ -52,6 +67,45 @@ class EmployeeSummary:
     workspace: Path
 
 
+@dataclass(slots=True)
+class EmployeeSpec:
+    """Everything needed to hire one employee (e.g. a manifest entry)."""
+
+    id: str
+    name: str
+    role: str
+    division: str
+    name_cn: str = ""
+    emoji: str = ""
+    agent_id: str | None = None
+    current_focus: str = "Onboarding -- getting up to speed"
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: dict[str, Any],
+        defaults: dict[str, Any] | None = None,
+    ) -> EmployeeSpec:
+        merged = {**(defaults or {}), **data}
+        missing = [k for k in ("id", "name", "role", "division") if not merged.get(k)]
+        if missing:
+            raise ValueError(
+                f"Manifest entry {data!r} is missing {', '.join(missing)}"
+            )
+        return cls(
+            id=str(merged["id"]),
+            name=str(merged["name"]),
+            role=str(merged["role"]),
+            division=str(merged["division"]),
+            name_cn=str(merged.get("name_cn", "")),
+            emoji=str(merged.get("emoji", "")),
+            agent_id=merged.get("agent_id"),
+            current_focus=str(
+                merged.get("current_focus", "Onboarding -- getting up to speed")
+            ),
+        )
+
+
 class EmployeeManager:
     """High-level operations on VWork employees.
 
@@ -65,6 +119,8 @@ class EmployeeManager:
 
         mgr.create_employee("sound-designer-echo", division="content-studio",
                             role="sound-designer", name="Echo", ...)
+
+        mgr.create_employees(load_manifest(Path("staff.yaml")))
     """
 
     def __init__(self, config: CompanyConfig) -> None:
@@ -113,6 +169,37 @@ class EmployeeManager:
         emp = self._cfg.employee(employee_id)
         return self._cfg.role(emp.role)
 
+    def search_memory(
+        self,
+        query: str,
+        employee: str | None = None,
+        division: str | None = None,
+        *,
+        limit: int = 20,
+    ) -> list[MemoryHit]:
+        """Full-text search the ``memory/`` files of one or more employees.
+
+        The memory index is refreshed for the searched workspaces first
+        (only changed files are re-read).  Raises ``KeyError`` for an
+        unknown *employee* or *division*.
+        """
+        from .memory import MemoryIndex
+
+        if employee is not None:
+            emp = self._cfg.employee(employee)
+            if division is not None and emp.division != division:
+                return []
+            ids: list[str] | None = [employee]
+        elif division is not None:
+            self._cfg.division(division)
+            ids = [s.id for s in self.list_employees(division=division)]
+        else:
+            ids = None
+
+        with MemoryIndex(self._cfg) as index:
+            index.refresh(ids)
+            return index.search(query, employees=ids, limit=limit)
+
     # ------------------------------------------------------------------
     # Creation
     # ------------------------------------------------------------------
@@ -154,10 +241,264 @@ class EmployeeManager:
         if workspace.exists():
             raise FileExistsError(f"Workspace already exists: {workspace}")
 
+        replacements = self._build_replacements(
+            self._cfg,
+            employee_id=employee_id,
+            name=name,
+            role=role,
+            division=division,
+            emoji=emoji,
+            agent_id=agent_id,
+            current_focus=current_focus,
+        )
+
+        # 1. Create workspace
+        workspace.mkdir(parents=True)
+        (workspace / "memory").mkdir()
+
+        # 2. Copy and fill templates
+        self._write_templates(workspace, _TEMPLATE_FILES, replacements)
+
+        # 3. Register in employees.yaml
+        rel_path = f"{div_cfg.path}/employees/{employee_id}"
+        self._register_employee(
+            employee_id=employee_id,
+            name=name,
+            name_cn=name_cn,
+            agent_id=agent_id,
+            role=role,
+            division=division,
+            path=rel_path,
+            emoji=emoji,
+        )
+
+        # Reload config so the new employee is immediately visible
+        self._cfg = CompanyConfig(self._cfg.root)
+
+        return workspace
+
+    def create_employees(
+        self,
+        specs: Sequence[EmployeeSpec],
+        *,
+        max_workers: int = 8,
+    ) -> dict[str, Path]:
+        """Provision a batch of employees with one registry write.
+
+        The whole batch is validated before anything touches the disk, and
+        every problem is reported together in a single ``ValueError``.
+        Workspaces are then provisioned in parallel, ``org/employees.yaml``
+        is written once and the config is reloaded once.  If provisioning
+        fails part-way, the workspaces created by this call are removed and
+        the registry is left untouched.
+
+        Returns ``{employee_id: workspace}`` in manifest order.
+        """
+        planned = self._plan_batch(specs)
+
+        def provision(item: tuple[EmployeeSpec, Path, dict[str, str]]) -> None:
+            spec, workspace, replacements = item
+            workspace.mkdir(parents=True)
+            (workspace / "memory").mkdir()
+            self._write_templates(workspace, _TEMPLATE_FILES, replacements)
+
+        workers = max(1, min(max_workers, len(planned)))
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # list() re-raises the first provisioning error
+                list(pool.map(provision, planned))
+        except BaseException:
+            for _spec, workspace, _replacements in planned:
+                shutil.rmtree(workspace, ignore_errors=True)
+            raise
+
+        entries: dict[str, dict[str, str]] = {}
+        for spec, _workspace, replacements in planned:
+            div_cfg = self._cfg.division(spec.division)
+            entries[spec.id] = {
+                "name": spec.name,
+                "name_cn": spec.name_cn,
+                "agent_id": replacements["{agent_id}"],
+                "role": spec.role,
+                "division": spec.division,
+                "path": f"{div_cfg.path}/employees/{spec.id}",
+                "emoji": spec.emoji,
+                "status": "active",
+            }
+        self._register_employees(entries)
+
+        # Reload config once so the whole batch is immediately visible
+        self._cfg = CompanyConfig(self._cfg.root)
+
+        return {spec.id: workspace for spec, workspace, _ in planned}
+
+    # ------------------------------------------------------------------
+    # Re-rendering
+    # ------------------------------------------------------------------
+
+    def render_replacements(
+        self,
+        employee_id: str,
+        config: CompanyConfig | None = None,
+    ) -> dict[str, str]:
+        """Return the placeholder values for an existing employee.
+
+        *config* defaults to the manager's own config; passing another
+        snapshot lets callers compare what a workspace would render to
+        before and after a config change.
+        """
+        cfg = config or self._cfg
+        emp = cfg.employee(employee_id)
+        return self._build_replacements(
+            cfg,
+            employee_id=employee_id,
+            name=emp.name,
+            role=emp.role,
+            division=emp.division,
+            emoji=emp.emoji,
+            agent_id=emp.agent_id,
+        )
+
+    def template_keys(self, filename: str) -> frozenset[str]:
+        """Return the format keys (e.g. ``{role_title}``) used by a template."""
+        src = self._template_dir / filename
+        if not src.exists():
+            return frozenset()
+        return _COMPILER.load(src).keys
+
+    def templates(self) -> dict[str, CompiledTemplate]:
+        """Return the compiled workspace templates that exist, by filename."""
+        out: dict[str, CompiledTemplate] = {}
+        for filename in _TEMPLATE_FILES:
+            try:
+                out[filename] = _COMPILER.load(self._template_dir / filename)
+            except FileNotFoundError:
+                continue
+        return out
+
+    def compile_text(self, text: str) -> CompiledTemplate:
+        """Compile *text* with the template placeholder vocabulary.
+
+        Applied to a workspace file, the slots are placeholders that were
+        never filled in.
+        """
+        return _COMPILER.compile(text)
+
+    def rerender_files(
+        self,
+        employee_id: str,
+        filenames: Iterable[str],
+        *,
+        previous: Mapping[str, str] | None = None,
+    ) -> list[Path]:
+        """Bring selected template files of an existing workspace up to date.
+
+        A missing file is rendered from its template.  An existing one is
+        patched in place: only the lines and sections whose placeholder
+        value differs from *previous* (the values it was rendered with) are
+        rewritten, so the rest -- the agent's current focus, its notes --
+        is carried over.  ``memory/`` and any other workspace content are
+        left alone.  Returns the paths written.
+        """
+        workspace = self._cfg.employee_workspace(employee_id)
+        if not workspace.is_dir():
+            raise FileNotFoundError(f"Workspace does not exist: {workspace}")
+        replacements = self.render_replacements(employee_id)
+        written: list[Path] = []
+        for filename in filenames:
+            try:
+                template = _COMPILER.load(self._template_dir / filename)
+            except FileNotFoundError:
+                continue
+            dest = workspace / filename
+            text = template.render(replacements)
+            if dest.exists():
+                current = dest.read_text(encoding="utf-8")
+                text = update_anchors(
+                    current,
+                    text,
+                    template_anchors(template),
+                    replacements,
+                    previous=previous,
+                )
+                if text == current:
+                    continue
+            dest.write_text(text, encoding="utf-8")
+            written.append(dest)
+        return written
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _plan_batch(
+        self,
+        specs: Sequence[EmployeeSpec],
+    ) -> list[tuple[EmployeeSpec, Path, dict[str, str]]]:
+        """Validate a hiring batch and resolve each workspace and fill map."""
+        errors: list[str] = []
+        planned: list[tuple[EmployeeSpec, Path, dict[str, str]]] = []
+        seen: set[str] = set()
+
+        for spec in specs:
+            if spec.id in seen:
+                errors.append(f"'{spec.id}': listed more than once")
+                continue
+            seen.add(spec.id)
+            if spec.id in self._cfg.employees:
+                errors.append(f"'{spec.id}': employee already exists")
+                continue
+            if spec.division not in self._cfg.divisions:
+                errors.append(f"'{spec.id}': unknown division '{spec.division}'")
+                continue
+            if spec.role not in self._cfg.roles:
+                errors.append(f"'{spec.id}': unknown role '{spec.role}'")
+                continue
+
+            div_cfg = self._cfg.division(spec.division)
+            workspace = self._cfg.root / div_cfg.path / "employees" / spec.id
+            if workspace.exists():
+                errors.append(f"'{spec.id}': workspace already exists: {workspace}")
+                continue
+
+            replacements = self._build_replacements(
+                self._cfg,
+                employee_id=spec.id,
+                name=spec.name,
+                role=spec.role,
+                division=spec.division,
+                emoji=spec.emoji,
+                agent_id=spec.agent_id or f"vwork-{spec.id}",
+                current_focus=spec.current_focus,
+            )
+            planned.append((spec, workspace, replacements))
+
+        if errors:
+            raise ValueError(
+                "Invalid hiring batch:\n" + "\n".join(f"  - {e}" for e in errors)
+            )
+        return planned
+
+    @classmethod
+    def _build_replacements(
+        cls,
+        cfg: CompanyConfig,
+        *,
+        employee_id: str,
+        name: str,
+        role: str,
+        division: str,
+        emoji: str,
+        agent_id: str,
+        current_focus: str = "Onboarding -- getting up to speed",
+    ) -> dict[str, str]:
+        """Build the format-key -> value map used to fill the templates."""
+        div_cfg = cfg.division(division)
+        role_cfg = cfg.role(role)
+
         # Determine the director / manager for this employee
-        manager_name = self._resolve_manager(employee_id, div_cfg.director)
+        manager_name = cls._resolve_manager(cfg, employee_id, div_cfg.director)
 
-        # Build the replacement map
         responsibilities = "\n".join(
             f"- {r}" for r in role_cfg.responsibilities
         ) if role_cfg.responsibilities else "- (to be defined)"
@@ -170,7 +511,7 @@ class EmployeeManager:
             f"- `{p.source}` ({p.name})" for p in div_cfg.projects
         ) if div_cfg.projects else "- (none)"
 
-        replacements: dict[str, str] = {
+        return {
             "{employee_name}": name,
             "{role_title}": role_cfg.title,
             "{division_name}": div_cfg.name,
@@ -185,47 +526,36 @@ class EmployeeManager:
             "{env_notes}": f"- Division: {div_cfg.name}\n- Role: {role_cfg.title}",
         }
 
-        # 1. Create workspace
-        workspace.mkdir(parents=True)
-        (workspace / "memory").mkdir()
-
-        # 2. Copy and fill templates
-        for filename in _TEMPLATE_FILES:
+    def _write_templates(
+        self,
+        workspace: Path,
+        filenames: Iterable[str],
+        replacements: dict[str, str],
+    ) -> list[Path]:
+        """Fill each template in *filenames* and write it into *workspace*."""
+        written: list[Path] = []
+        for filename in filenames:
             src = self._template_dir / filename
-            if not src.exists():
+            try:
+                template = _COMPILER.load(src)
+            except FileNotFoundError:
                 continue
-            content = src.read_text(encoding="utf-8")
-            content = self._apply_placeholders(content, replacements)
-            (workspace / filename).write_text(content, encoding="utf-8")
-
-        # 3. Register in employees.yaml
-        rel_path = f"{div_cfg.path}/employees/{employee_id}"
-        self._register_employee(
-            employee_id=employee_id,
-            name=name,
-            name_cn=name_cn,
-            agent_id=agent_id,
-            role=role,
-            division=division,
-            path=rel_path,
-            emoji=emoji,
-        )
-
-        # Reload config so the new employee is immediately visible
-        self._cfg = CompanyConfig(self._cfg.root)
+            dest = workspace / filename
+            dest.write_text(template.render(replacements), encoding="utf-8")
+            written.append(dest)
+        return written
 
-        return workspace
-
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
-
-    def _resolve_manager(self, employee_id: str, director_id: str) -> str:
-        """Return the human-readable manager name for a new employee."""
+    @staticmethod
+    def _resolve_manager(
+        cfg: CompanyConfig,
+        employee_id: str,
+        director_id: str,
+    ) -> str:
+        """Return the human-readable manager name for an employee."""
         if employee_id == director_id:
             return "Dawson (Founder)"
         try:
-            director = self._cfg.employee(director_id)
+            director = cfg.employee(director_id)
             return director.name
         except KeyError:
             return "Dawson (Founder)"
@@ -235,14 +565,8 @@ class EmployeeManager:
         content: str,
         replacements: dict[str, str],
     ) -> str:
-        """Two-pass replacement: first raw bracket tokens, then format keys."""
-        # Pass 1 -- replace the literal bracket placeholders with format keys
-        for raw_token, fmt_key in _PLACEHOLDERS.items():
-            content = content.replace(raw_token, fmt_key)
-        # Pass 2 -- fill the format keys with actual values
-        for key, value in replacements.items():
-            content = content.replace(key, value)
-        return content
+        """Fill bracket tokens and format keys in one pass over *content*."""
+        return _COMPILER.compile(content).render(replacements)
 
     def _register_employee(
         self,
@@ -257,24 +581,58 @@ class EmployeeManager:
         emoji: str,
     ) -> None:
         """Append a new employee entry to ``org/employees.yaml``."""
+        self._register_employees({
+            employee_id: {
+                "name": name,
+                "name_cn": name_cn,
+                "agent_id": agent_id,
+                "role": role,
+                "division": division,
+                "path": path,
+                "emoji": emoji,
+                "status": "active",
+            },
+        })
+
+    def _register_employees(self, entries: dict[str, dict[str, str]]) -> None:
+        """Append several employee entries to ``org/employees.yaml`` at once."""
         yaml_path = self._cfg.paths.org / "employees.yaml"
         data = _load_yaml(yaml_path)
 
         employees: dict = data.setdefault("employees", {})
-        employees[employee_id] = {
-            "name": name,
-            "name_cn": name_cn,
-            "agent_id": agent_id,
-            "role": role,
-            "division": division,
-            "path": path,
-            "emoji": emoji,
-            "status": "active",
-        }
+        employees.update(entries)
 
         _save_yaml(yaml_path, data)
 
 
+# ---------------------------------------------------------------------------
+# Manifests
+# ---------------------------------------------------------------------------
+
+
+def load_manifest(
+    path: Path,
+    defaults: dict[str, Any] | None = None,
+) -> list[EmployeeSpec]:
+    """Read a hiring manifest into :class:`EmployeeSpec` objects.
+
+    The manifest holds an ``employees`` list (or an ID-keyed mapping in the
+    ``org/employees.yaml`` shape) and an optional ``defaults`` mapping that
+    fills fields missing from each entry.  *defaults* passed by the caller
+    are applied underneath the manifest's own.
+    """
+    data = _load_yaml(path)
+    merged_defaults = {**(defaults or {}), **(data.get("defaults") or {})}
+    raw = data.get("employees") or []
+    if isinstance(raw, dict):
+        raw = [{"id": eid, **(entry or {})} for eid, entry in raw.items()]
+    return [
+        EmployeeSpec.from_dict(entry, merged_defaults)
+        for entry in raw
+        if isinstance(entry, dict)
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Module-level YAML utilities
 # ---------------------------------------------------------------------------
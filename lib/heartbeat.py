@@ -0,0 +1,321 @@
+"""Shared, stat-validated cache of ``HEARTBEAT.md`` contents.
+
+Heartbeat files are re-read only when their ``(mtime_ns, size)`` signature
+changes, so repeated status queries and dashboard refreshes cost one
+``stat`` per file once the cache is warm.  Memory is bounded by an LRU over
+the cached text size.
+
+Usage::
+
+    cache = shared_cache()
+    hb = cache.read(path)          # None if the file does not exist
+    if hb is not None:
+        print(hb.text)
+    print(cache.stats())
+
+    # Only the first 3 lines, reading just the bytes needed for them
+    preview = cache.summary(path, max_lines=3)
+"""
+
+from __future__ import annotations
+
+import codecs
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True, slots=True)
+class Heartbeat:
+    """Contents of one heartbeat file at a given ``stat`` signature."""
+
+    path: Path
+    mtime_ns: int
+    size: int
+    text: str
+
+    @property
+    def lines(self) -> list[str]:
+        return self.text.splitlines()
+
+
+@dataclass(frozen=True, slots=True)
+class HeartbeatSummary:
+    """A bounded prefix of a heartbeat file."""
+
+    text: str
+    truncated: bool  # True if the file continues past the limits
+    exists: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Counters for a :class:`HeartbeatCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+
+class HeartbeatCache:
+    """LRU of heartbeat file contents keyed by path, mtime and size.
+
+    Files larger than *max_bytes* are returned but never cached.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = 8 * 1024 * 1024,
+        max_summaries: int = 1024,
+    ) -> None:
+        self._max_bytes = max_bytes
+        self._max_summaries = max_summaries
+        self._entries: OrderedDict[Path, Heartbeat] = OrderedDict()
+        self._summaries: OrderedDict[
+            tuple[Path, int | None, int | None],
+            tuple[tuple[int, int], HeartbeatSummary],
+        ] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def read(self, path: Path) -> Heartbeat | None:
+        """Return the heartbeat at *path*, or ``None`` if it does not exist."""
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            self._forget(path)
+            return None
+
+        with self._lock:
+            cached = self._entries.get(path)
+            if (
+                cached is not None
+                and cached.mtime_ns == st.st_mtime_ns
+                and cached.size == st.st_size
+            ):
+                self._entries.move_to_end(path)
+                self._hits += 1
+                return cached
+
+        try:
+            entry = self._load(path)
+        except FileNotFoundError:
+            self._forget(path)
+            return None
+        with self._lock:
+            self._misses += 1
+            self._store(entry)
+        return entry
+
+    def summary(
+        self,
+        path: Path,
+        *,
+        max_lines: int | None = None,
+        max_chars: int | None = None,
+    ) -> HeartbeatSummary | None:
+        """Return the start of *path* within the given limits.
+
+        Served from the cached full text when that is current; otherwise
+        only a prefix of the file is read (see :func:`read_prefix`) and the
+        result is remembered under the file's ``stat`` signature.  Returns
+        ``None`` if the file does not exist.
+        """
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            self._forget(path)
+            return None
+
+        sig = (st.st_mtime_ns, st.st_size)
+        key = (path, max_lines, max_chars)
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is not None and (cached.mtime_ns, cached.size) == sig:
+                self._hits += 1
+                return _limit(cached.text, max_lines, max_chars, complete=True)
+            known = self._summaries.get(key)
+            if known is not None and known[0] == sig:
+                self._summaries.move_to_end(key)
+                self._hits += 1
+                return known[1]
+
+        try:
+            result = read_prefix(path, max_lines=max_lines, max_chars=max_chars)
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            self._misses += 1
+            self._summaries[key] = (sig, result)
+            while len(self._summaries) > self._max_summaries:
+                self._summaries.popitem(last=False)
+        return result
+
+    def exists(self, path: Path) -> bool:
+        """Return whether *path* exists (a ``stat``, never a read)."""
+        return path.is_file()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._summaries.clear()
+            self._bytes = 0
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _load(path: Path) -> Heartbeat:
+        # Key on the fstat of the handle we read so a concurrent rewrite
+        # shows up as a changed signature on the next call.
+        with path.open("rb") as fh:
+            data = fh.read()
+            st = os.fstat(fh.fileno())
+        return Heartbeat(
+            path=path,
+            mtime_ns=st.st_mtime_ns,
+            size=st.st_size,
+            text=data.decode("utf-8", errors="replace"),
+        )
+
+    def _store(self, entry: Heartbeat) -> None:
+        previous = self._entries.pop(entry.path, None)
+        if previous is not None:
+            self._bytes -= previous.size
+        if entry.size > self._max_bytes:
+            return
+        self._entries[entry.path] = entry
+        self._bytes += entry.size
+        while self._bytes > self._max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self._evictions += 1
+
+    def _forget(self, path: Path) -> None:
+        with self._lock:
+            previous = self._entries.pop(path, None)
+            if previous is not None:
+                self._bytes -= previous.size
+
+    # ------------------------------------------------------------------
+    # Dunder helpers
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"HeartbeatCache(entries={len(self._entries)}, bytes={self._bytes}, "
+            f"hits={self._hits}, misses={self._misses})"
+        )
+
+
+# ---------------------------------------------------------------------------
+# Bounded prefix reads
+# ---------------------------------------------------------------------------
+
+
+def _limit(
+    text: str,
+    max_lines: int | None,
+    max_chars: int | None,
+    *,
+    complete: bool,
+) -> HeartbeatSummary:
+    """Apply the line and character limits to a (possibly partial) text.
+
+    *complete* says whether *text* is the whole file; if not, any text
+    beyond what the limits keep still counts as truncation.
+    """
+    truncated = False
+    if max_lines is not None:
+        lines = text.splitlines()
+        if len(lines) > max_lines:
+            truncated = True
+        text = "\n".join(lines[:max_lines])
+    if max_chars is not None and len(text) > max_chars:
+        text = text[:max_chars]
+        truncated = True
+    return HeartbeatSummary(text=text, truncated=truncated or not complete)
+
+
+def read_prefix(
+    path: Path,
+    *,
+    max_lines: int | None = None,
+    max_chars: int | None = None,
+    max_bytes: int = 64 * 1024,
+    chunk_size: int = 4096,
+) -> HeartbeatSummary:
+    """Read only as much of *path* as the limits need.
+
+    Bytes are decoded incrementally, so a multi-byte UTF-8 character split
+    across a chunk boundary is never mangled.  Reading stops as soon as the
+    limits are provably exceeded, at EOF, or after *max_bytes* (a guard
+    against a single enormous line).
+    """
+    if max_chars is not None:
+        # UTF-8 needs at most 4 bytes per character; +1 char detects overflow.
+        max_bytes = min(max_bytes, (max_chars + 1) * 4)
+
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    parts: list[str] = []
+    chars = 0
+    read_bytes = 0
+    eof = False
+    with path.open("rb") as fh:
+        while read_bytes < max_bytes:
+            chunk = fh.read(min(chunk_size, max_bytes - read_bytes))
+            if not chunk:
+                eof = True
+                break
+            read_bytes += len(chunk)
+            piece = decoder.decode(chunk)
+            parts.append(piece)
+            chars += len(piece)
+            if max_chars is not None and chars > max_chars:
+                break
+            if (
+                max_lines is not None
+                and "\n" in piece
+                and len("".join(parts).splitlines()) > max_lines
+            ):
+                break
+        else:
+            eof = not fh.read(1)
+    if eof:
+        parts.append(decoder.decode(b"", final=True))
+
+    return _limit("".join(parts), max_lines, max_chars, complete=eof)
+
+
+_SHARED = HeartbeatCache()
+
+
+def shared_cache() -> HeartbeatCache:
+    """Return the process-wide heartbeat cache."""
+    return _SHARED
@@ -0,0 +1,246 @@
+"""Time-bounded leases on dispatched tasks.
+
+When :class:`~lib.dispatch.Dispatcher` hands a task to an agent it grants
+a lease: the task is marked started, ``lease_until`` is set on the board
+and the attempt is counted.  The lease lasts ``runtime.lease_minutes``
+(by default the role's heartbeat SLA) and is renewed whenever the agent's
+``HEARTBEAT.md`` changes or the agent runs ``vwork task renew``.
+
+:meth:`LeaseManager.sweep` handles leases that ran out.  The task is put
+back in the ready queue, so the next dispatch pass sends it again, until
+it has been re-dispatched ``runtime.lease_max_retries`` times.  After
+that it goes to ``runtime.lease_fallback`` (fresh attempts), or is
+marked blocked when no fallback is configured.  :meth:`LeaseManager.expire`
+applies the same rules early, for the watchdog (see :mod:`lib.watchdog`).
+
+Usage::
+
+    leases = LeaseManager(cfg)
+    leases.grant("2026-02-05-001")      # done by the dispatcher
+    leases.renew("2026-02-05-001")      # done by the agent
+    for expiry in leases.sweep():
+        print(expiry.task.id, expiry.action, expiry.assignee)
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from .config import CompanyConfig
+from .orchestrator import Orchestrator, Task
+
+
+EXPIRY_ACTIONS = ("requeued", "reassigned", "blocked")
+
+
+@dataclass(frozen=True, slots=True)
+class Expiry:
+    """A lease that ran out, and what was done about it."""
+
+    task: Task  # as it was when the lease expired
+    action: str  # one of EXPIRY_ACTIONS
+    assignee: str  # who holds the task now
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "task": self.task.id,
+            "title": self.task.title,
+            "previous_assignee": self.task.assignee,
+            "assignee": self.assignee,
+            "attempts": self.task.attempts,
+            "lease_until": self.task.lease_until,
+            "action": self.action,
+        }
+
+
+class LeaseManager:
+    """Grant, renew and expire dispatch leases on board tasks.
+
+    *max_retries* and *fallback* default to ``runtime.lease_max_retries``
+    and ``runtime.lease_fallback``.
+    """
+
+    def __init__(
+        self,
+        config: CompanyConfig,
+        *,
+        orchestrator: Orchestrator | None = None,
+        max_retries: int | None = None,
+        fallback: str | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        rt = config.runtime
+        self._cfg = config
+        self._orch = orchestrator or Orchestrator(config)
+        self.max_retries = (
+            rt.lease_max_retries if max_retries is None else max_retries
+        )
+        self.fallback = rt.lease_fallback if fallback is None else fallback
+        if self.fallback and self.fallback not in config.employees:
+            raise KeyError(f"Lease fallback '{self.fallback}' is not an employee")
+        self._clock = clock
+        self.renewals = 0  # heartbeat renewals made by the last sweep
+
+    # ------------------------------------------------------------------
+    # Leases
+    # ------------------------------------------------------------------
+
+    def duration(self, employee_id: str) -> float:
+        """Return the lease length in seconds for *employee_id*."""
+        minutes = self._cfg.runtime.lease_minutes
+        if minutes > 0:
+            return minutes * 60.0
+        return self._cfg.heartbeat_sla(employee_id)
+
+    def grant(self, task_id: str) -> Task:
+        """Start *task_id* under a fresh lease and count the attempt.
+
+        Raises ``KeyError`` if the task is no longer on the board.
+        """
+        with self._orch.locked():
+            task = self._orch.get_task(task_id)
+            now = self._clock()
+            (task,) = self._orch.update_tasks({
+                task_id: {
+                    "started": task.started or _iso(now),
+                    "lease_until": _iso(now + self.duration(task.assignee)),
+                    "attempts": task.attempts + 1,
+                }
+            })
+        return task
+
+    def renew(self, task_id: str, *, seconds: float | None = None) -> Task:
+        """Extend the lease of *task_id* from now (by the default length)."""
+        with self._orch.locked():
+            task = self._orch.get_task(task_id)
+            if not task.lease_until:
+                raise ValueError(f"Task '{task_id}' has no lease to renew")
+            length = self.duration(task.assignee) if seconds is None else seconds
+            (task,) = self._orch.update_tasks(
+                {task_id: {"lease_until": _iso(self._clock() + length)}}
+            )
+        return task
+
+    def sweep(
+        self,
+        division_ids: list[str] | None = None,
+        *,
+        dry_run: bool = False,
+    ) -> list[Expiry]:
+        """Renew leases from heartbeats, then expire the ones that ran out.
+
+        *division_ids* limits the sweep to those divisions.  The board is
+        read and all changes are written at once under the board lock;
+        with *dry_run* nothing is written.
+        """
+        with self._orch.locked():
+            now = self._clock()
+            updates: dict[str, dict[str, Any]] = {}
+            expired: list[Expiry] = []
+            self.renewals = 0
+            for task in self._orch.list_tasks(status="active"):
+                if not task.lease_until:
+                    continue
+                if division_ids is not None and task.division not in division_ids:
+                    continue
+                until = _timestamp(task.lease_until)
+                heartbeat = None
+                if task.assignee in self._cfg.employees:
+                    heartbeat = _mtime(
+                        self._cfg.employee_workspace(task.assignee) / "HEARTBEAT.md"
+                    )
+                if heartbeat is not None:
+                    # Whole seconds, as stored on the board.
+                    renewed = float(int(heartbeat + self.duration(task.assignee)))
+                    if renewed > until:
+                        until = renewed
+                        updates[task.id] = {"lease_until": _iso(until)}
+                        self.renewals += 1
+                if until > now:
+                    continue
+                expiry, updates[task.id] = self._expire(task)
+                expired.append(expiry)
+
+            if updates and not dry_run:
+                self._orch.update_tasks(updates)
+        return expired
+
+    def expire(self, task_ids: Iterable[str]) -> list[Expiry]:
+        """End the leases of *task_ids* now, as if they had run out.
+
+        The watchdog uses this for agents that went quiet, so their tasks
+        are re-sent by the dispatcher under the same retry limit.  Tasks
+        no longer active on the board are skipped.
+        """
+        wanted = set(task_ids)
+        updates: dict[str, dict[str, Any]] = {}
+        expired: list[Expiry] = []
+        with self._orch.locked():
+            for task in self._orch.list_tasks(status="active"):
+                if task.id in wanted:
+                    expiry, updates[task.id] = self._expire(task)
+                    expired.append(expiry)
+            if updates:
+                self._orch.update_tasks(updates)
+        return expired
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _expire(self, task: Task) -> tuple[Expiry, dict[str, Any]]:
+        """Decide what happens to *task* now that its lease is over."""
+        if task.attempts <= self.max_retries:
+            action, assignee = "requeued", task.assignee
+            change: dict[str, Any] = {"started": "", "lease_until": ""}
+        elif self.fallback and self.fallback != task.assignee:
+            action, assignee = "reassigned", self.fallback
+            change = {
+                "assignee": assignee,
+                "started": "",
+                "lease_until": "",
+                "attempts": 0,
+            }
+        else:
+            action, assignee = "blocked", task.assignee
+            change = {"status": "blocked", "lease_until": ""}
+        return Expiry(task=task, action=action, assignee=assignee), change
+
+    # ------------------------------------------------------------------
+    # Dunder helpers
+    # ------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return (
+            f"LeaseManager(max_retries={self.max_retries}, "
+            f"fallback={self.fallback or None!r})"
+        )
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp).isoformat(timespec="seconds")
+
+
+def _timestamp(value: str) -> float:
+    """Parse an ISO timestamp from the board (0.0, i.e. expired, if invalid)."""
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def _mtime(path: os.PathLike[str]) -> float | None:
+    try:
+        return os.stat(path).st_mtime
+    except (FileNotFoundError, NotADirectoryError):
+        return None
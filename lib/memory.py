@@ -0,0 +1,407 @@
+"""Full-text search over employee ``memory/`` directories.
+
+Memory files are indexed into an SQLite FTS5 table in
+``.vwork/memory.sqlite``.  The index is refreshed incrementally: each
+``memory/`` tree is listed with :func:`os.scandir` and only files whose
+``(size, mtime_ns)`` changed are re-read, so keeping it current costs one
+``stat`` per file and a query is answered from the index in milliseconds.
+
+The trigram tokenizer is used when SQLite provides it (3.34+), so Chinese
+text and partial words match as substrings; older SQLite falls back to the
+``unicode61`` word tokenizer.
+
+Entries archived by :mod:`lib.compaction` are indexed too, each under
+``memory/archive/<segment>.zip#<name>`` (the segment is re-read only when
+it changes), so search reaches cold memory as well as the hot tail.  The
+archive's ``INDEX.md`` listing and any ``*.corrupt`` segments are skipped.
+
+Usage::
+
+    with MemoryIndex(cfg) as index:
+        index.refresh()
+        for hit in index.search("render budget", employees=["director-chen"]):
+            print(hit.employee, hit.path, hit.snippet)
+
+    # or, through the manager (refreshes the relevant workspaces first)
+    EmployeeManager(cfg).search_memory("render budget", division="content-studio")
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from .compaction import is_archive_metadata, is_segment, iter_segment
+from .config import CompanyConfig
+from .workspace import walk_files
+
+
+INDEX_FILENAME = "memory.sqlite"
+
+# Bump when the schema changes; older indexes are rebuilt.
+_INDEX_FORMAT = 2
+
+# Larger files (and anything that looks binary) are listed but not indexed.
+MAX_FILE_BYTES = 2 * 1024 * 1024
+
+# Characters of context on each side of the first match in a snippet.
+_EXCERPT_CHARS = 60
+
+
+@dataclass(frozen=True, slots=True)
+class MemoryHit:
+    """One memory file matching a search."""
+
+    employee: str
+    path: str  # relative to the workspace, e.g. "memory/2026-01-05.md"
+    snippet: str  # matched terms are wrapped in [brackets]
+    rank: float  # bm25 score; lower is a better match
+    mtime_ns: int
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "employee": self.employee,
+            "path": self.path,
+            "snippet": self.snippet,
+            "rank": round(self.rank, 4),
+            "mtime": self.mtime_ns / 1e9,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class RefreshStats:
+    """What one :meth:`MemoryIndex.refresh` call did."""
+
+    files: int
+    indexed: int  # new or changed files that were read
+    unchanged: int
+    removed: int
+    seconds: float
+
+
+class MemoryIndex:
+    """Incremental SQLite FTS5 index over every employee's ``memory/``."""
+
+    def __init__(self, config: CompanyConfig, path: Path | None = None) -> None:
+        self._cfg = config
+        self._path = path or config.paths.state / INDEX_FILENAME
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self._path, timeout=10.0)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self.tokenizer = self._ensure_schema()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def refresh(self, employee_ids: Iterable[str] | None = None) -> RefreshStats:
+        """Bring the index up to date with the employees' ``memory/`` trees.
+
+        Only files whose ``(size, mtime_ns)`` differ from the index are
+        read.  With *employee_ids* only those employees are refreshed; a
+        full refresh also drops employees no longer in the config.
+        """
+        start = time.perf_counter()
+        full = employee_ids is None
+        targets = list(self._cfg.employees) if full else list(employee_ids)
+        files = indexed = unchanged = removed = 0
+
+        with self._db:
+            if full:
+                known_ids = {
+                    row[0]
+                    for row in self._db.execute("SELECT DISTINCT employee FROM files")
+                }
+                for gone in known_ids - set(targets):
+                    removed += self._drop(
+                        "SELECT id FROM files WHERE employee = ?", (gone,)
+                    )
+
+            for eid in targets:
+                workspace = self._cfg.employee_workspace(eid)
+                known = {
+                    rel: (row_id, size, mtime_ns)
+                    for row_id, rel, size, mtime_ns in self._db.execute(
+                        "SELECT id, path, size, mtime_ns FROM files"
+                        " WHERE employee = ?",
+                        (eid,),
+                    )
+                }
+                seen: set[str] = set()
+                for rel, entry in walk_files(workspace / "memory", "memory/"):
+                    if is_archive_metadata(rel):
+                        continue
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except FileNotFoundError:
+                        continue  # deleted mid-scan
+                    seen.add(rel)
+                    previous = known.get(rel)
+                    segment = is_segment(rel)
+                    if previous is not None and previous[1:] == (
+                        st.st_size, st.st_mtime_ns,
+                    ):
+                        if segment:
+                            members = [k for k in known if k.startswith(f"{rel}#")]
+                            seen.update(members)
+                            unchanged += len(members)
+                        else:
+                            unchanged += 1
+                        continue
+                    if segment:
+                        # The segment row only records its signature; each
+                        # archived entry is indexed as "<segment>#<name>".
+                        self._store(
+                            eid, rel, st.st_size, st.st_mtime_ns, "", previous
+                        )
+                        members = iter_segment(Path(entry.path))
+                        for name, size, mtime_ns, data in members:
+                            member = f"{rel}#{name}"
+                            seen.add(member)
+                            self._store(
+                                eid, member, size, mtime_ns,
+                                _decode(data, size), known.get(member),
+                            )
+                            indexed += 1
+                        continue
+                    try:
+                        text = _read_text(Path(entry.path), st.st_size)
+                    except FileNotFoundError:
+                        seen.discard(rel)
+                        continue
+                    self._store(eid, rel, st.st_size, st.st_mtime_ns, text, previous)
+                    indexed += 1
+                stale = known.keys() - seen
+                for rel in stale:
+                    self._delete(known[rel][0])
+                removed += len(stale)
+                files += len(seen)
+
+        return RefreshStats(
+            files=files,
+            indexed=indexed,
+            unchanged=unchanged,
+            removed=removed,
+            seconds=time.perf_counter() - start,
+        )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query: str,
+        *,
+        employees: Iterable[str] | None = None,
+        limit: int = 20,
+    ) -> list[MemoryHit]:
+        """Return the best matches for *query*, best first.
+
+        Every whitespace-separated term must occur in a file.  Terms are
+        matched literally (FTS operators in *query* are not interpreted).
+        With *employees* the search is restricted to those workspaces.
+        """
+        terms = [t for t in query.split() if t]
+        if not terms:
+            return []
+
+        # The trigram tokenizer cannot match terms shorter than 3 characters
+        # (common for Chinese words), so those become LIKE filters instead.
+        min_len = 3 if self.tokenizer == "trigram" else 1
+        phrases = [t for t in terms if len(t) >= min_len]
+        short = [t for t in terms if len(t) < min_len]
+
+        where: list[str] = []
+        params: list[object] = []
+        if phrases:
+            where.append("memory_fts MATCH ?")
+            params.append(" AND ".join(_quote(t) for t in phrases))
+        for term in short:
+            where.append("memory_fts.content LIKE ? ESCAPE '\\'")
+            params.append(f"%{_like_escape(term)}%")
+        if employees is not None:
+            ids = list(employees)
+            if not ids:
+                return []
+            where.append(f"files.employee IN ({', '.join('?' * len(ids))})")
+            params.extend(ids)
+
+        if phrases:
+            select, order = "bm25(memory_fts) AS score", "score"
+        else:
+            select, order = "0.0", "files.mtime_ns DESC"
+        sql = (
+            "SELECT files.employee, files.path, files.mtime_ns,"
+            f" memory_fts.content, {select}"
+            " FROM memory_fts JOIN files ON files.id = memory_fts.rowid"
+            f" WHERE {' AND '.join(where)} ORDER BY {order} LIMIT ?"
+        )
+        params.append(limit)
+
+        return [
+            MemoryHit(employee, path, _excerpt(text, terms), rank, mtime_ns)
+            for employee, path, mtime_ns, text, rank in self._db.execute(sql, params)
+        ]
+
+    def count(self, employee_id: str | None = None) -> int:
+        """Return how many memory files are indexed."""
+        if employee_id is None:
+            row = self._db.execute("SELECT COUNT(*) FROM files").fetchone()
+        else:
+            row = self._db.execute(
+                "SELECT COUNT(*) FROM files WHERE employee = ?", (employee_id,)
+            ).fetchone()
+        return row[0]
+
+    def close(self) -> None:
+        self._db.close()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _ensure_schema(self) -> str:
+        """Create (or rebuild an outdated) schema; return the tokenizer."""
+        db = self._db
+        db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        meta = dict(db.execute("SELECT key, value FROM meta"))
+        if meta.get("format") == str(_INDEX_FORMAT) and "tokenizer" in meta:
+            return meta["tokenizer"]
+
+        with db:
+            db.execute("DROP TABLE IF EXISTS memory_fts")
+            db.execute("DROP TABLE IF EXISTS files")
+            db.execute(
+                "CREATE TABLE files ("
+                " id INTEGER PRIMARY KEY,"
+                " employee TEXT NOT NULL,"
+                " path TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " mtime_ns INTEGER NOT NULL,"
+                " UNIQUE (employee, path))"
+            )
+            try:
+                db.execute(
+                    "CREATE VIRTUAL TABLE memory_fts"
+                    " USING fts5(content, tokenize='trigram')"
+                )
+                tokenizer = "trigram"
+            except sqlite3.OperationalError:
+                db.execute(
+                    "CREATE VIRTUAL TABLE memory_fts"
+                    " USING fts5(content, tokenize='unicode61 remove_diacritics 2')"
+                )
+                tokenizer = "unicode61"
+            db.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [("format", str(_INDEX_FORMAT)), ("tokenizer", tokenizer)],
+            )
+        return tokenizer
+
+    def _store(
+        self,
+        employee: str,
+        rel: str,
+        size: int,
+        mtime_ns: int,
+        text: str,
+        previous: tuple[int, int, int] | None,
+    ) -> None:
+        if previous is None:
+            cur = self._db.execute(
+                "INSERT INTO files (employee, path, size, mtime_ns)"
+                " VALUES (?, ?, ?, ?)",
+                (employee, rel, size, mtime_ns),
+            )
+            row_id = cur.lastrowid
+        else:
+            row_id = previous[0]
+            self._db.execute(
+                "UPDATE files SET size = ?, mtime_ns = ? WHERE id = ?",
+                (size, mtime_ns, row_id),
+            )
+            self._db.execute("DELETE FROM memory_fts WHERE rowid = ?", (row_id,))
+        self._db.execute(
+            "INSERT INTO memory_fts (rowid, content) VALUES (?, ?)",
+            (row_id, text),
+        )
+
+    def _delete(self, row_id: int) -> None:
+        self._db.execute("DELETE FROM memory_fts WHERE rowid = ?", (row_id,))
+        self._db.execute("DELETE FROM files WHERE id = ?", (row_id,))
+
+    def _drop(self, sql: str, params: tuple[object, ...]) -> int:
+        row_ids = [row[0] for row in self._db.execute(sql, params)]
+        for row_id in row_ids:
+            self._delete(row_id)
+        return len(row_ids)
+
+    # ------------------------------------------------------------------
+    # Dunder helpers
+    # ------------------------------------------------------------------
+
+    def __enter__(self) -> MemoryIndex:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"MemoryIndex(path={self._path}, tokenizer={self.tokenizer})"
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _read_text(path: Path, size: int) -> str:
+    """Return the file's text, or ``""`` for oversized or binary files."""
+    if size > MAX_FILE_BYTES:
+        return ""
+    return _decode(path.read_bytes(), size)
+
+
+def _decode(data: bytes, size: int) -> str:
+    if size > MAX_FILE_BYTES or b"\0" in data[:1024]:
+        return ""
+    return data.decode("utf-8", errors="replace")
+
+
+def _quote(term: str) -> str:
+    """Quote *term* as an FTS5 string so it is matched literally."""
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _like_escape(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _excerpt(text: str, terms: list[str]) -> str:
+    """Return the text around the first match with every term bracketed.
+
+    Built in Python rather than with FTS5 ``snippet()``, whose trigram
+    highlighting splits words and cannot cover LIKE-matched terms.
+    """
+    pattern = re.compile(
+        "|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True)),
+        re.IGNORECASE,
+    )
+    first = pattern.search(text)
+    if first is None:
+        return ""
+    start = max(0, first.start() - _EXCERPT_CHARS)
+    end = min(len(text), first.end() + _EXCERPT_CHARS)
+    excerpt = pattern.sub(lambda m: f"[{m.group(0)}]", text[start:end])
+    excerpt = " ".join(excerpt.split())
+    return ("…" if start else "") + excerpt + ("…" if end < len(text) else "")
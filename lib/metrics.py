@@ -0,0 +1,170 @@
+"""Machine-readable company counters for monitoring scrapes.
+
+Everything here is answered from cheap sources: task counts come from the
+stat-validated :class:`~lib.board.BoardIndex`, headcount from the loaded
+config, heartbeat ages from one ``stat`` per file, and gateway health from
+a ``PATH`` lookup (the gateway binary is never executed).  Nothing imports
+rich.
+
+Usage::
+
+    metrics = collect_metrics(cfg)
+    print(format_prometheus(metrics))
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import time
+from typing import Any
+
+from .board import BoardIndex
+from .config import CompanyConfig
+from .openclaw import OpenClawGateway
+
+
+def collect_metrics(
+    cfg: CompanyConfig,
+    *,
+    board: BoardIndex | None = None,
+    now: float | None = None,
+) -> dict[str, Any]:
+    """Return the company counters as a JSON-serialisable mapping.
+
+    Heartbeat ages are in seconds, ``None`` when the file is missing.
+    """
+    now = time.time() if now is None else now
+    counts = (board or BoardIndex(cfg)).counts()
+
+    headcount: dict[str, dict[str, int]] = {}
+    for emp in cfg.employees.values():
+        per_div = headcount.setdefault(emp.division, {})
+        per_div[emp.status] = per_div.get(emp.status, 0) + 1
+
+    division_hb = {
+        div_id: _age(cfg.division_path(div_id) / "HEARTBEAT.md", now)
+        for div_id in cfg.divisions
+    }
+    employee_hb = {
+        eid: _age(cfg.employee_workspace(eid) / "HEARTBEAT.md", now)
+        for eid in cfg.employees
+    }
+
+    return {
+        "timestamp": now,
+        "tasks": counts.to_dict(),
+        "headcount": {
+            "total": len(cfg.employees),
+            "by_division": headcount,
+            "by_role": _tally(emp.role for emp in cfg.employees.values()),
+        },
+        "divisions": len(cfg.divisions),
+        "heartbeat_age_seconds": {
+            "divisions": division_hb,
+            "employees": employee_hb,
+        },
+        "gateway": {
+            "binary": OpenClawGateway.CLAWDBOT_BIN,
+            "up": shutil.which(OpenClawGateway.CLAWDBOT_BIN) is not None,
+        },
+    }
+
+
+def format_prometheus(metrics: dict[str, Any]) -> str:
+    """Render :func:`collect_metrics` output in the Prometheus text format."""
+    out: list[str] = []
+
+    def family(name: str, kind: str, help_text: str) -> None:
+        out.append(f"# HELP {name} {help_text}")
+        out.append(f"# TYPE {name} {kind}")
+
+    def sample(name: str, value: float, **labels: str) -> None:
+        if labels:
+            body = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+            out.append(f"{name}{{{body}}} {_number(value)}")
+        else:
+            out.append(f"{name} {_number(value)}")
+
+    tasks = metrics["tasks"]
+    family("vwork_tasks", "gauge", "Active-board tasks by status.")
+    for status, n in sorted(tasks["by_status"].items()):
+        sample("vwork_tasks", n, status=status)
+    family("vwork_tasks_total", "gauge", "All tasks on the active board.")
+    sample("vwork_tasks_total", tasks["total"])
+    family("vwork_division_tasks", "gauge", "Tasks by division and status.")
+    for division, per_status in sorted(tasks["by_division"].items()):
+        for status, n in sorted(per_status.items()):
+            sample("vwork_division_tasks", n, division=division, status=status)
+    family("vwork_assignee_tasks", "gauge", "Tasks by assignee and status.")
+    for assignee, per_status in sorted(tasks["by_assignee"].items()):
+        for status, n in sorted(per_status.items()):
+            sample("vwork_assignee_tasks", n, assignee=assignee, status=status)
+
+    headcount = metrics["headcount"]
+    family("vwork_employees", "gauge", "Headcount by division and status.")
+    for division, per_status in sorted(headcount["by_division"].items()):
+        for status, n in sorted(per_status.items()):
+            sample("vwork_employees", n, division=division, status=status)
+    family("vwork_role_employees", "gauge", "Headcount by role.")
+    for role, n in sorted(headcount["by_role"].items()):
+        sample("vwork_role_employees", n, role=role)
+    family("vwork_divisions", "gauge", "Number of divisions.")
+    sample("vwork_divisions", metrics["divisions"])
+
+    ages = metrics["heartbeat_age_seconds"]
+    family(
+        "vwork_heartbeat_age_seconds",
+        "gauge",
+        "Seconds since HEARTBEAT.md was modified.",
+    )
+    for scope in ("divisions", "employees"):
+        for ident, age in sorted(ages[scope].items()):
+            if age is not None:
+                sample(
+                    "vwork_heartbeat_age_seconds", age,
+                    scope=scope[:-1], id=ident,
+                )
+    family("vwork_heartbeat_present", "gauge", "1 if HEARTBEAT.md exists.")
+    for scope in ("divisions", "employees"):
+        for ident, age in sorted(ages[scope].items()):
+            sample(
+                "vwork_heartbeat_present", 0 if age is None else 1,
+                scope=scope[:-1], id=ident,
+            )
+
+    family("vwork_gateway_up", "gauge", "1 if the gateway CLI is on PATH.")
+    sample("vwork_gateway_up", 1 if metrics["gateway"]["up"] else 0)
+
+    return "\n".join(out) + "\n"
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _age(path: os.PathLike[str], now: float) -> float | None:
+    try:
+        return round(max(0.0, now - os.stat(path).st_mtime), 3)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _tally(values: Any) -> dict[str, int]:
+    out: dict[str, int] = {}
+    for value in values:
+        out[value] = out.get(value, 0) + 1
+    return out
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
@@ -8,12 +8,18 @@ from __future__ import annotations
 
 import json
 import subprocess
+import time
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .config import CompanyConfig, EmployeeConfig
 
+if TYPE_CHECKING:
+    from .orchestrator import Task
+    from .routing import ModelRouter
+
 
 @dataclass(frozen=True, slots=True)
 class CommandResult:
@@ -39,8 +45,9 @@ class OpenClawGateway:
         # Register an employee as a clawdbot agent
         gw.register_agent("director-chen")
 
-        # Send a message
+        # Send a message (on a model picked by lib.routing)
         gw.send_message("director-chen", "Please review EP002 script.")
+        gw.send_message(task.assignee, message, task=task)
 
         # Add a cron job
         gw.add_cron("director-chen", "0 9 * * *", "Daily standup check.")
@@ -57,10 +64,12 @@ class OpenClawGateway:
         *,
         clawdbot_bin: str | None = None,
         timeout: int = 60,
+        router: ModelRouter | None = None,
     ) -> None:
         self._cfg = config
         self._bin = clawdbot_bin or self.CLAWDBOT_BIN
         self._timeout = timeout
+        self._router = router
 
     # ------------------------------------------------------------------
     # Agent registration
@@ -98,6 +107,29 @@ class OpenClawGateway:
         ]
         return self._run(cmd)
 
+    def register_agents(
+        self,
+        employee_ids: Iterable[str],
+        *,
+        max_workers: int | None = None,
+    ) -> dict[str, CommandResult]:
+        """Register several employees concurrently.
+
+        *max_workers* defaults to ``runtime.max_concurrent_agents``.  Returns
+        ``{employee_id: result}`` in the order the IDs were given.
+        """
+        ids = list(employee_ids)
+        if not ids:
+            return {}
+        # Imported here: it is the only user, and status scrapes import
+        # this module just for the binary name.
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = max_workers or self._cfg.runtime.max_concurrent_agents
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(ids)))) as pool:
+            results = pool.map(self.register_agent, ids)
+            return dict(zip(ids, results))
+
     # ------------------------------------------------------------------
     # Messaging
     # ------------------------------------------------------------------
@@ -106,22 +138,52 @@ class OpenClawGateway:
         self,
         employee_id: str,
         message: str,
+        *,
+        model: str | None = None,
+        task: Task | None = None,
     ) -> CommandResult:
         """Send a message to an employee's agent and deliver it.
 
         Runs::
 
             clawdbot agent --agent <agent_id> \\
-                --message <message> --deliver
+                --message <message> --deliver [--model <model>]
+
+        Without an explicit *model*, and while ``runtime.model_routing`` is
+        on, the model tier is picked per message (see :mod:`lib.routing`)
+        and the decision is logged with its latency (best-effort: a log that
+        cannot be written never fails the send).  ``--model`` is only
+        passed when it differs from the agent's registered model.
         """
         emp = self._cfg.employee(employee_id)
+        decision = None
+        if model is None and self._cfg.runtime.model_routing:
+            decision = self.router.route(employee_id, message, task=task)
+            model = decision.model
         cmd = [
             self._bin, "agent",
             "--agent", emp.agent_id,
             "--message", message,
             "--deliver",
         ]
-        return self._run(cmd)
+        if model and model != self._resolve_model(emp):
+            cmd += ["--model", model]
+        started = time.monotonic()
+        result = self._run(cmd)
+        if decision is not None:
+            self.router.record(
+                decision, ok=result.ok, seconds=time.monotonic() - started
+            )
+        return result
+
+    @property
+    def router(self) -> ModelRouter:
+        """The per-message model router (built on first use)."""
+        if self._router is None:
+            from .routing import ModelRouter
+
+            self._router = ModelRouter(self._cfg)
+        return self._router
 
     # ------------------------------------------------------------------
     # Cron management
@@ -175,13 +237,7 @@ class OpenClawGateway:
 
     def _resolve_model(self, emp: EmployeeConfig) -> str:
         """Pick the best model for *emp* from role config or company default."""
-        try:
-            role_cfg = self._cfg.role(emp.role)
-            if role_cfg.model:
-                return role_cfg.model
-        except KeyError:
-            pass
-        return self._cfg.runtime.default_model
+        return self._cfg.employee_model(emp.id)
 
     def _run(self, cmd: list[str]) -> CommandResult:
         """Execute a shell command and return a :class:`CommandResult`."""
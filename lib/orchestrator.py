@@ -2,19 +2,36 @@
 
 Manages the task board (``board/active.yaml``, ``board/archive/``),
 assigns work to employees, and collects division status for daily standups.
+
+Every change to the board is a read-modify-write under a lock file
+(``.vwork/board.lock``), so the dispatcher, rebalancer, watchdog and
+``vwork task`` commands running side by side never overwrite each other's
+updates; :meth:`Orchestrator.locked` extends it over several calls.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import yaml
 
+from .board import BoardIndex
 from .config import CompanyConfig, EmployeeConfig
-from .division import DivisionManager
+from .state import file_lock
+
+if TYPE_CHECKING:
+    from .standup import StandupSectionCache
+
+# libyaml's loader when available: same results, several times faster.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Under the state directory; held for every read-modify-write of the board.
+LOCK_FILENAME = "board.lock"
 
 
 # ---------------------------------------------------------------------------
@@ -23,6 +40,10 @@ from .division import DivisionManager
 
 VALID_STATUSES = frozenset({"active", "completed", "blocked"})
 
+# Priority levels, most urgent first; stored on the board as the number.
+PRIORITIES: dict[str, int] = {"urgent": 0, "high": 1, "normal": 2, "low": 3}
+DEFAULT_PRIORITY = PRIORITIES["normal"]
+
 
 @dataclass(slots=True)
 class Task:
@@ -35,8 +56,21 @@ class Task:
     created: str
     division: str
     description: str = ""
-
-    def to_dict(self) -> dict[str, str]:
+    priority: int = DEFAULT_PRIORITY  # see PRIORITIES; lower is more urgent
+    started: str = ""  # ISO timestamp the assignee started work, "" if not yet
+    lease_until: str = ""  # ISO timestamp a dispatch lease runs out, "" if none
+    attempts: int = 0  # times the task was dispatched under a lease
+    depends_on: list[str] = field(default_factory=list)  # task IDs to finish first
+    completed: str = ""  # ISO timestamp the task was completed, "" if open
+
+    @property
+    def priority_name(self) -> str:
+        for name, level in PRIORITIES.items():
+            if level == self.priority:
+                return name
+        return str(self.priority)
+
+    def to_dict(self) -> dict[str, Any]:
         return {
             "id": self.id,
             "title": self.title,
@@ -45,6 +79,12 @@ class Task:
             "created": self.created,
             "division": self.division,
             "description": self.description,
+            "priority": self.priority,
+            "started": self.started,
+            "lease_until": self.lease_until,
+            "attempts": self.attempts,
+            "depends_on": list(self.depends_on),
+            "completed": self.completed,
         }
 
     @classmethod
@@ -57,9 +97,28 @@ class Task:
             created=str(data.get("created", "")),
             division=str(data.get("division", "")),
             description=str(data.get("description", "")),
+            priority=_priority(data.get("priority")),
+            started=_started(data),
+            lease_until=str(data.get("lease_until") or ""),
+            attempts=int(data.get("attempts") or 0),
+            depends_on=[str(d) for d in data.get("depends_on") or []],
+            completed=str(data.get("completed") or ""),
         )
 
 
+@dataclass(slots=True)
+class EmployeeStandup:
+    """Per-employee status collected for a daily standup."""
+
+    id: str
+    name: str
+    role: str
+    status: str
+    task_count: int
+    heartbeat_summary: str
+    heartbeat_updated: str = ""  # ISO timestamp of HEARTBEAT.md, "" if none
+
+
 @dataclass(slots=True)
 class StandupEntry:
     """Status report for one division during a daily standup."""
@@ -68,8 +127,10 @@ class StandupEntry:
     division_name: str
     director: str
     employee_count: int
-    active_tasks: list[Task]
+    active_tasks: list[Task]  # in work order, see lib.ready.work_order
     heartbeat_summary: str
+    employees: list[EmployeeStandup] = field(default_factory=list)
+    timed_out: bool = False  # heartbeats could not be read in time
 
 
 # ---------------------------------------------------------------------------
@@ -110,6 +171,17 @@ class Orchestrator:
         self._active_path: Path = self._board_dir / "active.yaml"
         self._archive_dir: Path = self._board_dir / "archive"
         self._archive_dir.mkdir(parents=True, exist_ok=True)
+        self._lock_path: Path = config.paths.state / LOCK_FILENAME
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold the board lock, e.g. across a read and a later update.
+
+        Board changes take it themselves; it is re-entrant, so they can
+        run inside the block.
+        """
+        with file_lock(self._lock_path):
+            yield
 
     # ------------------------------------------------------------------
     # Task creation
@@ -123,12 +195,21 @@ class Orchestrator:
         division: str,
         description: str = "",
         status: str = "active",
+        priority: int = DEFAULT_PRIORITY,
+        depends_on: list[str] | None = None,
     ) -> Task:
         """Create a new task and append it to ``board/active.yaml``.
 
         The task ID is generated as ``YYYY-MM-DD-NNN`` where NNN is a
-        zero-padded sequence number for today.
+        zero-padded sequence number for today.  *priority* is one of the
+        :data:`PRIORITIES` levels; *depends_on* lists active tasks that
+        must be completed before this one is ready.
         """
+        if priority not in PRIORITIES.values():
+            raise ValueError(
+                f"Invalid priority {priority!r}. Must be one of "
+                f"{sorted(PRIORITIES.values())}."
+            )
         if status not in VALID_STATUSES:
             raise ValueError(
                 f"Invalid status '{status}'. Must be one of {VALID_STATUSES}."
@@ -137,23 +218,29 @@ class Orchestrator:
         self._cfg.employee(assignee)
         self._cfg.division(division)
 
-        today = date.today().isoformat()
-        task_id = self._next_task_id(today)
-
-        task = Task(
-            id=task_id,
-            title=title,
-            assignee=assignee,
-            status=status,
-            created=today,
-            division=division,
-            description=description,
-        )
+        with self.locked():
+            tasks = self._load_active_tasks()
+            for dep in depends_on or []:
+                self._find_task(tasks, dep)  # validate
+
+            today = date.today().isoformat()
+            task_id = self._next_task_id(today)
+
+            task = Task(
+                id=task_id,
+                title=title,
+                assignee=assignee,
+                status=status,
+                created=today,
+                division=division,
+                description=description,
+                priority=priority,
+                depends_on=list(depends_on or []),
+            )
 
-        tasks = self._load_active_tasks()
-        tasks.append(task)
-        self._save_active_tasks(tasks)
-        return task
+            tasks.append(task)
+            self._save_active_tasks(tasks)
+            return task
 
     # ------------------------------------------------------------------
     # Assignment
@@ -162,11 +249,52 @@ class Orchestrator:
     def assign_task(self, task_id: str, assignee: str) -> Task:
         """Reassign an existing active task to a different employee."""
         self._cfg.employee(assignee)  # validate
-        tasks = self._load_active_tasks()
-        task = self._find_task(tasks, task_id)
-        task.assignee = assignee
-        self._save_active_tasks(tasks)
-        return task
+        with self.locked():
+            tasks = self._load_active_tasks()
+            task = self._find_task(tasks, task_id)
+            task.assignee = assignee
+            self._save_active_tasks(tasks)
+            return task
+
+    def pick_assignee(
+        self,
+        role: str,
+        *,
+        division: str | None = None,
+        board: BoardIndex | None = None,
+    ) -> EmployeeConfig:
+        """Return the least-loaded active employee with *role*.
+
+        Load is the number of active and blocked tasks on the board, read
+        from the :class:`~lib.board.BoardIndex` rather than by parsing the
+        board.  Ties go to the employee who completed more tasks recently
+        (the latest two monthly archives), then by ID.
+
+        Raises ``KeyError`` if no active employee has *role* (in
+        *division*, when given).
+        """
+        candidates = [
+            emp
+            for emp in self._cfg.employees.values()
+            if emp.role == role
+            and emp.status == "active"
+            and (division is None or emp.division == division)
+        ]
+        if not candidates:
+            where = f" in division '{division}'" if division else ""
+            raise KeyError(f"No active employee with role '{role}'{where}")
+
+        board = board or BoardIndex(self._cfg)
+        counts = board.counts()
+        done = board.throughput()
+        return min(
+            candidates,
+            key=lambda emp: (
+                counts.load(emp.id, statuses=("active", "blocked")),
+                -done.get(emp.id, 0),
+                emp.id,
+            ),
+        )
 
     # ------------------------------------------------------------------
     # Queries
@@ -204,17 +332,20 @@ class Orchestrator:
         The task is written to ``board/archive/YYYY-MM.yaml`` (grouped by
         month) and removed from ``board/active.yaml``.
         """
-        tasks = self._load_active_tasks()
-        task = self._find_task(tasks, task_id)
-        task.status = "completed"
+        with self.locked():
+            tasks = self._load_active_tasks()
+            task = self._find_task(tasks, task_id)
+            task.status = "completed"
+            task.completed = datetime.now().isoformat(timespec="seconds")
+            task.lease_until = ""
 
-        # Remove from active
-        tasks = [t for t in tasks if t.id != task_id]
-        self._save_active_tasks(tasks)
+            # Remove from active
+            tasks = [t for t in tasks if t.id != task_id]
+            self._save_active_tasks(tasks)
 
-        # Append to monthly archive
-        self._archive_task(task)
-        return task
+            # Append to monthly archive
+            self._archive_task(task)
+            return task
 
     # ------------------------------------------------------------------
     # Status updates
@@ -229,57 +360,95 @@ class Orchestrator:
         if status == "completed":
             return self.complete_task(task_id)
 
-        tasks = self._load_active_tasks()
-        task = self._find_task(tasks, task_id)
-        task.status = status
-        self._save_active_tasks(tasks)
-        return task
+        with self.locked():
+            tasks = self._load_active_tasks()
+            task = self._find_task(tasks, task_id)
+            task.status = status
+            self._save_active_tasks(tasks)
+            return task
+
+    def update_tasks(self, updates: dict[str, dict[str, Any]]) -> list[Task]:
+        """Apply field updates to several active tasks in one board write.
+
+        *updates* maps a task ID to ``{field: value}``; the ID itself
+        cannot change and a status must stay active or blocked.
+        """
+        allowed = {f.name for f in fields(Task)} - {"id"}
+        for task_id, changes in updates.items():
+            unknown = set(changes) - allowed
+            if unknown:
+                raise ValueError(f"Cannot update {sorted(unknown)} of '{task_id}'")
+            if changes.get("status", "active") not in ("active", "blocked"):
+                raise ValueError(
+                    f"Invalid status '{changes['status']}' for '{task_id}'."
+                )
+        with self.locked():
+            tasks = self._load_active_tasks()
+            changed = [self._find_task(tasks, task_id) for task_id in updates]
+            for task in changed:
+                for name, value in updates[task.id].items():
+                    setattr(task, name, value)
+            if changed:
+                self._save_active_tasks(tasks)
+            return changed
+
+    def start_task(self, task_id: str) -> Task:
+        """Record that the assignee started work on a task.
+
+        Started tasks stay with their assignee when queues are rebalanced.
+        Tasks saved without a ``started`` field (boards older than it)
+        load as started on their creation date.
+        """
+        with self.locked():
+            tasks = self._load_active_tasks()
+            task = self._find_task(tasks, task_id)
+            if not task.started:
+                task.started = datetime.now().isoformat(timespec="seconds")
+                self._save_active_tasks(tasks)
+            return task
 
     # ------------------------------------------------------------------
     # Daily standup
     # ------------------------------------------------------------------
 
-    def daily_standup(self) -> list[StandupEntry]:
+    def daily_standup(
+        self,
+        *,
+        division_ids: list[str] | None = None,
+        division_timeout: float | None = None,
+    ) -> list[StandupEntry]:
         """Collect status from every division for a standup report.
 
         For each division this gathers:
-          - the employee roster
+          - the employee roster, with each employee's own heartbeat
           - active tasks assigned to that division
           - a trimmed heartbeat summary (first 500 chars)
+
+        Heartbeats are read concurrently under one deadline of
+        *division_timeout* seconds for the whole report; a division whose
+        files are not all read by then is reported as timed out instead
+        of stalling the report.  *division_ids* limits the
+        report (and the reads) to those divisions.
         """
-        dm = DivisionManager(self._cfg)
-        all_tasks = self._load_active_tasks()
-        entries: list[StandupEntry] = []
-
-        for div_id, div_cfg in self._cfg.divisions.items():
-            div_tasks = [t for t in all_tasks if t.division == div_id]
-            employees = self._cfg.employees_in_division(div_id)
-            heartbeat = dm.get_heartbeat(div_id)
-            # Trim to a reasonable summary length
-            summary = heartbeat[:500].rstrip()
-            if len(heartbeat) > 500:
-                summary += "\n..."
-
-            director_name = ""
-            director_emp = dm.get_director(div_id)
-            if director_emp is not None:
-                director_name = director_emp.name
-
-            entries.append(
-                StandupEntry(
-                    division_id=div_id,
-                    division_name=div_cfg.name,
-                    director=director_name,
-                    employee_count=len(employees),
-                    active_tasks=div_tasks,
-                    heartbeat_summary=summary,
-                )
-            )
+        from .standup import StandupCollector
+
+        collector = StandupCollector(self._cfg)
+        if division_timeout is not None:
+            collector.division_timeout = division_timeout
+        return collector.collect(self._load_active_tasks(), division_ids)
 
-        return entries
+    def format_standup(
+        self,
+        entries: list[StandupEntry] | None = None,
+        *,
+        sections: StandupSectionCache | None = None,
+        changed_only: bool = False,
+    ) -> str:
+        """Return a Markdown-formatted daily standup report.
 
-    def format_standup(self, entries: list[StandupEntry] | None = None) -> str:
-        """Return a Markdown-formatted daily standup report."""
+        With a *sections* cache, *changed_only* leaves out the sections
+        that read the same as when the cache was written.
+        """
         if entries is None:
             entries = self.daily_standup()
 
@@ -289,27 +458,60 @@ class Orchestrator:
             "",
         ]
 
+        included = 0
         for entry in entries:
-            lines.append(f"## {entry.division_name}")
-            lines.append(f"- Director: {entry.director or '(none)'}")
-            lines.append(f"- Employees: {entry.employee_count}")
-            lines.append(f"- Active tasks: {len(entry.active_tasks)}")
-
-            if entry.active_tasks:
-                lines.append("")
-                lines.append("### Tasks")
-                for t in entry.active_tasks:
-                    lines.append(
-                        f"- [{t.status}] **{t.title}** (-> {t.assignee})"
-                    )
+            if sections is None:
+                lines.append(self.format_standup_section(entry))
+                included += 1
+                continue
+            section = sections.section(entry, self.format_standup_section)
+            if changed_only and entry.division_id not in sections.changed:
+                continue
+            lines.append(section)
+            included += 1
+
+        if changed_only and not included:
+            lines.append("*No changes since the last standup.*")
+            lines.append("")
+
+        return "\n".join(lines)
 
+    @staticmethod
+    def format_standup_section(entry: StandupEntry) -> str:
+        """Return the Markdown section for one division's standup entry."""
+        lines: list[str] = []
+        lines.append(f"## {entry.division_name}")
+        lines.append(f"- Director: {entry.director or '(none)'}")
+        lines.append(f"- Employees: {entry.employee_count}")
+        lines.append(f"- Active tasks: {len(entry.active_tasks)}")
+
+        if entry.active_tasks:
             lines.append("")
-            lines.append("### Heartbeat")
-            # Indent the heartbeat content for readability
-            for hb_line in entry.heartbeat_summary.splitlines():
-                lines.append(f"> {hb_line}")
+            lines.append("### Tasks")
+            for t in entry.active_tasks:
+                flag = "" if t.priority == DEFAULT_PRIORITY else f"[{t.priority_name}]"
+                lines.append(
+                    f"- [{t.status}]{flag} **{t.title}** (-> {t.assignee})"
+                )
+
+        if entry.employees:
             lines.append("")
+            lines.append("### Team")
+            for emp in entry.employees:
+                updated = emp.heartbeat_updated or "no heartbeat"
+                lines.append(
+                    f"- {emp.name} ({emp.role}, {emp.status}): "
+                    f"{emp.task_count} task(s), heartbeat {updated}"
+                )
 
+        lines.append("")
+        lines.append("### Heartbeat")
+        if entry.timed_out:
+            lines.append("> *(heartbeat read timed out)*")
+        # Indent the heartbeat content for readability
+        for hb_line in entry.heartbeat_summary.splitlines():
+            lines.append(f"> {hb_line}")
+        lines.append("")
         return "\n".join(lines)
 
     # ------------------------------------------------------------------
@@ -397,11 +599,33 @@ class Orchestrator:
 # ---------------------------------------------------------------------------
 
 
+def _started(data: dict[str, Any]) -> str:
+    """Parse ``started``; tasks saved before the field existed count as started.
+
+    Those tasks were already handed out, so they are treated as in progress
+    since their creation date (written back on the next save) rather than
+    as unstarted work that may be moved or sent again.
+    """
+    if "started" in data:
+        return str(data["started"] or "")
+    return str(data.get("created") or date.today().isoformat())
+
+
+def _priority(value: Any) -> int:
+    """Parse a stored priority (a level number or name); default if absent."""
+    if isinstance(value, str) and value.strip().lower() in PRIORITIES:
+        return PRIORITIES[value.strip().lower()]
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_PRIORITY
+
+
 def _load_yaml(path: Path) -> dict:
     if not path.exists():
         return {}
     with path.open("r", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh)
+        data = yaml.load(fh, Loader=_YAML_LOADER)
     return data if isinstance(data, dict) else {}
 
 
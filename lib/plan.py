@@ -0,0 +1,266 @@
+"""Critical-path analysis of the task dependency graph.
+
+Open board tasks form a DAG through their ``depends_on`` lists.  Each
+task's duration is estimated from history: the median start-to-completion
+time of archived tasks done by employees of the same role (see
+:meth:`BoardIndex.durations`), falling back to the company-wide median
+and then to *default_hours*.  A started task only counts its remaining
+time.
+
+:func:`critical_path` runs the classic forward and backward passes over
+a topological order (Kahn's algorithm), so it is O(tasks + dependencies).
+It yields every task's earliest and latest start and finish, its slack,
+and the chain of zero-slack tasks that fixes the completion time.
+Dependencies on tasks that are no longer on the board count as done.
+Who does the work is not modelled: two tasks of one employee may overlap.
+
+Usage::
+
+    plan = ProjectPlanner(cfg).plan()
+    plan.finish_at            # estimated completion (datetime)
+    plan.critical             # task IDs on the critical path, in order
+    plan.tasks["2026-02-05-001"].slack
+"""
+
+from __future__ import annotations
+
+import statistics
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from .board import BoardIndex
+from .config import CompanyConfig
+from .orchestrator import Orchestrator, Task
+
+
+DEFAULT_HOURS = 8.0
+
+# Slack below this many hours counts as zero (float rounding).
+_EPSILON = 1e-6
+
+
+@dataclass(frozen=True, slots=True)
+class TaskSchedule:
+    """CPM figures for one task, in hours from the analysis time."""
+
+    task: Task
+    duration: float
+    earliest_start: float
+    earliest_finish: float
+    latest_start: float
+    latest_finish: float
+
+    @property
+    def slack(self) -> float:
+        return self.latest_start - self.earliest_start
+
+    @property
+    def critical(self) -> bool:
+        return self.slack <= _EPSILON
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "task": self.task.id,
+            "title": self.task.title,
+            "assignee": self.task.assignee,
+            "depends_on": self.task.depends_on,
+            "duration_hours": round(self.duration, 2),
+            "earliest_start": round(self.earliest_start, 2),
+            "earliest_finish": round(self.earliest_finish, 2),
+            "latest_start": round(self.latest_start, 2),
+            "latest_finish": round(self.latest_finish, 2),
+            "slack_hours": round(self.slack, 2),
+            "critical": self.critical,
+        }
+
+
+@dataclass(slots=True)
+class ProjectPlan:
+    """The schedule of every open task plus the critical path."""
+
+    now: datetime
+    tasks: dict[str, TaskSchedule] = field(default_factory=dict)  # topo order
+    critical: list[str] = field(default_factory=list)
+    missing: dict[str, list[str]] = field(default_factory=dict)  # unknown deps
+
+    @property
+    def makespan(self) -> float:
+        """Hours until every open task is done."""
+        return max((s.earliest_finish for s in self.tasks.values()), default=0.0)
+
+    @property
+    def finish_at(self) -> datetime:
+        return self.now + timedelta(hours=self.makespan)
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "now": self.now.isoformat(timespec="seconds"),
+            "makespan_hours": round(self.makespan, 2),
+            "finish_at": self.finish_at.isoformat(timespec="minutes"),
+            "critical_path": self.critical,
+            "tasks": [s.to_dict() for s in self.tasks.values()],
+            "missing_dependencies": self.missing,
+        }
+
+
+def critical_path(
+    tasks: list[Task],
+    durations: dict[str, float],
+    *,
+    now: datetime | None = None,
+) -> ProjectPlan:
+    """Schedule *tasks* given each task's duration in hours.
+
+    Raises ``ValueError`` if the dependencies contain a cycle.
+    """
+    now = now or datetime.now()
+    by_id = {t.id: t for t in tasks}
+    successors: dict[str, list[str]] = {tid: [] for tid in by_id}
+    indegree = dict.fromkeys(by_id, 0)
+    missing: dict[str, list[str]] = {}
+    for task in by_id.values():
+        for dep in dict.fromkeys(task.depends_on):  # de-duplicated, in order
+            if dep in by_id:
+                successors[dep].append(task.id)
+                indegree[task.id] += 1
+            else:
+                missing.setdefault(task.id, []).append(dep)
+
+    # Kahn's algorithm doubles as the forward pass.
+    order: list[str] = []
+    start = dict.fromkeys(by_id, 0.0)
+    queue = deque(tid for tid, n in indegree.items() if n == 0)
+    while queue:
+        tid = queue.popleft()
+        order.append(tid)
+        finish = start[tid] + durations[tid]
+        for succ in successors[tid]:
+            if finish > start[succ]:
+                start[succ] = finish
+            indegree[succ] -= 1
+            if indegree[succ] == 0:
+                queue.append(succ)
+    if len(order) != len(by_id):
+        cyclic = sorted(tid for tid, n in indegree.items() if n > 0)
+        raise ValueError(f"Dependency cycle among tasks: {', '.join(cyclic)}")
+
+    makespan = max((start[t] + durations[t] for t in order), default=0.0)
+    latest_finish = dict.fromkeys(by_id, makespan)
+    for tid in reversed(order):
+        for succ in successors[tid]:
+            succ_start = latest_finish[succ] - durations[succ]
+            if succ_start < latest_finish[tid]:
+                latest_finish[tid] = succ_start
+
+    schedule = {
+        tid: TaskSchedule(
+            task=by_id[tid],
+            duration=durations[tid],
+            earliest_start=start[tid],
+            earliest_finish=start[tid] + durations[tid],
+            latest_start=latest_finish[tid] - durations[tid],
+            latest_finish=latest_finish[tid],
+        )
+        for tid in order
+    }
+    return ProjectPlan(
+        now=now,
+        tasks=schedule,
+        critical=_chain(schedule, successors, makespan),
+        missing=missing,
+    )
+
+
+class ProjectPlanner:
+    """Estimate durations from the archive and schedule the active board."""
+
+    def __init__(
+        self,
+        config: CompanyConfig,
+        *,
+        board: BoardIndex | None = None,
+        default_hours: float = DEFAULT_HOURS,
+    ) -> None:
+        self._cfg = config
+        self._orch = Orchestrator(config)
+        self._board = board or BoardIndex(config)
+        self.default_hours = default_hours
+
+    def estimates(self) -> tuple[dict[str, float], float]:
+        """Return median hours per task by role, and over all history."""
+        per_role: dict[str, list[float]] = {}
+        everything: list[float] = []
+        for assignee, hours in self._board.durations().items():
+            everything.extend(hours)
+            emp = self._cfg.employees.get(assignee)
+            if emp is not None:
+                per_role.setdefault(emp.role, []).extend(hours)
+        by_role = {role: statistics.median(h) for role, h in per_role.items() if h}
+        overall = statistics.median(everything) if everything else self.default_hours
+        return by_role, overall
+
+    def plan(
+        self,
+        tasks: list[Task] | None = None,
+        *,
+        now: datetime | None = None,
+    ) -> ProjectPlan:
+        """Schedule *tasks* (the active board by default)."""
+        now = now or datetime.now()
+        if tasks is None:
+            tasks = self._orch.list_tasks()
+        by_role, overall = self.estimates()
+
+        durations: dict[str, float] = {}
+        for task in tasks:
+            emp = self._cfg.employees.get(task.assignee)
+            hours = by_role.get(emp.role, overall) if emp is not None else overall
+            if task.started:
+                try:
+                    elapsed = now - datetime.fromisoformat(task.started)
+                except ValueError:
+                    elapsed = timedelta(0)
+                # Overrunning tasks still need some time to finish.
+                hours = max(hours - elapsed.total_seconds() / 3600, hours * 0.1)
+            durations[task.id] = hours
+        return critical_path(tasks, durations, now=now)
+
+    def __repr__(self) -> str:
+        return f"ProjectPlanner(default_hours={self.default_hours:g})"
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _chain(
+    schedule: dict[str, TaskSchedule],
+    successors: dict[str, list[str]],
+    makespan: float,
+) -> list[str]:
+    """Follow zero-slack tasks from a start task to one ending at *makespan*."""
+    first = [
+        tid
+        for tid, s in schedule.items()
+        if s.critical and s.earliest_start <= _EPSILON
+    ]
+    if not first:
+        return []
+    chain = [min(first, key=lambda tid: schedule[tid].earliest_finish)]
+    while schedule[chain[-1]].earliest_finish < makespan - _EPSILON:
+        finish = schedule[chain[-1]].earliest_finish
+        nxt = next(
+            (
+                succ
+                for succ in successors[chain[-1]]
+                if schedule[succ].critical
+                and abs(schedule[succ].earliest_start - finish) <= _EPSILON
+            ),
+            None,
+        )
+        if nxt is None:
+            break
+        chain.append(nxt)
+    return chain
@@ -0,0 +1,199 @@
+"""Priority ready queues with aging.
+
+A task is *ready* when it is active, its assignee has not started it and
+none of its ``depends_on`` tasks is still on the board.  Tasks saved
+before the board recorded ``started`` load as started (see
+:meth:`Task.from_dict`), so work handed out earlier is never re-queued.  Ready tasks are
+ordered by priority (``0`` urgent ... ``3`` low, see
+:data:`~lib.orchestrator.PRIORITIES`), but every
+``runtime.priority_aging_hours`` a task has waited since it was created
+counts as one level more urgent, so low-priority work cannot starve.
+
+All waiting tasks age at the same rate, so the effective priority at any
+moment, ``priority - (now - created) / aging``, orders tasks exactly like
+the time-independent key ``priority + created / aging``.  The heaps are
+therefore never re-keyed: push and pop are O(log n).
+
+Usage::
+
+    queues = ReadyQueues.from_tasks(orch.list_tasks(), aging_hours=24)
+    task = queues.pop(assignee="director-chen")   # that employee's next task
+    task = queues.pop(division="content-studio")  # the division's next task
+    task = queues.pop()                            # the company's next task
+
+    tasks.sort(key=lambda t: work_order(t, 24))    # display order
+"""
+
+from __future__ import annotations
+
+import heapq
+from datetime import date, datetime
+
+from .orchestrator import Task
+
+
+def is_ready(task: Task) -> bool:
+    """Return True if *task* is waiting to be started."""
+    return task.status == "active" and not task.started
+
+
+def priority_key(task: Task, aging_hours: float) -> tuple[float, str]:
+    """Return the heap key of *task*; smaller keys are served first."""
+    created = _created_hours(task.created)
+    if aging_hours > 0:
+        return (task.priority + created / aging_hours, task.id)
+    return (task.priority * 1e9 + created, task.id)
+
+
+def work_order(task: Task, aging_hours: float) -> tuple[int, tuple[float, str]]:
+    """Sort key for listing tasks: in progress, then ready by key, then blocked."""
+    if task.status == "blocked":
+        group = 2
+    elif task.started:
+        group = 0
+    else:
+        group = 1
+    return (group, priority_key(task, aging_hours))
+
+
+class ReadyQueues:
+    """Ready tasks in one heap per assignee, per division, and overall.
+
+    A popped or discarded task disappears from every heap; stale heap
+    entries are skipped lazily on the next pop.
+    """
+
+    def __init__(self, aging_hours: float = 24) -> None:
+        self.aging_hours = aging_hours
+        self._tasks: dict[str, Task] = {}
+        self._all: list[tuple[tuple[float, str], str]] = []
+        self._by_assignee: dict[str, list[tuple[tuple[float, str], str]]] = {}
+        self._by_division: dict[str, list[tuple[tuple[float, str], str]]] = {}
+
+    @classmethod
+    def from_tasks(
+        cls,
+        tasks: list[Task],
+        aging_hours: float = 24,
+        *,
+        open_ids: set[str] | None = None,
+    ) -> ReadyQueues:
+        """Build the queues from board tasks, keeping only the ready ones.
+
+        A task waits while one of its dependencies is in *open_ids* (the
+        board tasks not yet completed; by default the IDs of *tasks*).
+        """
+        queues = cls(aging_hours)
+        if open_ids is None:
+            open_ids = {t.id for t in tasks}
+        for task in tasks:
+            if not is_ready(task) or task.id in queues._tasks:
+                continue
+            if any(dep in open_ids for dep in task.depends_on):
+                continue
+            entry = (priority_key(task, aging_hours), task.id)
+            queues._tasks[task.id] = task
+            queues._all.append(entry)
+            queues._by_assignee.setdefault(task.assignee, []).append(entry)
+            queues._by_division.setdefault(task.division, []).append(entry)
+        for heap in (
+            queues._all,
+            *queues._by_assignee.values(),
+            *queues._by_division.values(),
+        ):
+            heapq.heapify(heap)
+        return queues
+
+    # ------------------------------------------------------------------
+    # Queue operations
+    # ------------------------------------------------------------------
+
+    def push(self, task: Task) -> None:
+        """Add a ready task (or re-add one that was popped)."""
+        if not is_ready(task):
+            raise ValueError(f"Task '{task.id}' is not ready")
+        entry = (priority_key(task, self.aging_hours), task.id)
+        self._tasks[task.id] = task
+        heapq.heappush(self._all, entry)
+        heapq.heappush(self._by_assignee.setdefault(task.assignee, []), entry)
+        heapq.heappush(self._by_division.setdefault(task.division, []), entry)
+
+    def peek(
+        self,
+        *,
+        assignee: str | None = None,
+        division: str | None = None,
+    ) -> Task | None:
+        """Return the next task without removing it."""
+        heap = self._heap(assignee, division)
+        while heap and heap[0][1] not in self._tasks:
+            heapq.heappop(heap)
+        return self._tasks[heap[0][1]] if heap else None
+
+    def pop(
+        self,
+        *,
+        assignee: str | None = None,
+        division: str | None = None,
+    ) -> Task | None:
+        """Remove and return the next task (None if the queue is empty)."""
+        task = self.peek(assignee=assignee, division=division)
+        if task is not None:
+            heapq.heappop(self._heap(assignee, division))
+            del self._tasks[task.id]
+        return task
+
+    def discard(self, task_id: str) -> None:
+        """Drop a task from every queue (no-op if it is not queued)."""
+        self._tasks.pop(task_id, None)
+
+    def assignees(self) -> list[str]:
+        """Employees with at least one ready task."""
+        return sorted({t.assignee for t in self._tasks.values()})
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _heap(
+        self,
+        assignee: str | None,
+        division: str | None,
+    ) -> list[tuple[tuple[float, str], str]]:
+        if assignee is not None and division is not None:
+            raise ValueError("Pass assignee or division, not both")
+        if assignee is not None:
+            return self._by_assignee.get(assignee, [])
+        if division is not None:
+            return self._by_division.get(division, [])
+        return self._all
+
+    # ------------------------------------------------------------------
+    # Dunder helpers
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._tasks
+
+    def __repr__(self) -> str:
+        return (
+            f"ReadyQueues(tasks={len(self._tasks)}, "
+            f"assignees={len(self._by_assignee)}, aging_hours={self.aging_hours:g})"
+        )
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _created_hours(created: str) -> float:
+    """Hours since the epoch for an ISO date or datetime (today if unparsable)."""
+    try:
+        moment = datetime.fromisoformat(created)
+    except ValueError:
+        moment = datetime.combine(date.today(), datetime.min.time())
+    return moment.timestamp() / 3600
@@ -0,0 +1,263 @@
+"""Work stealing between idle and overloaded employees.
+
+Within each division -- and, with ``runtime.rebalance_same_role``, within
+each role of that division -- an employee with no active or blocked tasks
+takes one unstarted task from the peer with the longest queue, as long as
+that queue holds at least ``runtime.rebalance_min_queue`` tasks.  The
+newest movable task is taken, so the donor keeps working in order.
+
+A task may move only if its assignee has not started it (see
+:meth:`Orchestrator.start_task`) and it is active, or blocked as well when
+``runtime.rebalance_blocked`` is on.  Tasks from boards written before
+``started`` existed load as started, so work already handed out stays
+put.  Moves go through
+:meth:`Orchestrator.assign_task`; afterwards every affected employee gets
+one gateway message listing all of their gained and lost tasks.
+
+Usage::
+
+    balancer = Rebalancer(cfg)
+    report = balancer.rebalance_once()             # one tick, e.g. from cron
+    report = balancer.rebalance_once(dry_run=True)
+
+    balancer.run(interval=300, on_report=print)    # daemon
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from .config import CompanyConfig
+from .openclaw import CommandResult, OpenClawGateway
+from .orchestrator import Orchestrator, Task
+
+
+@dataclass(frozen=True, slots=True)
+class Move:
+    """One task moved from an overloaded to an idle employee."""
+
+    task: Task
+    source: str
+    target: str
+
+    def to_dict(self) -> dict[str, str]:
+        return {
+            "task": self.task.id,
+            "title": self.task.title,
+            "from": self.source,
+            "to": self.target,
+        }
+
+
+@dataclass(slots=True)
+class RebalanceReport:
+    """The outcome of one rebalancing pass."""
+
+    moves: list[Move] = field(default_factory=list)
+    notified: dict[str, CommandResult] = field(default_factory=dict)
+    dry_run: bool = False
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "dry_run": self.dry_run,
+            "moves": [m.to_dict() for m in self.moves],
+            "notified": {eid: r.ok for eid, r in self.notified.items()},
+        }
+
+
+class Rebalancer:
+    """Move unstarted tasks from long queues to idle peers.
+
+    The rules default to the ``rebalance_*`` settings of
+    :class:`~lib.config.RuntimeConfig`.
+    """
+
+    def __init__(
+        self,
+        config: CompanyConfig,
+        *,
+        gateway: OpenClawGateway | None = None,
+        min_queue: int | None = None,
+        same_role: bool | None = None,
+        move_blocked: bool | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        rt = config.runtime
+        self._cfg = config
+        self._orch = Orchestrator(config)
+        self._gateway = gateway
+        self.min_queue = max(
+            2, rt.rebalance_min_queue if min_queue is None else min_queue
+        )
+        self.same_role = rt.rebalance_same_role if same_role is None else same_role
+        self.move_blocked = (
+            rt.rebalance_blocked if move_blocked is None else move_blocked
+        )
+        self._clock = clock
+        self._sleep = sleep
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def plan(self, division_ids: list[str] | None = None) -> list[Move]:
+        """Return the moves one pass would make, without making them."""
+        tasks = self._orch.list_tasks()
+        queues: dict[str, list[Task]] = {}
+        for task in tasks:
+            if task.status in ("active", "blocked"):
+                queues.setdefault(task.assignee, []).append(task)
+
+        moves: list[Move] = []
+        for members in self._groups(division_ids).values():
+            moves.extend(self._plan_group(members, queues))
+        return moves
+
+    def rebalance_once(
+        self,
+        division_ids: list[str] | None = None,
+        *,
+        dry_run: bool = False,
+        notify: bool = True,
+    ) -> RebalanceReport:
+        """Plan and apply one pass, then notify the employees involved.
+
+        Planning and moving happen under the board lock, so no task can be
+        started, completed or moved by someone else in between.
+        """
+        if dry_run:
+            return RebalanceReport(moves=self.plan(division_ids), dry_run=True)
+        with self._orch.locked():
+            report = RebalanceReport(moves=self.plan(division_ids))
+            for move in report.moves:
+                self._orch.assign_task(move.task.id, move.target)
+        if not report.moves:
+            return report
+        if notify:
+            report.notified = self._notify(report.moves)
+        return report
+
+    def run(
+        self,
+        *,
+        interval: float = 300.0,
+        iterations: int | None = None,
+        division_ids: list[str] | None = None,
+        notify: bool = True,
+        on_report: Callable[[RebalanceReport], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> None:
+        """Rebalance every *interval* seconds until interrupted.
+
+        With *on_error*, a pass that raises is reported to it and the loop
+        carries on with the next pass; without it the error propagates.
+        """
+        rounds = 0
+        while iterations is None or rounds < iterations:
+            started = self._clock()
+            try:
+                report = self.rebalance_once(division_ids, notify=notify)
+            except Exception as exc:
+                if on_error is None:
+                    raise
+                on_error(exc)
+            else:
+                if report.moves and on_report is not None:
+                    on_report(report)
+            rounds += 1
+            if iterations is None or rounds < iterations:
+                self._sleep(max(0.0, interval - (self._clock() - started)))
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _groups(
+        self,
+        division_ids: list[str] | None,
+    ) -> dict[tuple[str, str], list[str]]:
+        """Active employees grouped by division (and role)."""
+        groups: dict[tuple[str, str], list[str]] = {}
+        for emp in self._cfg.employees.values():
+            if emp.status != "active":
+                continue
+            if division_ids is not None and emp.division not in division_ids:
+                continue
+            key = (emp.division, emp.role if self.same_role else "")
+            groups.setdefault(key, []).append(emp.id)
+        return groups
+
+    def _plan_group(
+        self,
+        members: list[str],
+        queues: dict[str, list[Task]],
+    ) -> list[Move]:
+        load = {eid: len(queues.get(eid, [])) for eid in members}
+        movable = {
+            eid: [t for t in queues.get(eid, []) if self._movable(t)]
+            for eid in members
+        }
+        moves: list[Move] = []
+        # Each idle employee steals at most one task per pass.
+        for thief in sorted(eid for eid in members if load[eid] == 0):
+            donors = [
+                eid
+                for eid in members
+                if load[eid] >= self.min_queue and movable[eid]
+            ]
+            if not donors:
+                break
+            donor = max(donors, key=lambda eid: (load[eid], eid))
+            task = movable[donor].pop()
+            load[donor] -= 1
+            load[thief] += 1
+            moves.append(Move(task=task, source=donor, target=thief))
+        return moves
+
+    def _movable(self, task: Task) -> bool:
+        if task.started:
+            return False
+        return task.status == "active" or (
+            self.move_blocked and task.status == "blocked"
+        )
+
+    def _notify(self, moves: list[Move]) -> dict[str, CommandResult]:
+        """Send each affected employee one message covering all their moves."""
+        gained: dict[str, list[Move]] = {}
+        lost: dict[str, list[Move]] = {}
+        for move in moves:
+            gained.setdefault(move.target, []).append(move)
+            lost.setdefault(move.source, []).append(move)
+
+        gateway = self._gateway
+        if gateway is None:
+            gateway = self._gateway = OpenClawGateway(self._cfg)
+        results: dict[str, CommandResult] = {}
+        for eid in sorted(gained.keys() | lost.keys()):
+            lines = ["Your task queue was rebalanced."]
+            for move in gained.get(eid, []):
+                lines.append(
+                    f"\n+ Now yours (from {move.source}): {move.task.title}\n"
+                    f"  ID: {move.task.id}\n"
+                    f"  Description: {move.task.description}"
+                )
+            for move in lost.get(eid, []):
+                lines.append(
+                    f"\n- Moved to {move.target}: {move.task.title} "
+                    f"({move.task.id}); no need to start it."
+                )
+            results[eid] = gateway.send_message(eid, "\n".join(lines))
+        return results
+
+    # ------------------------------------------------------------------
+    # Dunder helpers
+    # ------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return (
+            f"Rebalancer(min_queue={self.min_queue}, same_role={self.same_role}, "
+            f"move_blocked={self.move_blocked})"
+        )
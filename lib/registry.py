@@ -0,0 +1,270 @@
+"""Multi-company registry for VWork.
+
+Serves several company roots (separate ``company.yaml`` trees) from a
+single process.  Loaded :class:`CompanyConfig` objects -- together with
+their :class:`Orchestrator` and :class:`DivisionManager` -- are kept in an
+LRU bounded both by entry count and by estimated memory, and are reloaded
+transparently when one of the company's YAML sources changes on disk.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .config import CompanyConfig
+from .division import DivisionManager
+from .orchestrator import Orchestrator
+
+
+# YAML files (relative to a company root) whose changes invalidate an entry
+_SOURCE_FILES = (
+    "company.yaml",
+    "org/divisions.yaml",
+    "org/roles.yaml",
+    "org/employees.yaml",
+)
+
+
+@dataclass(slots=True)
+class CompanyHandle:
+    """Warm per-company objects held by the registry."""
+
+    root: Path
+    config: CompanyConfig
+    source_key: tuple[tuple[int, int], ...]
+    size: int  # estimated bytes retained by the parsed config
+    _orchestrator: Orchestrator | None = None
+    _divisions: DivisionManager | None = None
+
+    @property
+    def orchestrator(self) -> Orchestrator:
+        if self._orchestrator is None:
+            self._orchestrator = Orchestrator(self.config)
+        return self._orchestrator
+
+    @property
+    def divisions(self) -> DivisionManager:
+        if self._divisions is None:
+            self._divisions = DivisionManager(self.config)
+        return self._divisions
+
+
+@dataclass(slots=True)
+class RegistryStats:
+    """Counters describing registry effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    reloads: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class CompanyRegistry:
+    """LRU of loaded company roots.
+
+    Usage::
+
+        registry = CompanyRegistry(max_companies=8, max_bytes=32 * 1024**2)
+
+        orch = registry.orchestrator(Path("/srv/vwork-a"))
+        orch.create_task(...)
+
+        for div in registry.divisions(Path("/srv/vwork-b")).list_divisions():
+            print(div.name)
+
+    An entry is evicted (least recently used first) when either limit is
+    exceeded; the entry just requested is never evicted, so a single very
+    large company still loads.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_companies: int = 16,
+        max_bytes: int = 64 * 1024 * 1024,
+        check_sources: bool = True,
+    ) -> None:
+        if max_companies < 1:
+            raise ValueError("max_companies must be at least 1")
+        self._max_companies = max_companies
+        self._max_bytes = max_bytes
+        self._check_sources = check_sources
+        self._entries: OrderedDict[Path, CompanyHandle] = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats = RegistryStats()
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def get(self, root: Path) -> CompanyHandle:
+        """Return the warm handle for *root*, loading it if necessary."""
+        key = root.resolve()
+        with self._lock:
+            handle = self._entries.get(key)
+            if handle is not None:
+                if self._check_sources and _source_key(key) != handle.source_key:
+                    self._stats.reloads += 1
+                    self._drop(key)
+                else:
+                    self._stats.hits += 1
+                    self._entries.move_to_end(key)
+                    return handle
+
+            self._stats.misses += 1
+            handle = self._load(key)
+            self._entries[key] = handle
+            self._stats.bytes += handle.size
+            self._evict(keep=key)
+            return handle
+
+    def config(self, root: Path) -> CompanyConfig:
+        """Return the loaded :class:`CompanyConfig` for *root*."""
+        return self.get(root).config
+
+    def orchestrator(self, root: Path) -> Orchestrator:
+        """Return the cached :class:`Orchestrator` for *root*."""
+        return self.get(root).orchestrator
+
+    def divisions(self, root: Path) -> DivisionManager:
+        """Return the cached :class:`DivisionManager` for *root*."""
+        return self.get(root).divisions
+
+    # ------------------------------------------------------------------
+    # Management
+    # ------------------------------------------------------------------
+
+    def evict(self, root: Path) -> bool:
+        """Drop *root* from the registry; return whether it was loaded."""
+        with self._lock:
+            key = root.resolve()
+            if key not in self._entries:
+                return False
+            self._drop(key)
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats.bytes = 0
+
+    def roots(self) -> list[Path]:
+        """Return loaded roots, least recently used first."""
+        with self._lock:
+            return list(self._entries)
+
+    @property
+    def stats(self) -> RegistryStats:
+        with self._lock:
+            self._stats.entries = len(self._entries)
+            return RegistryStats(**{
+                name: getattr(self._stats, name)
+                for name in RegistryStats.__slots__
+            })
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _load(root: Path) -> CompanyHandle:
+        # Stat before parsing so a concurrent edit forces a later reload.
+        source_key = _source_key(root)
+        config = CompanyConfig(root)
+        return CompanyHandle(
+            root=root,
+            config=config,
+            source_key=source_key,
+            size=estimate_size(config),
+        )
+
+    def _drop(self, key: Path) -> None:
+        handle = self._entries.pop(key)
+        self._stats.bytes -= handle.size
+
+    def _evict(self, *, keep: Path) -> None:
+        while len(self._entries) > 1 and (
+            len(self._entries) > self._max_companies
+            or self._stats.bytes > self._max_bytes
+        ):
+            oldest = next(iter(self._entries))
+            if oldest == keep:
+                break
+            self._drop(oldest)
+            self._stats.evictions += 1
+
+    # ------------------------------------------------------------------
+    # Dunder helpers
+    # ------------------------------------------------------------------
+
+    def __contains__(self, root: object) -> bool:
+        return isinstance(root, Path) and root.resolve() in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"CompanyRegistry(companies={len(self._entries)}, "
+            f"bytes={self._stats.bytes})"
+        )
+
+
+# ---------------------------------------------------------------------------
+# Module-level helpers
+# ---------------------------------------------------------------------------
+
+
+def _source_key(root: Path) -> tuple[tuple[int, int], ...]:
+    """Return (mtime_ns, size) for each YAML source under *root*."""
+    key: list[tuple[int, int]] = []
+    for rel in _SOURCE_FILES:
+        try:
+            st = os.stat(root / rel)
+        except FileNotFoundError:
+            key.append((0, -1))
+            continue
+        key.append((st.st_mtime_ns, st.st_size))
+    return tuple(key)
+
+
+def estimate_size(obj: Any) -> int:
+    """Approximate the bytes retained by *obj* and everything it references.
+
+    Walks dicts, sequences, ``__dict__`` and ``__slots__`` attributes,
+    counting each object once.
+    """
+    seen: set[int] = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        cur = stack.pop()
+        if id(cur) in seen:
+            continue
+        seen.add(id(cur))
+        total += sys.getsizeof(cur)
+        if isinstance(cur, (str, bytes, int, float, bool)) or cur is None:
+            continue
+        if isinstance(cur, dict):
+            stack.extend(cur.keys())
+            stack.extend(cur.values())
+        elif isinstance(cur, (list, tuple, set, frozenset)):
+            stack.extend(cur)
+        elif isinstance(cur, Path):
+            stack.append(str(cur))
+        else:
+            if hasattr(cur, "__dict__"):
+                stack.append(vars(cur))
+            for klass in type(cur).__mro__:
+                for slot in getattr(klass, "__slots__", ()):
+                    if hasattr(cur, slot):
+                        stack.append(getattr(cur, slot))
+    return total
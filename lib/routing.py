@@ -0,0 +1,275 @@
+"""Per-message model tiers: default_model unless premium is warranted.
+
+Agents are registered on their base model (the role's ``model`` or
+``runtime.default_model``), and most messages stay there; the tier of a
+message is ``premium`` whenever it runs on ``runtime.premium_model``.  When
+``runtime.model_routing`` is on, :class:`ModelRouter` sends a message on
+``runtime.premium_model`` instead if one of these holds, checked in this
+order:
+
+``priority``
+    the task is at ``runtime.premium_priority`` or more urgent;
+``role``
+    the recipient's role is in ``runtime.premium_roles``;
+``retry``
+    the task was already dispatched ``runtime.premium_after_attempts``
+    times (its earlier leases ran out);
+``size``
+    the message, or the task description, is at least
+    ``runtime.premium_min_tokens`` estimated tokens.
+
+:class:`~lib.openclaw.OpenClawGateway` routes every ``send_message`` call
+and appends the decision, the message size, the gateway latency and the
+outcome to ``.vwork/routing.jsonl``, so each tier's share of traffic,
+latency and token volume can be compared with :func:`summarise`.
+
+Usage::
+
+    router = ModelRouter(cfg)
+    decision = router.route("director-chen", message, task=task)
+    decision.tier, decision.model, decision.reason
+
+    stats = summarise(router.log.records(since=time.time() - 7 * 86400))
+    stats["premium"].p95_seconds
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .config import CompanyConfig
+from .context import estimate_tokens
+
+if TYPE_CHECKING:
+    from .orchestrator import Task
+
+
+LOG_FILENAME = "routing.jsonl"
+
+TIERS = ("default", "premium")
+
+
+@dataclass(frozen=True, slots=True)
+class RouteDecision:
+    """The model chosen for one message, and why."""
+
+    employee: str
+    model: str
+    tier: str  # one of TIERS
+    reason: str  # "priority", "role", "retry", "size" or "base" (no escalation)
+    tokens: int  # estimated tokens in the message
+    task: str = ""  # task ID, if the message carries a task
+
+
+class RoutingLog:
+    """Append-only JSON-lines log of routed messages."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def append(self, record: dict[str, Any]) -> bool:
+        """Append *record*; return False if the log could not be written.
+
+        Logging is best-effort: the message it describes was already sent.
+        """
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as fh:
+                fh.write(line + "\n")
+        except OSError:
+            return False  # read-only or missing state dir
+        return True
+
+    def records(self, *, since: float | None = None) -> list[dict[str, Any]]:
+        """Return the logged records, oldest first (unreadable lines skipped)."""
+        out: list[dict[str, Any]] = []
+        try:
+            fh = self.path.open("r", encoding="utf-8")
+        except OSError:
+            return out
+        with fh:
+            for line in fh:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(record, dict):
+                    continue
+                if since is not None and record.get("at", 0) < since:
+                    continue
+                out.append(record)
+        return out
+
+    def __repr__(self) -> str:
+        return f"RoutingLog(path={str(self.path)!r})"
+
+
+class ModelRouter:
+    """Pick default or premium model per message and log the outcome."""
+
+    def __init__(
+        self,
+        config: CompanyConfig,
+        *,
+        log: RoutingLog | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._cfg = config
+        self.log = log or RoutingLog(config.paths.state / LOG_FILENAME)
+        self._clock = clock
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def route(
+        self,
+        employee_id: str,
+        message: str = "",
+        *,
+        task: Task | None = None,
+    ) -> RouteDecision:
+        """Return the model *message* (about *task*, if any) should use."""
+        premium = self._cfg.runtime.premium_model
+        tokens = estimate_tokens(message)
+        reason = self._escalation(employee_id, tokens, task)
+        if reason is None:
+            model, reason = self._cfg.employee_model(employee_id), "base"
+        else:
+            model = premium
+        return RouteDecision(
+            employee=employee_id,
+            model=model,
+            # Roles registered on the premium model bill as premium anyway.
+            tier="premium" if model == premium else "default",
+            reason=reason,
+            tokens=tokens,
+            task=task.id if task is not None else "",
+        )
+
+    def record(self, decision: RouteDecision, *, ok: bool, seconds: float) -> bool:
+        """Log a routed message that took *seconds* to send (best-effort)."""
+        return self.log.append({
+            "at": round(self._clock(), 3),
+            "employee": decision.employee,
+            "task": decision.task,
+            "tier": decision.tier,
+            "model": decision.model,
+            "reason": decision.reason,
+            "tokens": decision.tokens,
+            "seconds": round(seconds, 3),
+            "ok": ok,
+        })
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _escalation(
+        self,
+        employee_id: str,
+        tokens: int,
+        task: Task | None,
+    ) -> str | None:
+        """Return why the message needs the premium model, or None."""
+        rt = self._cfg.runtime
+        if not rt.premium_model:
+            return None
+        if task is not None and 0 <= task.priority <= rt.premium_priority:
+            return "priority"
+        emp = self._cfg.employees.get(employee_id)
+        if emp is not None and emp.role in rt.premium_roles:
+            return "role"
+        attempts = rt.premium_after_attempts
+        if task is not None and attempts > 0 and task.attempts >= attempts:
+            return "retry"
+        if rt.premium_min_tokens > 0:
+            if task is not None:
+                tokens = max(tokens, estimate_tokens(task.description))
+            if tokens >= rt.premium_min_tokens:
+                return "size"
+        return None
+
+    # ------------------------------------------------------------------
+    # Dunder helpers
+    # ------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        rt = self._cfg.runtime
+        return (
+            f"ModelRouter(default={rt.default_model!r}, "
+            f"premium={rt.premium_model!r})"
+        )
+
+
+@dataclass(slots=True)
+class TierStats:
+    """Traffic, outcome and latency of one tier."""
+
+    tier: str
+    messages: int = 0
+    failed: int = 0
+    tokens: int = 0
+    seconds: list[float] = field(default_factory=list)
+    reasons: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def mean_seconds(self) -> float:
+        return sum(self.seconds) / len(self.seconds) if self.seconds else 0.0
+
+    @property
+    def p50_seconds(self) -> float:
+        return _percentile(self.seconds, 0.50)
+
+    @property
+    def p95_seconds(self) -> float:
+        return _percentile(self.seconds, 0.95)
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "tier": self.tier,
+            "messages": self.messages,
+            "failed": self.failed,
+            "tokens": self.tokens,
+            "mean_seconds": round(self.mean_seconds, 3),
+            "p50_seconds": round(self.p50_seconds, 3),
+            "p95_seconds": round(self.p95_seconds, 3),
+            "reasons": self.reasons,
+        }
+
+
+def summarise(records: Iterable[dict[str, Any]]) -> dict[str, TierStats]:
+    """Aggregate routing log records per tier (every tier is present)."""
+    stats = {tier: TierStats(tier) for tier in TIERS}
+    for record in records:
+        tier = str(record.get("tier", "default"))
+        s = stats.setdefault(tier, TierStats(tier))
+        s.messages += 1
+        if not record.get("ok", False):
+            s.failed += 1
+        s.tokens += int(record.get("tokens", 0))
+        s.seconds.append(float(record.get("seconds", 0.0)))
+        reason = str(record.get("reason", ""))
+        s.reasons[reason] = s.reasons.get(reason, 0) + 1
+    for s in stats.values():
+        s.seconds.sort()
+    return stats
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list (0.0 if empty)."""
+    if not ordered:
+        return 0.0
+    rank = max(1, -(-int(q * 100) * len(ordered) // 100))  # ceil(q * n)
+    return ordered[min(rank, len(ordered)) - 1]
@@ -0,0 +1,325 @@
+"""Memory-mapped config snapshots for multi-process workers.
+
+A parent process parses the YAML once and publishes a frozen snapshot of
+the resulting dataclasses to a file.  Workers map that file read-only and
+rehydrate a :class:`CompanyConfig` without touching any YAML, and can poll
+cheaply for a newer snapshot.
+
+File layout::
+
+    header  (magic, format, schema, version, payload length)
+    payload (marshal-encoded tuples of the dataclass field values)
+
+Usage::
+
+    cfg = CompanyConfig()
+    version = publish_snapshot(cfg)          # -> .vwork/config.snapshot
+
+    # in each worker
+    snap = ConfigSnapshot(path)
+    cfg = snap.config
+    ...
+    if snap.refresh():                       # a newer snapshot was published
+        cfg = snap.config
+"""
+
+from __future__ import annotations
+
+import marshal
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+from dataclasses import fields
+from pathlib import Path
+from typing import Any
+
+from .config import (
+    ChannelsConfig,
+    CompanyConfig,
+    CompanyInfo,
+    DivisionConfig,
+    EmployeeConfig,
+    PathsConfig,
+    ProjectRef,
+    RoleConfig,
+    RuntimeConfig,
+)
+
+
+SNAPSHOT_FILENAME = "config.snapshot"
+
+_MAGIC = b"VWCS"
+_FORMAT = 1
+# magic, format, schema fingerprint, snapshot version, payload length
+_HEADER = struct.Struct("<4sHIQQ")
+
+_SCHEMA_TYPES = (
+    CompanyInfo,
+    RuntimeConfig,
+    ChannelsConfig,
+    PathsConfig,
+    ProjectRef,
+    DivisionConfig,
+    RoleConfig,
+    EmployeeConfig,
+)
+
+# Positional encoding depends on dataclass field order, so readers refuse
+# snapshots written against a different set of fields.
+_SCHEMA = zlib.crc32(
+    "|".join(
+        f"{t.__name__}:{','.join(f.name for f in fields(t))}"
+        for t in _SCHEMA_TYPES
+    ).encode("utf-8")
+)
+
+
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+
+
+def _values(obj: Any) -> tuple[Any, ...]:
+    return tuple(getattr(obj, f.name) for f in fields(obj))
+
+
+def _encode_division(div: DivisionConfig) -> tuple[Any, ...]:
+    projects = tuple(
+        (p.id, p.name, p.type, str(p.source)) for p in div.projects
+    )
+    return (div.id, div.name, div.name_cn, div.description, div.director,
+            div.path, projects)
+
+
+def encode_config(cfg: CompanyConfig) -> bytes:
+    """Serialise *cfg* into the compact snapshot payload."""
+    payload = (
+        str(cfg.root),
+        _values(cfg.company),
+        _values(cfg.runtime),
+        _values(cfg.channels),
+        tuple(str(p) for p in _values(cfg.paths)),
+        tuple(_encode_division(d) for d in cfg.divisions.values()),
+        tuple(
+            (r.id, r.title, r.title_cn, r.level, tuple(r.permissions),
+             tuple(r.responsibilities), r.model, r.heartbeat_sla_minutes,
+             r.memory_budget_kb)
+            for r in cfg.roles.values()
+        ),
+        tuple(_values(e) for e in cfg.employees.values()),
+    )
+    return marshal.dumps(payload)
+
+
+def decode_config(payload: bytes) -> CompanyConfig:
+    """Rebuild a :class:`CompanyConfig` from a snapshot payload."""
+    root, company, runtime, channels, paths, divisions, roles, employees = (
+        marshal.loads(payload)
+    )
+    return CompanyConfig._from_parsed(
+        Path(root),
+        company=CompanyInfo(*company),
+        runtime=RuntimeConfig(*runtime),
+        channels=ChannelsConfig(*channels),
+        paths=PathsConfig(*(Path(p) for p in paths)),
+        divisions={
+            d[0]: DivisionConfig(
+                *d[:6],
+                projects=[
+                    ProjectRef(pid, name, ptype, Path(source))
+                    for pid, name, ptype, source in d[6]
+                ],
+            )
+            for d in divisions
+        },
+        roles={
+            r[0]: RoleConfig(
+                r[0], r[1], r[2], r[3],
+                permissions=list(r[4]),
+                responsibilities=list(r[5]),
+                model=r[6],
+                heartbeat_sla_minutes=r[7],
+                memory_budget_kb=r[8],
+            )
+            for r in roles
+        },
+        employees={e[0]: EmployeeConfig(*e) for e in employees},
+    )
+
+
+# ---------------------------------------------------------------------------
+# Publishing
+# ---------------------------------------------------------------------------
+
+
+def default_snapshot_path(cfg: CompanyConfig) -> Path:
+    """Return the conventional snapshot location under the state directory."""
+    return cfg.paths.state / SNAPSHOT_FILENAME
+
+
+def read_version(path: Path) -> int:
+    """Return the version stored in the snapshot at *path* (0 if absent)."""
+    try:
+        with path.open("rb") as fh:
+            header = fh.read(_HEADER.size)
+    except FileNotFoundError:
+        return 0
+    if len(header) < _HEADER.size:
+        return 0
+    magic, _fmt, _schema, version, _length = _HEADER.unpack(header)
+    return version if magic == _MAGIC else 0
+
+
+def publish_snapshot(
+    cfg: CompanyConfig,
+    path: Path | None = None,
+    *,
+    version: int | None = None,
+) -> int:
+    """Atomically publish a snapshot of *cfg* and return its version.
+
+    The version defaults to one more than the snapshot currently at *path*.
+    The file is written beside the target and renamed into place, so
+    workers that still map the previous snapshot keep a consistent view.
+    """
+    target = path or default_snapshot_path(cfg)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if version is None:
+        version = read_version(target) + 1
+
+    payload = encode_config(cfg)
+    header = _HEADER.pack(_MAGIC, _FORMAT, _SCHEMA, version, len(payload))
+
+    fd, tmp_name = tempfile.mkstemp(prefix=".snapshot-", dir=target.parent)
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(header)
+            fh.write(payload)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_name, target)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return version
+
+
+# ---------------------------------------------------------------------------
+# Attaching
+# ---------------------------------------------------------------------------
+
+
+class ConfigSnapshot:
+    """Read-only, memory-mapped view of a published config snapshot.
+
+    Attaching maps the file and validates the header; the payload is only
+    decoded on first access to :attr:`config`.  :meth:`refresh` costs one
+    ``stat`` call when nothing has been republished.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._mm: mmap.mmap | None = None
+        self._stat_key: tuple[int, int, int] | None = None
+        self._version = 0
+        self._length = 0
+        self._config: CompanyConfig | None = None
+        self._attach()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def version(self) -> int:
+        """Version of the snapshot currently attached."""
+        return self._version
+
+    @property
+    def config(self) -> CompanyConfig:
+        """The attached snapshot as a :class:`CompanyConfig`."""
+        if self._config is None:
+            assert self._mm is not None
+            start = _HEADER.size
+            self._config = decode_config(self._mm[start:start + self._length])
+        return self._config
+
+    def is_stale(self) -> bool:
+        """Return whether the file on disk differs from the attached one."""
+        try:
+            return self._file_key() != self._stat_key
+        except FileNotFoundError:
+            return False
+
+    def refresh(self) -> bool:
+        """Switch to a newer published snapshot if there is one.
+
+        Returns ``True`` when the attached version changed.
+        """
+        if not self.is_stale():
+            return False
+        previous = self._version
+        old_mm = self._mm
+        self._attach()
+        if old_mm is not None:
+            old_mm.close()
+        return self._version != previous
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _file_key(self) -> tuple[int, int, int]:
+        st = os.stat(self._path)
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _attach(self) -> None:
+        with self._path.open("rb") as fh:
+            st = os.fstat(fh.fileno())
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mm) < _HEADER.size:
+            mm.close()
+            raise ValueError(f"Truncated config snapshot: {self._path}")
+        magic, fmt, schema, version, length = _HEADER.unpack_from(mm, 0)
+        if magic != _MAGIC or fmt != _FORMAT:
+            mm.close()
+            raise ValueError(f"Not a VWork config snapshot: {self._path}")
+        if schema != _SCHEMA:
+            mm.close()
+            raise ValueError(
+                f"Config snapshot {self._path} was written by an "
+                f"incompatible version of lib.config"
+            )
+        if _HEADER.size + length > len(mm):
+            mm.close()
+            raise ValueError(f"Truncated config snapshot: {self._path}")
+
+        self._mm = mm
+        self._stat_key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        self._version = version
+        self._length = length
+        self._config = None
+
+    # ------------------------------------------------------------------
+    # Dunder helpers
+    # ------------------------------------------------------------------
+
+    def __enter__(self) -> ConfigSnapshot:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"ConfigSnapshot(path={self._path!r}, version={self._version})"
@@ -0,0 +1,537 @@
+"""Concurrent standup collection for VWork.
+
+Gathers every division's heartbeat, plus the per-employee ``HEARTBEAT.md``
+files under ``divisions/*/employees/*/``, each as its own read on a small
+pool of daemon threads.  The whole collection shares one deadline: a
+division whose reads are not all done by then (a slow network mount, or
+reads nobody got to) degrades to a "timed out" entry instead of stalling
+the report -- or the process exit, since a stuck read never holds the
+interpreter open.
+
+:class:`StandupSectionCache` keeps each division's section from the last
+delivered report, so a re-run can tell which sections read differently
+now and report just those.
+
+Usage::
+
+    collector = StandupCollector(cfg, division_timeout=2.0)
+    entries = collector.collect(orch.list_tasks())
+
+    sections = StandupSectionCache.for_config(cfg)
+    delta = orch.format_standup(entries, sections=sections, changed_only=True)
+    # ... deliver delta (below), then, once every chunk went out:
+    sections.save()
+
+Delivery splits a report into chunks that fit the channel's message limit
+and sends them concurrently across recipients, in order per recipient::
+
+    plan = plan_delivery(cfg, entries, report, relay="ops-manager-sys",
+                         route="both")
+    results = deliver(OpenClawGateway(cfg), plan)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import queue
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+
+from .config import CompanyConfig
+from .division import DivisionManager
+from .heartbeat import HeartbeatCache, HeartbeatSummary, shared_cache
+from .openclaw import CommandResult, OpenClawGateway
+from .orchestrator import EmployeeStandup, Orchestrator, StandupEntry, Task
+from .ready import work_order
+from .state import load_json, save_json
+
+
+SECTION_CACHE_FILENAME = "standup-cache.json"
+
+# Telegram rejects messages over 4096 characters; leave room for the
+# "(n/m)" chunk prefix.
+DEFAULT_CHUNK_CHARS = 4000
+
+ROUTES = ("founder", "directors", "both")
+
+# Bump when the cache layout changes so stored sections are discarded.
+_SECTION_FORMAT = 3
+
+
+@dataclass(slots=True)
+class _DivisionHeartbeats:
+    """Raw I/O results for one division, produced on a worker thread."""
+
+    division: HeartbeatSummary
+    employees: dict[str, tuple[HeartbeatSummary | None, float | None]]
+
+
+class StandupCollector:
+    """Collect :class:`StandupEntry` objects with parallel heartbeat reads.
+
+    *division_timeout* is the deadline for all reads of one
+    :meth:`collect` call, not a per-division allowance.
+    """
+
+    def __init__(
+        self,
+        config: CompanyConfig,
+        *,
+        heartbeat_cache: HeartbeatCache | None = None,
+        division_timeout: float = 5.0,
+        max_workers: int = 16,
+        division_chars: int = 500,
+        employee_chars: int = 200,
+    ) -> None:
+        self._cfg = config
+        self._heartbeats = (
+            heartbeat_cache if heartbeat_cache is not None else shared_cache()
+        )
+        self._dm = DivisionManager(config, heartbeat_cache=self._heartbeats)
+        self.division_timeout = division_timeout
+        self.max_workers = max_workers
+        self.division_chars = division_chars
+        self.employee_chars = employee_chars
+
+    # ------------------------------------------------------------------
+    # Collection
+    # ------------------------------------------------------------------
+
+    def collect(
+        self,
+        tasks: list[Task],
+        division_ids: list[str] | None = None,
+    ) -> list[StandupEntry]:
+        """Return one entry per division (in config order).
+
+        *tasks* are the active board tasks; only heartbeat reads happen on
+        the reader threads, everything else comes from the in-memory config.
+        """
+        ids = division_ids if division_ids is not None else list(self._cfg.divisions)
+        if not ids:
+            return []
+
+        results = self._read_divisions(ids)
+        entries = []
+        for div_id in ids:
+            io = results.get(div_id)
+            if isinstance(io, BaseException):
+                raise io
+            entries.append(self._build_entry(div_id, tasks, io))
+        return entries
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _read_divisions(
+        self,
+        ids: list[str],
+    ) -> dict[str, _DivisionHeartbeats | BaseException]:
+        """Read heartbeats on daemon threads until done or the deadline.
+
+        Every division ``HEARTBEAT.md`` and every employee's is a separate
+        read, so one division's files are read in parallel too.  A division
+        with any read unfinished at the shared deadline is missing from the
+        result.  The threads are daemons, so a read stuck on a dead mount
+        neither blocks this call nor process exit; unlike
+        ``concurrent.futures`` workers, they are never joined.
+        """
+        # (division, None) reads the division's heartbeat, (division,
+        # employee) one employee's.
+        reads: list[tuple[str, str | None]] = []
+        for div_id in ids:
+            reads.append((div_id, None))
+            reads.extend(
+                (div_id, emp.id) for emp in self._cfg.employees_in_division(div_id)
+            )
+        todo: queue.SimpleQueue[tuple[str, str | None]] = queue.SimpleQueue()
+        for read in reads:
+            todo.put(read)
+        divisions: dict[str, HeartbeatSummary] = {}
+        employees: dict[str, dict[str, tuple[HeartbeatSummary | None, float | None]]]
+        employees = {div_id: {} for div_id in ids}
+        errors: dict[str, BaseException] = {}
+        finished = 0
+        done = threading.Condition()
+        expired = threading.Event()
+
+        def work() -> None:
+            nonlocal finished
+            while not expired.is_set():
+                try:
+                    div_id, eid = todo.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    if eid is None:
+                        summary = self._dm.get_heartbeat_summary(
+                            div_id, max_chars=self.division_chars
+                        )
+                    else:
+                        hb = self._read_employee(eid)
+                except BaseException as exc:  # re-raised on the caller's thread
+                    with done:
+                        errors.setdefault(div_id, exc)
+                        finished += 1
+                        done.notify_all()
+                    continue
+                with done:
+                    if eid is None:
+                        divisions[div_id] = summary
+                    else:
+                        employees[div_id][eid] = hb
+                    finished += 1
+                    done.notify_all()
+
+        for _ in range(max(1, min(self.max_workers, len(reads)))):
+            threading.Thread(target=work, name="standup", daemon=True).start()
+        with done:
+            done.wait_for(
+                lambda: finished == len(reads), timeout=self.division_timeout
+            )
+            expired.set()  # leave reads nobody picked up yet
+            expected = {div_id: 0 for div_id in ids}
+            for div_id, eid in reads:
+                if eid is not None:
+                    expected[div_id] += 1
+            out: dict[str, _DivisionHeartbeats | BaseException] = dict(errors)
+            for div_id in ids:
+                complete = len(employees[div_id]) == expected[div_id]
+                if div_id in errors or div_id not in divisions or not complete:
+                    continue
+                out[div_id] = _DivisionHeartbeats(
+                    division=divisions[div_id], employees=dict(employees[div_id])
+                )
+            return out
+
+    def _read_employee(
+        self,
+        employee_id: str,
+    ) -> tuple[HeartbeatSummary | None, float | None]:
+        """Read one employee's heartbeat summary and its mtime."""
+        path = self._cfg.employee_workspace(employee_id) / "HEARTBEAT.md"
+        return (
+            self._heartbeats.summary(path, max_chars=self.employee_chars),
+            _mtime(path),
+        )
+
+    def _build_entry(
+        self,
+        division_id: str,
+        tasks: list[Task],
+        io: _DivisionHeartbeats | None,
+    ) -> StandupEntry:
+        div_cfg = self._cfg.division(division_id)
+        aging = self._cfg.runtime.priority_aging_hours
+        div_tasks = sorted(
+            (t for t in tasks if t.division == division_id),
+            key=lambda t: work_order(t, aging),
+        )
+        employees = self._cfg.employees_in_division(division_id)
+        director_emp = self._dm.get_director(division_id)
+
+        if io is None:
+            summary = f"(heartbeat not read within {self.division_timeout:g}s)"
+        else:
+            summary = io.division.text.rstrip()
+            if io.division.truncated:
+                summary += "\n..."
+
+        team: list[EmployeeStandup] = []
+        for emp in employees:
+            hb, mtime = (
+                io.employees.get(emp.id, (None, None)) if io else (None, None)
+            )
+            team.append(
+                EmployeeStandup(
+                    id=emp.id,
+                    name=emp.name,
+                    role=emp.role,
+                    status=emp.status,
+                    task_count=sum(1 for t in tasks if t.assignee == emp.id),
+                    heartbeat_summary=(
+                        hb.text.rstrip() + ("\n..." if hb.truncated else "")
+                        if hb is not None
+                        else ""
+                    ),
+                    heartbeat_updated=(
+                        datetime.fromtimestamp(mtime).isoformat(timespec="minutes")
+                        if mtime is not None
+                        else ""
+                    ),
+                )
+            )
+
+        return StandupEntry(
+            division_id=division_id,
+            division_name=div_cfg.name,
+            director=director_emp.name if director_emp is not None else "",
+            employee_count=len(employees),
+            active_tasks=div_tasks,
+            heartbeat_summary=summary,
+            employees=team,
+            timed_out=io is None,
+        )
+
+    # ------------------------------------------------------------------
+    # Dunder helpers
+    # ------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return (
+            f"StandupCollector(divisions={len(self._cfg.divisions)}, "
+            f"timeout={self.division_timeout:g}s)"
+        )
+
+
+class StandupSectionCache:
+    """Standup sections from the last delivered report, keyed by division.
+
+    A section counts as changed when its rendered text differs from the
+    stored one, so bookkeeping the report never shows (lease deadlines,
+    dispatch attempts) does not mark a division as changed.  ``changed``
+    lists, in order, the divisions whose section differed from the stored
+    one (or that had none) during this run.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        raw = load_json(path, default={})
+        sections = raw.get("sections") if isinstance(raw, dict) else None
+        if not isinstance(sections, dict) or raw.get("format") != _SECTION_FORMAT:
+            sections = {}
+        self._sections: dict[str, dict[str, str]] = sections
+        self.changed: list[str] = []
+
+    @classmethod
+    def for_config(cls, config: CompanyConfig) -> StandupSectionCache:
+        """Return the cache stored under the company's state directory."""
+        return cls(config.paths.state / SECTION_CACHE_FILENAME)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def fingerprint(section: str) -> str:
+        """Return a digest of a rendered section."""
+        return hashlib.sha256(section.encode("utf-8")).hexdigest()
+
+    def section(
+        self,
+        entry: StandupEntry,
+        render: Callable[[StandupEntry], str],
+    ) -> str:
+        """Render *entry* and record whether its section changed."""
+        text = render(entry)
+        fp = self.fingerprint(text)
+        cached = self._sections.get(entry.division_id)
+        if cached is None or cached.get("fingerprint") != fp:
+            self._sections[entry.division_id] = {
+                "fingerprint": fp,
+                "section": text,
+            }
+            if entry.division_id not in self.changed:
+                self.changed.append(entry.division_id)
+        return text
+
+    def save(self) -> None:
+        """Persist the cache; the next run's baseline is this run's output.
+
+        Callers save only once the report was delivered, so the baseline
+        always describes the last report that actually went out.
+        """
+        save_json(
+            self._path, {"format": _SECTION_FORMAT, "sections": self._sections}
+        )
+
+    # ------------------------------------------------------------------
+    # Dunder helpers
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._sections)
+
+    def __repr__(self) -> str:
+        return (
+            f"StandupSectionCache(sections={len(self._sections)}, "
+            f"changed={len(self.changed)})"
+        )
+
+
+# ---------------------------------------------------------------------------
+# Delivery
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class Delivery:
+    """The ordered chunks one recipient agent should receive."""
+
+    recipient: str  # employee id of the agent the chunks are sent to
+    chunks: list[str]
+
+
+@dataclass(slots=True)
+class DeliveryResult:
+    """What was sent to one recipient; stops at the first failed chunk."""
+
+    recipient: str
+    total: int
+    results: list[CommandResult]
+
+    @property
+    def sent(self) -> int:
+        return sum(1 for r in self.results if r.ok)
+
+    @property
+    def ok(self) -> bool:
+        return self.sent == self.total
+
+
+def split_message(text: str, limit: int = DEFAULT_CHUNK_CHARS) -> list[str]:
+    """Split *text* into chunks of at most *limit* characters.
+
+    Breaks prefer ``## `` section boundaries, then line boundaries; only a
+    single line longer than *limit* is cut mid-line.  When more than one
+    chunk results, each is prefixed with ``(n/m)``.
+    """
+    if limit < 50:
+        raise ValueError("limit must be at least 50 characters")
+    text = text.strip("\n")
+    if len(text) <= limit:
+        return [text] if text else []
+
+    # Reserve room for the "(n/m) " prefix; widen it if m needs more digits.
+    reserve = len("(9/9) ")
+    while True:
+        chunks = _pack(text, limit - reserve)
+        total = len(chunks)
+        needed = len(f"({total}/{total}) ")
+        if needed <= reserve:
+            break
+        reserve = needed
+    return [f"({i}/{total}) {chunk}" for i, chunk in enumerate(chunks, 1)]
+
+
+def plan_delivery(
+    config: CompanyConfig,
+    entries: list[StandupEntry],
+    report: str,
+    *,
+    relay: str | None,
+    route: str = "founder",
+    limit: int = DEFAULT_CHUNK_CHARS,
+) -> list[Delivery]:
+    """Decide who receives what.
+
+    ``founder`` sends the whole *report* through the *relay* agent;
+    ``directors`` sends each division director only their own section;
+    ``both`` does both.  Divisions without a known director are skipped.
+    """
+    if route not in ROUTES:
+        raise ValueError(f"Unknown route '{route}'. Must be one of {ROUTES}.")
+
+    # One ordered list per recipient, so a relay that is also a director
+    # gets the full report and then its section, never interleaved.
+    plan: dict[str, list[str]] = {}
+    if route in ("founder", "both") and relay is not None:
+        plan.setdefault(relay, []).extend(split_message(report, limit))
+
+    if route in ("directors", "both"):
+        today = date.today().isoformat()
+        sections: dict[str, list[str]] = {}
+        for entry in entries:
+            director = config.division(entry.division_id).director
+            if director not in config.employees:
+                continue
+            sections.setdefault(director, []).append(
+                Orchestrator.format_standup_section(entry)
+            )
+        for director, parts in sections.items():
+            header = f"# Standup for your division -- {today}\n\n"
+            text = header + "\n".join(parts)
+            plan.setdefault(director, []).extend(split_message(text, limit))
+
+    return [Delivery(r, chunks) for r, chunks in plan.items() if chunks]
+
+
+def deliver(
+    gateway: OpenClawGateway,
+    plan: list[Delivery],
+    *,
+    max_workers: int = 4,
+) -> list[DeliveryResult]:
+    """Send every delivery, recipients in parallel, chunks in order.
+
+    A recipient's remaining chunks are not sent after one fails, so nobody
+    receives a report with a hole in the middle.  Results follow *plan*.
+    """
+    if not plan:
+        return []
+
+    def send_all(delivery: Delivery) -> DeliveryResult:
+        results: list[CommandResult] = []
+        for chunk in delivery.chunks:
+            result = gateway.send_message(delivery.recipient, chunk)
+            results.append(result)
+            if not result.ok:
+                break
+        return DeliveryResult(delivery.recipient, len(delivery.chunks), results)
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(plan))),
+        thread_name_prefix="standup-send",
+    ) as pool:
+        return list(pool.map(send_all, plan))
+
+
+def _pack(text: str, budget: int) -> list[str]:
+    """Greedily pack sections (or lines, or line pieces) into *budget*."""
+    blocks: list[str] = []
+    for block in _sections(text):
+        if len(block) <= budget:
+            blocks.append(block)
+            continue
+        for line in block.splitlines(keepends=True):
+            while len(line) > budget:
+                blocks.append(line[:budget])
+                line = line[budget:]
+            blocks.append(line)
+
+    chunks: list[str] = []
+    current = ""
+    for block in blocks:
+        if current and len(current) + len(block) > budget:
+            chunks.append(current)
+            current = ""
+        current += block
+    if current:
+        chunks.append(current)
+    return [c.strip("\n") for c in chunks if c.strip()]
+
+
+def _sections(text: str) -> list[str]:
+    """Split Markdown at ``## `` headings, keeping each heading with its body."""
+    blocks: list[str] = []
+    current: list[str] = []
+    for line in text.splitlines(keepends=True):
+        if line.startswith("## ") and current:
+            blocks.append("".join(current))
+            current = []
+        current.append(line)
+    if current:
+        blocks.append("".join(current))
+    return blocks
+
+
+def _mtime(path: Path) -> float | None:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
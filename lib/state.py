@@ -0,0 +1,96 @@
+"""Small helpers for files under the ``.vwork`` state directory.
+
+Caches and indexes are rebuildable, so a missing or corrupt file reads as
+empty rather than raising; writes go to a temporary file beside the target
+and are renamed into place so readers never see a partial file.
+
+:func:`file_lock` serialises read-modify-write cycles of a shared file
+(such as the task board) between processes and threads.
+
+Usage::
+
+    data = load_json(cfg.paths.state / "index.json", default={})
+    save_json(cfg.paths.state / "index.json", data)
+
+    with file_lock(cfg.paths.state / "board.lock"):
+        ...  # read, change and write the board
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:  # Windows: threads of one process are still serialised
+    fcntl = None
+
+
+# Per lock file: the in-process lock, and how deep its holder has nested.
+_LOCKS: dict[Path, threading.RLock] = {}
+_DEPTH: dict[Path, int] = {}
+_LOCKS_GUARD = threading.Lock()
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Write *data* to *path* atomically, creating parent directories."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}-", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def load_json(path: Path, default: Any = None) -> Any:
+    """Return the JSON document at *path*, or *default* if unreadable."""
+    try:
+        with path.open("rb") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return default
+
+
+def save_json(path: Path, data: Any) -> None:
+    """Atomically write *data* as compact JSON to *path*."""
+    atomic_write(
+        path,
+        json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+    )
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on *path* (created if missing) for the block.
+
+    The lock is advisory (``flock``), so it only excludes other holders.
+    It is re-entrant within a thread, so a locked method may call another.
+    """
+    with _LOCKS_GUARD:
+        lock = _LOCKS.setdefault(path, threading.RLock())
+    with lock:
+        depth = _DEPTH.get(path, 0)
+        _DEPTH[path] = depth + 1
+        try:
+            if depth or fcntl is None:
+                yield
+                return
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("a") as fh:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+        finally:
+            _DEPTH[path] = depth
@@ -0,0 +1,346 @@
+"""Compiled workspace templates for VWork.
+
+A template is compiled once into alternating literal segments and
+placeholder slots, cached by the SHA-256 of its content, and then filled in
+a single pass.  Files are re-read only when their ``stat`` signature
+changes, so provisioning many workspaces from the same ``_template/`` files
+costs one ``stat`` and one join per file.
+
+Usage::
+
+    compiler = TemplateCompiler({"[employee name]": "{employee_name}"})
+    tpl = compiler.load(Path("employees/_template/IDENTITY.md"))
+    text = tpl.render({"{employee_name}": "Echo"})
+
+A rendered workspace file is then owned by its agent, so later config
+changes are applied by :func:`update_anchors`, which rewrites only the
+lines and sections holding placeholder values (located with
+:func:`template_anchors`) and leaves the rest of the file alone::
+
+    anchors = template_anchors(tpl, {"{role_title}"})
+    text = update_anchors(text, tpl.render(new), anchors, new, previous=old)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Collection, Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledTemplate:
+    """A template split into literal text and placeholder slots.
+
+    ``literals`` always has exactly one more element than ``slots``; the
+    rendered text is ``literals[0] + value(slots[0]) + literals[1] + ...``.
+    """
+
+    digest: str
+    literals: tuple[str, ...]
+    slots: tuple[str, ...]
+
+    @property
+    def keys(self) -> frozenset[str]:
+        """The distinct slot keys used by this template."""
+        return frozenset(self.slots)
+
+    def render(self, values: Mapping[str, str]) -> str:
+        """Fill every slot from *values*; unknown slots render as their key."""
+        literals = self.literals
+        parts = [literals[0]]
+        for i, slot in enumerate(self.slots, 1):
+            parts.append(values.get(slot, slot))
+            parts.append(literals[i])
+        return "".join(parts)
+
+
+class TemplateCompiler:
+    """Compile and cache templates for a fixed placeholder vocabulary.
+
+    *tokens* maps the raw token as written in a template (e.g.
+    ``"[role title]"``) to its slot key (e.g. ``"{role_title}"``).  Slot keys
+    written literally in a template are recognised as slots too.
+    """
+
+    def __init__(self, tokens: Mapping[str, str], *, max_entries: int = 256) -> None:
+        self._tokens = dict(tokens)
+        for key in tokens.values():
+            self._tokens.setdefault(key, key)
+        # Longest first so "- [list ...]" wins over any shorter overlap.
+        alternation = "|".join(
+            re.escape(t) for t in sorted(self._tokens, key=len, reverse=True)
+        )
+        self._pattern = re.compile(alternation) if alternation else None
+        self._max_entries = max_entries
+        self._by_digest: OrderedDict[str, CompiledTemplate] = OrderedDict()
+        self._by_path: dict[Path, tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def compile(self, text: str) -> CompiledTemplate:
+        """Return the compiled form of *text*, reusing a cached compile."""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        with self._lock:
+            cached = self._by_digest.get(digest)
+            if cached is not None:
+                self._by_digest.move_to_end(digest)
+                self.hits += 1
+                return cached
+        compiled = self._compile(text, digest)
+        with self._lock:
+            self.misses += 1
+            self._by_digest[digest] = compiled
+            while len(self._by_digest) > self._max_entries:
+                self._by_digest.popitem(last=False)
+        return compiled
+
+    def load(self, path: Path) -> CompiledTemplate:
+        """Return the compiled template at *path*, re-reading only if it changed."""
+        st = os.stat(path)
+        with self._lock:
+            known = self._by_path.get(path)
+            if known is not None and known[:2] == (st.st_mtime_ns, st.st_size):
+                cached = self._by_digest.get(known[2])
+                if cached is not None:
+                    self._by_digest.move_to_end(known[2])
+                    self.hits += 1
+                    return cached
+        compiled = self.compile(path.read_text(encoding="utf-8"))
+        with self._lock:
+            self._by_path[path] = (st.st_mtime_ns, st.st_size, compiled.digest)
+        return compiled
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_digest.clear()
+            self._by_path.clear()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _compile(self, text: str, digest: str) -> CompiledTemplate:
+        literals: list[str] = []
+        slots: list[str] = []
+        pos = 0
+        if self._pattern is not None:
+            for match in self._pattern.finditer(text):
+                literals.append(text[pos:match.start()])
+                slots.append(self._tokens[match.group(0)])
+                pos = match.end()
+        literals.append(text[pos:])
+        return CompiledTemplate(
+            digest=digest, literals=tuple(literals), slots=tuple(slots)
+        )
+
+    # ------------------------------------------------------------------
+    # Dunder helpers
+    # ------------------------------------------------------------------
+
+    def __repr__(self) -> str:
+        return (
+            f"TemplateCompiler(cached={len(self._by_digest)}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+
+# ---------------------------------------------------------------------------
+# Anchors
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class Anchor:
+    """Where a placeholder's value lives in a template."""
+
+    key: str  # e.g. "{division_name}"
+    marker: str  # line prefix ("- **Role:**") or heading ("## Division")
+    section: bool  # True if the value is the body of the *marker* heading
+
+
+def template_anchors(
+    template: CompiledTemplate,
+    keys: Collection[str] | None = None,
+) -> list[Anchor]:
+    """Locate the placeholders of *template* (only *keys*, if given).
+
+    A placeholder preceded by text on its line is anchored by that line
+    prefix; one on a line of its own is anchored by the heading above it.
+    Placeholders with neither are skipped.
+    """
+    anchors: list[Anchor] = []
+    for i, slot in enumerate(template.slots):
+        if keys is not None and slot not in keys:
+            continue
+        before = template.literals[i]
+        prefix = before.rsplit("\n", 1)[-1].strip()
+        if prefix:
+            anchors.append(Anchor(slot, prefix, section=False))
+            continue
+        previous = [ln.strip() for ln in before.split("\n")[:-1] if ln.strip()]
+        if previous and previous[-1].startswith("#"):
+            anchors.append(Anchor(slot, previous[-1], section=True))
+    return anchors
+
+
+def anchor_span(lines: list[str], anchor: Anchor) -> tuple[int, int] | None:
+    """Return the ``[start, end)`` line range holding *anchor*'s value.
+
+    For a line anchor that is the line itself; for a section, the body
+    between the heading and the next heading of the same or higher level
+    (or a ``---`` rule, which starts the file's footer).
+    """
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if not anchor.section:
+            if stripped.startswith(anchor.marker):
+                return i, i + 1
+            continue
+        if stripped != anchor.marker:
+            continue
+        level = len(stripped) - len(stripped.lstrip("#"))
+        end = i + 1
+        while end < len(lines):
+            s = lines[end].strip()
+            if s == "---":
+                break
+            if s.startswith("#") and len(s) - len(s.lstrip("#")) <= level:
+                break
+            end += 1
+        return i + 1, end
+    return None
+
+
+def update_anchors(
+    text: str,
+    rendered: str,
+    anchors: Iterable[Anchor],
+    values: Mapping[str, str],
+    *,
+    previous: Mapping[str, str] | None = None,
+) -> str:
+    """Bring the anchored values of *text* in line with *rendered*.
+
+    *rendered* is the template filled with *values*.  Anchors whose value
+    equals the one in *previous*, or that already show it, are left as
+    they are.  With *previous*, the old value is swapped for the new one
+    where the file still has it: in place within a line, and line by line
+    for list values (lines the new value dropped are removed, lines it
+    added are inserted next to the ones it kept).  Without it, or if the
+    old value is gone, a line anchor's line is replaced and in a section
+    the line at the value's position in the template is.  Lines the agent
+    added around a value survive either way.  A missing line or section
+    is inserted where the template has it: before the next heading (or
+    ``---`` rule) that follows it in the template.
+    """
+    lines = text.splitlines()
+    want = rendered.splitlines()
+    for anchor in anchors:
+        value = values.get(anchor.key, "")
+        old = previous.get(anchor.key) if previous is not None else None
+        if old == value:
+            continue
+        target = anchor_span(want, anchor)
+        if target is None:
+            continue
+        span = anchor_span(lines, anchor)
+        if span is None:
+            start = target[0] - 1 if anchor.section else target[0]
+            at = _insertion_point(lines, want, target[1], anchor.section)
+            lines[at:at] = want[start:target[1]]
+            continue
+        if not value or value in "\n".join(lines[span[0]:span[1]]):
+            continue
+        if old and "\n" in old + value and anchor.section:
+            _swap_lines(lines, span, old.splitlines(), value.splitlines())
+            continue
+        if old:
+            at = next((i for i in range(*span) if old in lines[i]), None)
+            if at is not None:
+                lines[at] = lines[at].replace(old, value, 1)
+                continue
+        if not anchor.section:
+            lines[span[0]] = want[target[0]]
+            continue
+        # The value line keeps its place among the non-blank body lines.
+        body = want[target[0]:target[1]]
+        hit = next((i for i, ln in enumerate(body) if value in ln), None)
+        if hit is None:
+            continue
+        rank = sum(1 for ln in body[:hit] if ln.strip())
+        filled = [i for i in range(*span) if lines[i].strip()]
+        if rank < len(filled):
+            lines[filled[rank]] = body[hit]
+        else:
+            lines.insert(span[0], body[hit])
+    return "\n".join(lines) + ("\n" if text.endswith("\n") else "")
+
+
+def _swap_lines(
+    lines: list[str],
+    span: tuple[int, int],
+    old: list[str],
+    new: list[str],
+) -> None:
+    """Turn the *old* value lines within *span* into the *new* ones.
+
+    Lines only *old* has are removed; lines only *new* has (and the
+    section lacks) go where the first removed line was, else after the
+    last line both share, else at the end of the section's text.
+    """
+    before = {ln.strip() for ln in old if ln.strip()}
+    after = {ln.strip() for ln in new if ln.strip()}
+    body = range(*span)
+    present = {lines[i].strip() for i in body}
+    added = [ln for ln in new if ln.strip() not in before | present]
+    gone = [i for i in body if lines[i].strip() in before - after]
+    kept = [i for i in body if lines[i].strip() in after]
+    filled = [i for i in body if lines[i].strip()]
+    if gone:
+        at = gone[0]
+    elif kept:
+        at = kept[-1] + 1
+    else:
+        at = filled[-1] + 1 if filled else span[0]
+    for i in reversed(gone):
+        del lines[i]
+    lines[at:at] = added
+
+
+def _insertion_point(
+    lines: list[str],
+    want: list[str],
+    after: int,
+    section: bool,
+) -> int:
+    """Index in *lines* matching the template position ``want[after]``.
+
+    That is the first heading or ``---`` rule following *after* in the
+    template that *lines* still has; the end of *lines* if there is none.
+    """
+    for line in want[after:]:
+        stripped = line.strip()
+        if not (stripped.startswith("#") or stripped == "---"):
+            continue
+        matches = [i for i, ln in enumerate(lines) if ln.strip() == stripped]
+        if not matches:
+            continue
+        # Headings are unique; a footer rule is the last one in the file.
+        at = matches[-1] if stripped == "---" else matches[0]
+        if not section:
+            # A lone line joins the end of the section, not the gap after it.
+            while at > 0 and not lines[at - 1].strip():
+                at -= 1
+        return at
+    return len(lines)
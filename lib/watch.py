@@ -0,0 +1,302 @@
+"""File-change notification for VWork daemons.
+
+:class:`InotifyWatcher` uses Linux inotify (through :mod:`ctypes`, no extra
+dependency) so an idle watcher costs nothing; :class:`PollingWatcher` is the
+portable fallback and checks all watched paths in one batched ``stat`` pass
+per interval.  Both report changed paths from :meth:`wait`.
+
+Watching a directory reports changes to the entries directly inside it;
+watching a file watches its parent directory and reports only that file.
+
+Usage::
+
+    watcher = make_watcher()
+    watcher.add(cfg.paths.board / "active.yaml")
+    watcher.add(cfg.employee_workspace("director-chen"))
+    while True:
+        for path in watcher.wait(timeout=30):
+            print("changed:", path)
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from pathlib import Path
+
+
+# inotify(7) event masks
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_IGNORED = 0x00008000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = os.O_CLOEXEC
+
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+    | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF
+)
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+
+class Watcher:
+    """Common bookkeeping for the watcher implementations.
+
+    Subclasses implement :meth:`_watch_dir`, :meth:`_unwatch_dir` and
+    :meth:`_changes`.
+    """
+
+    def __init__(self, *, settle: float = 0.05) -> None:
+        # directory -> files of interest in it (empty set = whole directory)
+        self._dirs: dict[Path, set[str]] = {}
+        self._settle = settle
+
+    def add(self, path: Path) -> None:
+        """Start reporting changes to *path* (a file or a directory)."""
+        path = Path(path)
+        if path.is_dir():
+            directory, name = path, None
+        else:
+            directory, name = path.parent, path.name
+        names = self._dirs.get(directory)
+        if names is None:
+            if not self._watch_dir(directory):
+                return
+            self._dirs[directory] = names = set() if name is None else {name}
+        elif name is None:
+            names.clear()
+        elif names:
+            names.add(name)
+
+    def remove(self, path: Path) -> None:
+        """Stop reporting changes to *path*."""
+        path = Path(path)
+        if path in self._dirs:
+            self._unwatch_dir(path)
+            del self._dirs[path]
+            return
+        names = self._dirs.get(path.parent)
+        if names and path.name in names:
+            names.discard(path.name)
+            if not names:
+                self._unwatch_dir(path.parent)
+                del self._dirs[path.parent]
+
+    def watched(self) -> list[Path]:
+        """Return the watched directories."""
+        return list(self._dirs)
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """Block up to *timeout* seconds and return the paths that changed.
+
+        Changes arriving within a short settle window of the first one are
+        returned together, so an editor's write-rename-chmod sequence is
+        reported once.  Returns an empty set on timeout.
+        """
+        changed = self._changes(timeout)
+        if changed:
+            changed |= self._changes(self._settle)
+        return {p for p in changed if self._interesting(p)}
+
+    def close(self) -> None:
+        for directory in list(self._dirs):
+            self._unwatch_dir(directory)
+        self._dirs.clear()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _interesting(self, path: Path) -> bool:
+        if path in self._dirs:
+            return True
+        names = self._dirs.get(path.parent)
+        return names is not None and (not names or path.name in names)
+
+    def _watch_dir(self, directory: Path) -> bool:
+        raise NotImplementedError
+
+    def _unwatch_dir(self, directory: Path) -> None:
+        raise NotImplementedError
+
+    def _changes(self, timeout: float | None) -> set[Path]:
+        raise NotImplementedError
+
+    # ------------------------------------------------------------------
+    # Dunder helpers
+    # ------------------------------------------------------------------
+
+    def __enter__(self) -> Watcher:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(dirs={len(self._dirs)})"
+
+
+class InotifyWatcher(Watcher):
+    """Event-driven watcher backed by Linux inotify.
+
+    Raises ``OSError`` if inotify is unavailable (non-Linux, or the
+    per-user instance limit is exhausted); use :func:`make_watcher` to fall
+    back to polling automatically.
+    """
+
+    def __init__(self, *, settle: float = 0.05) -> None:
+        super().__init__(settle=settle)
+        libc_name = ctypes.util.find_library("c")
+        try:
+            self._libc = ctypes.CDLL(libc_name, use_errno=True)
+            self._libc.inotify_init1
+        except (OSError, AttributeError) as exc:
+            raise OSError("inotify is not available on this platform") from exc
+        self._libc.inotify_add_watch.argtypes = [
+            ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32,
+        ]
+        self._libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1: {os.strerror(err)}")
+        self._fd = fd
+        self._wds: dict[int, Path] = {}
+        self._by_dir: dict[Path, int] = {}
+
+    def close(self) -> None:
+        super().close()
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _watch_dir(self, directory: Path) -> bool:
+        wd = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(directory), _WATCH_MASK
+        )
+        if wd < 0:
+            return False  # vanished, or out of watches
+        self._wds[wd] = directory
+        self._by_dir[directory] = wd
+        return True
+
+    def _unwatch_dir(self, directory: Path) -> None:
+        wd = self._by_dir.pop(directory, None)
+        if wd is not None:
+            self._wds.pop(wd, None)
+            self._libc.inotify_rm_watch(self._fd, wd)
+
+    def _changes(self, timeout: float | None) -> set[Path]:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed: set[Path] = set()
+        while True:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _cookie, length = _EVENT.unpack_from(buf, offset)
+                offset += _EVENT.size
+                name = buf[offset:offset + length].rstrip(b"\0")
+                offset += length
+                directory = self._wds.get(wd)
+                if directory is None:
+                    continue
+                if mask & _IN_IGNORED:
+                    # Watched directory was deleted or unmounted.
+                    self._wds.pop(wd, None)
+                    self._by_dir.pop(directory, None)
+                    self._dirs.pop(directory, None)
+                    changed.add(directory)
+                elif name:
+                    changed.add(directory / os.fsdecode(name))
+                else:
+                    changed.add(directory)
+        return changed
+
+
+class PollingWatcher(Watcher):
+    """Portable watcher that compares ``stat`` signatures every *interval*.
+
+    Each pass lists every watched directory once, so the cost per interval
+    is one ``scandir`` per directory however many files are of interest.
+    """
+
+    def __init__(self, *, interval: float = 2.0, settle: float = 0.0) -> None:
+        super().__init__(settle=settle)
+        self.interval = interval
+        self._signatures: dict[Path, dict[str, tuple[int, int]]] = {}
+
+    def _watch_dir(self, directory: Path) -> bool:
+        if not directory.is_dir():
+            return False
+        self._signatures[directory] = _listing(directory)
+        return True
+
+    def _unwatch_dir(self, directory: Path) -> None:
+        self._signatures.pop(directory, None)
+
+    def _changes(self, timeout: float | None) -> set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = self._poll()
+            if changed:
+                return changed
+            remaining = (
+                self.interval if deadline is None else deadline - time.monotonic()
+            )
+            if remaining <= 0:
+                return set()
+            time.sleep(min(self.interval, remaining))
+
+    def _poll(self) -> set[Path]:
+        changed: set[Path] = set()
+        for directory, before in self._signatures.items():
+            after = _listing(directory)
+            if not after and not directory.is_dir():
+                changed.add(directory)
+            for name in before.keys() | after.keys():
+                if before.get(name) != after.get(name):
+                    changed.add(directory / name)
+            self._signatures[directory] = after
+        return changed
+
+
+def make_watcher(*, poll_interval: float = 2.0, polling: bool = False) -> Watcher:
+    """Return an inotify watcher, or a polling one if that is unavailable."""
+    if not polling:
+        try:
+            return InotifyWatcher()
+        except OSError:
+            pass
+    return PollingWatcher(interval=poll_interval)
+
+
+def _listing(directory: Path) -> dict[str, tuple[int, int]]:
+    """Return ``{name: (mtime_ns, size)}`` for the entries of *directory*."""
+    out: dict[str, tuple[int, int]] = {}
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except FileNotFoundError:
+                    continue
+                out[entry.name] = (st.st_mtime_ns, st.st_size)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return out
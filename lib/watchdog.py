@@ -0,0 +1,280 @@
+"""Heartbeat watchdog for agents with running tasks.
+
+Watches the workspace of every assignee of an active task, plus
+``board/active.yaml``, through :mod:`lib.watch` (inotify, or batched
+polling as a fallback).  Heartbeat timestamps are only re-read when a
+``HEARTBEAT.md`` actually changes, so the periodic SLA check is a pure
+in-memory comparison however many agents are watched.
+
+An agent is stale when neither its ``HEARTBEAT.md`` nor the start of the
+watchdog's tracking of its task has moved within the role's SLA (see
+:meth:`CompanyConfig.heartbeat_sla`).  Stale agents are reported once per
+episode.  When re-dispatch is enabled their tasks are handed back through
+:meth:`LeaseManager.expire <lib.lease.LeaseManager.expire>`, exactly as
+if their leases had run out: each is re-queued for the dispatcher (see
+:mod:`lib.dispatch`) to send again, within ``runtime.lease_max_retries``,
+and then reassigned or blocked.  The watchdog sends no messages itself.
+Tracking state survives restarts in ``.vwork/watchdog.json``.
+
+Usage::
+
+    with Watchdog(cfg, redispatch=True) as dog:
+        dog.run(interval=60, on_stale=print)
+
+    # or a single check, e.g. from cron
+    stale = Watchdog(cfg).check_once()
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .config import CompanyConfig
+from .lease import Expiry, LeaseManager
+from .orchestrator import Orchestrator, Task
+from .state import load_json, save_json
+from .watch import Watcher, make_watcher
+
+
+STATE_FILENAME = "watchdog.json"
+
+
+@dataclass(slots=True)
+class StaleAgent:
+    """An agent whose heartbeat went quiet for longer than its SLA."""
+
+    employee: str
+    tasks: list[Task]
+    last_heartbeat: float | None  # Unix time of HEARTBEAT.md, None if absent
+    quiet_for: float  # seconds since the heartbeat (or tracking) last moved
+    sla: float  # seconds allowed by the role
+    handed_off: list[Expiry] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "employee": self.employee,
+            "tasks": [t.id for t in self.tasks],
+            "last_heartbeat": self.last_heartbeat,
+            "quiet_minutes": round(self.quiet_for / 60, 1),
+            "sla_minutes": round(self.sla / 60, 1),
+            "handed_off": [e.to_dict() for e in self.handed_off],
+        }
+
+
+class Watchdog:
+    """Flag (and optionally re-dispatch) tasks whose agent went quiet.
+
+    *redispatch* defaults to ``runtime.redispatch_stale``; with it on,
+    *leases* defaults to a :class:`~lib.lease.LeaseManager` for *config*
+    (which raises ``KeyError`` for an unknown ``runtime.lease_fallback``).
+    """
+
+    def __init__(
+        self,
+        config: CompanyConfig,
+        *,
+        watcher: Watcher | None = None,
+        leases: LeaseManager | None = None,
+        redispatch: bool | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._cfg = config
+        self._orch = Orchestrator(config)
+        self._watcher = watcher
+        self.redispatch = (
+            config.runtime.redispatch_stale if redispatch is None else redispatch
+        )
+        self._leases = leases
+        if self.redispatch and leases is None:
+            self._leases = LeaseManager(config, orchestrator=self._orch)
+        self._clock = clock
+        self._state_path = config.paths.state / STATE_FILENAME
+        self._active_path = config.paths.board / "active.yaml"
+
+        self._tasks: dict[str, Task] = {}
+        self._heartbeats: dict[str, float | None] = {}  # employee -> mtime
+        self._flagged: set[str] = set()  # employees reported this episode
+
+        raw = load_json(self._state_path, default={})
+        tracked = raw.get("tasks") if isinstance(raw, dict) else None
+        # task id -> {"since": unix time}
+        self._tracked: dict[str, dict[str, float]] = (
+            tracked if isinstance(tracked, dict) else {}
+        )
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> None:
+        """Reload the board and watch exactly the current assignees."""
+        now = self._clock()
+        tasks = {
+            t.id: t
+            for t in self._orch.list_tasks(status="active")
+            if t.assignee in self._cfg.employees
+        }
+        before = {t.assignee for t in self._tasks.values()}
+        after = {t.assignee for t in tasks.values()}
+
+        for tid in tasks.keys() - self._tracked.keys():
+            self._tracked[tid] = {"since": now}
+        for tid in self._tracked.keys() - tasks.keys():
+            del self._tracked[tid]
+        self._tasks = tasks
+
+        watcher = self._watcher
+        for eid in before - after:
+            self._heartbeats.pop(eid, None)
+            self._flagged.discard(eid)
+            if watcher is not None:
+                watcher.remove(self._cfg.employee_workspace(eid))
+        for eid in after - before:
+            workspace = self._cfg.employee_workspace(eid)
+            self._heartbeats[eid] = _mtime(workspace / "HEARTBEAT.md")
+            if watcher is not None:
+                watcher.add(workspace)
+        self._save_state()
+
+    def handle_changes(self, paths: set[Path]) -> None:
+        """Update heartbeat times (or the board) for changed *paths*."""
+        if self._active_path in paths:
+            self.refresh()
+        for eid in list(self._heartbeats):
+            hb_path = self._cfg.employee_workspace(eid) / "HEARTBEAT.md"
+            if hb_path in paths:
+                mtime = _mtime(hb_path)
+                if mtime != self._heartbeats[eid]:
+                    self._heartbeats[eid] = mtime
+                    self._flagged.discard(eid)  # it moved: new episode
+
+    def check(self) -> list[StaleAgent]:
+        """Return agents that newly exceeded their SLA, re-dispatching if on.
+
+        This only looks at in-memory state; call :meth:`handle_changes`
+        (or :meth:`refresh`) to feed it filesystem updates.
+        """
+        now = self._clock()
+        by_assignee: dict[str, list[Task]] = {}
+        for task in self._tasks.values():
+            by_assignee.setdefault(task.assignee, []).append(task)
+
+        stale: list[StaleAgent] = []
+        for eid, tasks in by_assignee.items():
+            if eid in self._flagged:
+                continue
+            heartbeat = self._heartbeats.get(eid)
+            since = max(self._tracked[t.id]["since"] for t in tasks)
+            last_moved = since if heartbeat is None else max(heartbeat, since)
+            sla = self._cfg.heartbeat_sla(eid)
+            if now - last_moved <= sla:
+                continue
+            agent = StaleAgent(
+                employee=eid,
+                tasks=tasks,
+                last_heartbeat=heartbeat,
+                quiet_for=now - last_moved,
+                sla=sla,
+            )
+            self._flagged.add(eid)
+            if self.redispatch:
+                self._hand_off(agent, now)
+            stale.append(agent)
+
+        if stale:
+            self._save_state()
+        return stale
+
+    def check_once(self) -> list[StaleAgent]:
+        """Load the board, stat each assignee's heartbeat once, and check."""
+        self.refresh()
+        return self.check()
+
+    def run(
+        self,
+        *,
+        interval: float = 60.0,
+        iterations: int | None = None,
+        on_stale: Callable[[StaleAgent], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> None:
+        """Watch and check until interrupted (or for *iterations* rounds).
+
+        Between SLA checks the process sleeps inside the watcher, waking
+        only for file changes.  With *on_error*, an error while handling
+        changes or checking is reported to it and watching carries on;
+        without it the error propagates.
+        """
+        if self._watcher is None:
+            self._watcher = make_watcher()
+        self._watcher.add(self._active_path)
+        self.refresh()
+
+        rounds = 0
+        next_check = self._clock()
+        while iterations is None or rounds < iterations:
+            changed = self._watcher.wait(max(0.0, next_check - self._clock()))
+            try:
+                if changed:
+                    self.handle_changes(changed)
+                if self._clock() < next_check:
+                    continue
+                stale = self.check()
+            except Exception as exc:
+                if on_error is None:
+                    raise
+                on_error(exc)
+                stale = []
+            for agent in stale:
+                if on_stale is not None:
+                    on_stale(agent)
+            next_check = self._clock() + interval
+            rounds += 1
+
+    def close(self) -> None:
+        if self._watcher is not None:
+            self._watcher.close()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _hand_off(self, agent: StaleAgent, now: float) -> None:
+        """Expire the leases of *agent*'s tasks so they are dispatched anew."""
+        assert self._leases is not None
+        agent.handed_off = self._leases.expire(t.id for t in agent.tasks)
+        for expiry in agent.handed_off:
+            # A fresh SLA window for whoever gets the task next.
+            self._tracked[expiry.task.id]["since"] = now
+        if agent.handed_off:
+            self._flagged.discard(agent.employee)
+
+    def _save_state(self) -> None:
+        save_json(self._state_path, {"tasks": self._tracked})
+
+    # ------------------------------------------------------------------
+    # Dunder helpers
+    # ------------------------------------------------------------------
+
+    def __enter__(self) -> Watchdog:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"Watchdog(tasks={len(self._tasks)}, agents={len(self._heartbeats)}, "
+            f"redispatch={self.redispatch})"
+        )
+
+
+def _mtime(path: Path) -> float | None:
+    try:
+        return os.stat(path).st_mtime
+    except (FileNotFoundError, NotADirectoryError):
+        return None
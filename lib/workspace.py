@@ -0,0 +1,302 @@
+"""Bulk scanner and persistent index of employee workspaces.
+
+Walks every employee workspace (``IDENTITY.md``, ``ROLE.md``, ``SOUL.md``,
+``TOOLS.md``, ``HEARTBEAT.md``, ``memory/`` ...) with :func:`os.scandir` in
+a single pass and records each file's size, mtime and SHA-256 in
+``.vwork/workspace-index.json``.  Later scans re-hash only files whose
+``(size, mtime_ns)`` changed, so dashboards, staleness checks and integrity
+checks can query the index instead of the filesystem.
+
+Usage::
+
+    index = WorkspaceIndex(cfg)
+    stats = index.scan()               # incremental after the first run
+    index.save()
+
+    hb = index.get("director-chen", "HEARTBEAT.md")
+    stale = index.stale_heartbeats(max_age=86400)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from .config import CompanyConfig
+from .state import load_json, save_json
+
+
+INDEX_FILENAME = "workspace-index.json"
+
+# Bump when the on-disk layout changes; older indexes are rebuilt.
+_INDEX_FORMAT = 1
+
+
+@dataclass(frozen=True, slots=True)
+class FileRecord:
+    """One indexed file inside an employee workspace."""
+
+    employee: str
+    path: str  # relative to the workspace, always "/"-separated
+    size: int
+    mtime_ns: int
+    sha256: str
+
+    @property
+    def mtime(self) -> float:
+        return self.mtime_ns / 1e9
+
+
+@dataclass(frozen=True, slots=True)
+class ScanStats:
+    """What one :meth:`WorkspaceIndex.scan` call did."""
+
+    workspaces: int
+    files: int
+    hashed: int  # new or changed files that were read
+    unchanged: int  # files whose stat matched the index
+    removed: int  # files (or workspaces) dropped from the index
+    missing: list[str]  # employees with no workspace directory
+    seconds: float
+
+
+class WorkspaceIndex:
+    """Persistent size/mtime/hash index over all employee workspaces."""
+
+    def __init__(self, config: CompanyConfig, path: Path | None = None) -> None:
+        self._cfg = config
+        self._path = path or config.paths.state / INDEX_FILENAME
+        raw = load_json(self._path, default={})
+        workspaces = raw.get("workspaces") if isinstance(raw, dict) else None
+        if not isinstance(workspaces, dict) or raw.get("format") != _INDEX_FORMAT:
+            workspaces = {}
+        # employee id -> {relative path -> [size, mtime_ns, sha256]}
+        self._files: dict[str, dict[str, list]] = workspaces
+        self._scanned_at: float = (
+            raw.get("scanned_at", 0.0) if workspaces else 0.0
+        )
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def scanned_at(self) -> float:
+        """Unix time of the last scan (0.0 if never scanned)."""
+        return self._scanned_at
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+
+    def scan(
+        self,
+        employee_ids: list[str] | None = None,
+        *,
+        max_workers: int = 8,
+    ) -> ScanStats:
+        """Bring the index up to date with the filesystem.
+
+        Only files whose ``(size, mtime_ns)`` differ from the index are
+        read and hashed, on up to *max_workers* threads.  With
+        *employee_ids* only those workspaces are rescanned; a full scan
+        also drops employees no longer in the config.
+        """
+        start = time.perf_counter()
+        targets = (
+            employee_ids if employee_ids is not None else list(self._cfg.employees)
+        )
+        files = hashed = unchanged = removed = 0
+        missing: list[str] = []
+        # (employee, relative path, absolute path, size, mtime_ns) to hash
+        pending: list[tuple[str, str, str, int, int]] = []
+
+        if employee_ids is None:
+            for gone in set(self._files) - set(targets):
+                removed += len(self._files.pop(gone))
+
+        for eid in targets:
+            root = self._cfg.employee_workspace(eid)
+            if not root.is_dir():
+                missing.append(eid)
+                removed += len(self._files.pop(eid, {}))
+                continue
+            known = self._files.get(eid, {})
+            current: dict[str, list] = {}
+            seen: set[str] = set()
+            for rel, entry in walk_files(root):
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except FileNotFoundError:
+                    continue  # deleted mid-scan
+                seen.add(rel)
+                previous = known.get(rel)
+                if (
+                    previous is not None
+                    and previous[0] == st.st_size
+                    and previous[1] == st.st_mtime_ns
+                ):
+                    current[rel] = previous
+                    unchanged += 1
+                    continue
+                pending.append((eid, rel, entry.path, st.st_size, st.st_mtime_ns))
+            removed += len(known.keys() - seen)
+            self._files[eid] = current
+
+        if pending:
+            workers = max(1, min(max_workers, len(pending)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                digests = list(pool.map(_try_sha256, [p[2] for p in pending]))
+            for (eid, rel, _path, size, mtime_ns), digest in zip(pending, digests):
+                if digest is None:
+                    removed += 1  # deleted before it could be hashed
+                    continue
+                self._files[eid][rel] = [size, mtime_ns, digest]
+                hashed += 1
+        files = sum(len(self._files.get(eid, {})) for eid in targets)
+
+        self._scanned_at = time.time()
+        return ScanStats(
+            workspaces=len(targets) - len(missing),
+            files=files,
+            hashed=hashed,
+            unchanged=unchanged,
+            removed=removed,
+            missing=missing,
+            seconds=time.perf_counter() - start,
+        )
+
+    def save(self) -> None:
+        """Persist the index to the state directory."""
+        save_json(
+            self._path,
+            {
+                "format": _INDEX_FORMAT,
+                "scanned_at": self._scanned_at,
+                "workspaces": self._files,
+            },
+        )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def employees(self) -> list[str]:
+        """Return the employee ids that have an indexed workspace."""
+        return list(self._files)
+
+    def get(self, employee_id: str, path: str) -> FileRecord | None:
+        """Return the record for *path* in *employee_id*'s workspace."""
+        row = self._files.get(employee_id, {}).get(path)
+        if row is None:
+            return None
+        return FileRecord(employee_id, path, row[0], row[1], row[2])
+
+    def records(
+        self,
+        employee_id: str | None = None,
+        *,
+        prefix: str = "",
+    ) -> list[FileRecord]:
+        """Return indexed files, optionally for one employee or a subtree.
+
+        *prefix* filters on the relative path, e.g. ``"memory/"``.
+        """
+        ids = [employee_id] if employee_id is not None else list(self._files)
+        return [
+            FileRecord(eid, rel, row[0], row[1], row[2])
+            for eid in ids
+            for rel, row in sorted(self._files.get(eid, {}).items())
+            if rel.startswith(prefix)
+        ]
+
+    def heartbeat(self, employee_id: str) -> FileRecord | None:
+        """Return the record of the employee's ``HEARTBEAT.md``."""
+        return self.get(employee_id, "HEARTBEAT.md")
+
+    def memory_files(self, employee_id: str) -> list[FileRecord]:
+        """Return the employee's files under ``memory/``."""
+        return self.records(employee_id, prefix="memory/")
+
+    def total_size(self, employee_id: str | None = None) -> int:
+        """Return the indexed bytes for one employee or the whole company."""
+        ids = [employee_id] if employee_id is not None else list(self._files)
+        return sum(
+            row[0] for eid in ids for row in self._files.get(eid, {}).values()
+        )
+
+    def stale_heartbeats(
+        self,
+        max_age: float,
+        *,
+        now: float | None = None,
+    ) -> list[str]:
+        """Return employees whose ``HEARTBEAT.md`` is stale or missing.
+
+        A heartbeat is stale when its indexed mtime is more than *max_age*
+        seconds before *now*; the answer reflects the last scan.
+        """
+        now = time.time() if now is None else now
+        stale: list[str] = []
+        for eid in self._files:
+            hb = self.heartbeat(eid)
+            if hb is None or now - hb.mtime > max_age:
+                stale.append(eid)
+        return stale
+
+    # ------------------------------------------------------------------
+    # Dunder helpers
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return sum(len(files) for files in self._files.values())
+
+    def __repr__(self) -> str:
+        return (
+            f"WorkspaceIndex(workspaces={len(self._files)}, files={len(self)})"
+        )
+
+
+def walk_files(
+    root: Path,
+    prefix: str = "",
+) -> Iterator[tuple[str, os.DirEntry]]:
+    """Yield ``(relative path, DirEntry)`` for every regular file under *root*.
+
+    Symlinks are not followed, so a workspace linking to a project checkout
+    is not indexed wholesale.
+    """
+    try:
+        it = os.scandir(root)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+    with it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        rel = f"{prefix}{entry.name}"
+        if entry.is_dir(follow_symlinks=False):
+            yield from walk_files(Path(entry.path), f"{rel}/")
+        elif entry.is_file(follow_symlinks=False):
+            yield rel, entry
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _sha256(path: str) -> str:
+    with open(path, "rb") as fh:
+        return hashlib.file_digest(fh, "sha256").hexdigest()
+
+
+def _try_sha256(path: str) -> str | None:
+    try:
+        return _sha256(path)
+    except FileNotFoundError:
+        return None
@@ -0,0 +1,129 @@
+"""Shared plumbing for the VWork CLI scripts.
+
+Every script (and the multiplexed ``vwork`` entry point) goes through this
+module so that:
+
+  - the ``sys.path`` fix-up for ``import lib`` happens once per process,
+  - ``rich`` is only imported when a command actually renders to a terminal,
+  - the company config is loaded at most once per process,
+  - ``--json`` output is plain :mod:`json` on stdout with no rich involved.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NoReturn
+
+# Ensure the vwork root is on sys.path so ``import lib`` works.
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from lib.config import CompanyConfig
+
+
+# ``click`` context meta key set by ``vwork --json <command>``
+JSON_META_KEY = "vwork.json"
+
+_console: Console | None = None
+_config: CompanyConfig | None = None
+
+
+def get_console() -> Console:
+    """Return the shared rich console, importing rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+def json_mode(flag: bool = False) -> bool:
+    """Return whether JSON output was requested locally or on the group."""
+    if flag:
+        return True
+    import click
+
+    ctx = click.get_current_context(silent=True)
+    return bool(ctx is not None and ctx.meta.get(JSON_META_KEY))
+
+
+def emit_json(data: Any, *, stream: bool = False) -> None:
+    """Write *data* to stdout as JSON (paths and dates become strings).
+
+    With *stream*, write one compact line and flush, for commands that emit
+    a sequence of events (JSON Lines).
+    """
+    sys.stdout.write(
+        json.dumps(
+            data, ensure_ascii=False, indent=None if stream else 2, default=str
+        )
+        + "\n"
+    )
+    if stream:
+        sys.stdout.flush()
+
+
+def fail(message: str, *, as_json: bool = False, hint: str = "") -> NoReturn:
+    """Report an error in the active output mode and exit with status 1."""
+    if as_json:
+        payload: dict[str, str] = {"error": message}
+        if hint:
+            payload["hint"] = hint
+        emit_json(payload)
+    else:
+        console = get_console()
+        console.print(f"[red]Error:[/red] {message}")
+        if hint:
+            console.print(hint)
+    raise SystemExit(1)
+
+
+def pass_failed(name: str, *, as_json: bool = False) -> Callable[[Exception], None]:
+    """Return an ``on_error`` callback for a ``--watch`` loop.
+
+    Each failed pass is reported (as an ``error`` event line in JSON mode)
+    and the loop keeps running.
+    """
+
+    def report(exc: Exception) -> None:
+        message = f"{type(exc).__name__}: {exc}"
+        if as_json:
+            emit_json(
+                {"event": "error", "at": time.time(), "in": name, "error": message},
+                stream=True,
+            )
+            return
+        from rich.markup import escape
+
+        get_console().print(f"[red]{name} pass failed:[/red] {escape(message)}")
+
+    return report
+
+
+def load_config(*, as_json: bool = False) -> CompanyConfig:
+    """Load the company config once per process, exiting cleanly on failure."""
+    global _config
+    if _config is None:
+        from lib.config import CompanyConfig
+
+        try:
+            _config = CompanyConfig()
+        except FileNotFoundError as exc:
+            fail(str(exc), as_json=as_json)
+    return _config
+
+
+def reload_config() -> CompanyConfig:
+    """Drop the cached config (e.g. after hiring) and load it again."""
+    global _config
+    _config = None
+    return load_config()
@@ -1,7 +1,12 @@
 """Assign a task to a VWork employee.
 
 Creates a new task on the board and optionally delivers it via OpenClaw
-messaging.
+messaging.  A delivered task is started right away under a dispatch lease,
+as if the dispatcher had sent it (see :mod:`lib.lease`), so it is neither
+sent again nor moved to another employee; without ``--deliver`` the
+dispatcher sends it when its assignee is free.  ``--to role:<role>``
+picks the least-loaded active employee with that role (ties go to recent
+throughput); combine with ``--division`` to stay within one division.
 
 Usage::
 
@@ -11,25 +16,25 @@ Usage::
         --task "Write EP003 outline" \\
         --title "EP003 outline" \\
         --deliver
-"""
 
-from __future__ import annotations
+    python scripts/assign.py --to role:scriptwriter \\
+        --division content-studio --task "Write EP004 outline"
 
-import sys
-from pathlib import Path
+    python scripts/assign.py --to director-chen --task "..." --priority urgent
 
-# Ensure the vwork root is on sys.path so ``import lib`` works.
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    python scripts/assign.py --to editor-lin --task "Cut EP003" \\
+        --depends-on 2026-02-05-001 --depends-on 2026-02-05-002
 
-import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+    python scripts/assign.py --to director-chen --task "..." --json
+"""
 
-from lib import CompanyConfig, OpenClawGateway, Orchestrator
+from __future__ import annotations
 
+from typing import Any
 
-console = Console()
+import click
+
+import _common
 
 
 def _derive_title(task_description: str, max_length: int = 60) -> str:
@@ -55,7 +60,8 @@ def _derive_title(task_description: str, max_length: int = 60) -> str:
     "--to",
     "assignee",
     required=True,
-    help="Target employee ID (e.g. 'director-chen').",
+    help="Target employee ID (e.g. 'director-chen') or 'role:<role>' to pick "
+    "the least-loaded employee with that role.",
 )
 @click.option(
     "--task",
@@ -71,35 +77,98 @@ def _derive_title(task_description: str, max_length: int = 60) -> str:
 @click.option(
     "--division",
     default=None,
-    help="Division ID. Derived from the employee if omitted.",
+    help="Division ID. Derived from the employee if omitted; with "
+    "'role:<role>', only employees of this division are considered.",
+)
+@click.option(
+    "--priority",
+    default="normal",
+    show_default=True,
+    type=click.Choice(["urgent", "high", "normal", "low"]),
+    help="Queue priority; waiting tasks slowly age towards urgent.",
+)
+@click.option(
+    "--depends-on",
+    "depends_on",
+    multiple=True,
+    help="ID of an active task that must be completed first (repeatable).",
 )
 @click.option(
     "--deliver/--no-deliver",
     default=False,
     show_default=True,
-    help="Also send the task via OpenClaw message.",
+    help="Also send the task via OpenClaw message and start it under a "
+    "lease (not with --depends-on).",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Emit the created task as JSON instead of rich output.",
 )
 def main(
     assignee: str,
     task_description: str,
     title: str | None,
     division: str | None,
+    priority: str,
+    depends_on: tuple[str, ...],
     deliver: bool,
+    as_json: bool,
 ) -> None:
     """Create a task and assign it to a VWork employee."""
-    try:
-        cfg = CompanyConfig()
-    except FileNotFoundError as exc:
-        console.print(f"[red]Error:[/red] {exc}")
-        raise SystemExit(1)
+    as_json = _common.json_mode(as_json)
+    cfg = _common.load_config(as_json=as_json)
+
+    from lib import OpenClawGateway, Orchestrator
+    from lib.orchestrator import PRIORITIES
+
+    orch = Orchestrator(cfg)
+
+    leases = None
+    if deliver:
+        if depends_on:
+            _common.fail(
+                "--deliver cannot be combined with --depends-on.",
+                as_json=as_json,
+                hint="The dispatcher sends the task once its dependencies "
+                "are completed.",
+            )
+        from lib.lease import LeaseManager
+
+        try:
+            leases = LeaseManager(cfg, orchestrator=orch)
+        except KeyError as exc:
+            _common.fail(
+                str(exc.args[0]),
+                as_json=as_json,
+                hint="Fix runtime.lease_fallback in company.yaml.",
+            )
+
+    # -- Resolve role:<role> to the least-loaded employee -------------
+    picked_by_role: str | None = None
+    if assignee.startswith("role:"):
+        picked_by_role = assignee[len("role:"):]
+        if division is not None and division not in cfg.divisions:
+            _common.fail(f"Unknown division '{division}'.", as_json=as_json)
+        try:
+            assignee = orch.pick_assignee(picked_by_role, division=division).id
+        except KeyError as exc:
+            roles = sorted({e.role for e in cfg.employees.values()})
+            _common.fail(
+                str(exc.args[0]),
+                as_json=as_json,
+                hint=f"Roles in use: {', '.join(roles)}",
+            )
 
     # -- Validate assignee --------------------------------------------
     if assignee not in cfg.employees:
-        console.print(f"[red]Error:[/red] Unknown employee '{assignee}'.")
-        console.print(
-            f"Available employees: {', '.join(cfg.employees.keys())}"
+        _common.fail(
+            f"Unknown employee '{assignee}'.",
+            as_json=as_json,
+            hint=f"Available employees: {', '.join(cfg.employees.keys())}",
         )
-        raise SystemExit(1)
 
     emp = cfg.employee(assignee)
 
@@ -108,26 +177,56 @@ def main(
         division = emp.division
 
     if division not in cfg.divisions:
-        console.print(f"[red]Error:[/red] Unknown division '{division}'.")
-        raise SystemExit(1)
+        _common.fail(f"Unknown division '{division}'.", as_json=as_json)
 
     # -- Resolve title ------------------------------------------------
     if title is None:
         title = _derive_title(task_description)
 
     # -- Create the task on the board ---------------------------------
-    orch = Orchestrator(cfg)
-
     try:
         task = orch.create_task(
             title=title,
             assignee=assignee,
             division=division,
             description=task_description,
+            priority=PRIORITIES[priority],
+            depends_on=list(depends_on),
         )
     except (ValueError, KeyError) as exc:
-        console.print(f"[red]Error creating task:[/red] {exc}")
-        raise SystemExit(1)
+        _common.fail(f"Error creating task: {exc}", as_json=as_json)
+
+    # -- Optional delivery via OpenClaw, as the dispatcher does it ------
+    result = None
+    if leases is not None:
+        from lib.dispatch import task_message
+
+        message = task_message(task, leases.duration(assignee))
+        result = OpenClawGateway(cfg).send_message(assignee, message, task=task)
+        if result.ok:
+            try:
+                task = leases.grant(task.id)
+            except KeyError:
+                pass  # already completed by its assignee
+
+    if as_json:
+        payload: dict[str, Any] = {"task": task.to_dict()}
+        if picked_by_role is not None:
+            payload["picked_by_role"] = picked_by_role
+        if result is not None:
+            payload["delivery"] = {
+                "ok": result.ok,
+                "returncode": result.returncode,
+                "stdout": result.stdout.strip(),
+                "stderr": result.stderr.strip(),
+            }
+        _common.emit_json(payload)
+        return
+
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = _common.get_console()
 
     # -- Display result -----------------------------------------------
     info_table = Table(show_header=False, box=None, padding=(0, 2))
@@ -136,8 +235,13 @@ def main(
     info_table.add_row("Task ID", task.id)
     info_table.add_row("Title", task.title)
     info_table.add_row("Assignee", f"{emp.emoji} {emp.name} ({assignee})")
+    if picked_by_role is not None:
+        info_table.add_row("Picked by", f"role:{picked_by_role} (least loaded)")
     info_table.add_row("Division", division)
     info_table.add_row("Status", task.status)
+    info_table.add_row("Priority", task.priority_name)
+    if task.depends_on:
+        info_table.add_row("Depends on", ", ".join(task.depends_on))
     info_table.add_row("Description", task.description)
 
     console.print()
@@ -145,37 +249,24 @@ def main(
         Panel(info_table, title="Task Created", border_style="green")
     )
 
-    # -- Optional delivery via OpenClaw -------------------------------
-    if deliver:
-        console.print()
+    if result is None:
         console.print(
-            f"Delivering task to [bold]{assignee}[/bold] via OpenClaw..."
+            "\n[dim]Use --deliver to send this task via OpenClaw.[/dim]"
         )
-
-        gw = OpenClawGateway(cfg)
-        message = (
-            f"New task assigned: {task.title}\n\n"
-            f"ID: {task.id}\n"
-            f"Description: {task.description}"
+    elif result.ok:
+        console.print(
+            f"\n[green]Task delivered to [bold]{assignee}[/bold] and started; "
+            f"lease until {task.lease_until}.[/green]"
         )
-        result = gw.send_message(assignee, message)
-
-        if result.ok:
-            console.print("[green]Task delivered successfully.[/green]")
-            if result.stdout.strip():
-                console.print(f"  {result.stdout.strip()}")
-        else:
-            console.print(
-                f"[yellow]Delivery returned non-zero "
-                f"(exit {result.returncode}).[/yellow]"
-            )
-            if result.stderr.strip():
-                console.print(f"  [dim]{result.stderr.strip()}[/dim]")
+        if result.stdout.strip():
+            console.print(f"  {result.stdout.strip()}")
     else:
         console.print(
-            "\n[dim]Use --deliver to send this task via OpenClaw.[/dim]"
+            f"\n[yellow]Delivery returned non-zero (exit {result.returncode}); "
+            "the dispatcher will send the task.[/yellow]"
         )
-
+        if result.stderr.strip():
+            console.print(f"  [dim]{result.stderr.strip()}[/dim]")
 
 if __name__ == "__main__":
     main()
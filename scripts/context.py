@@ -0,0 +1,147 @@
+"""Build agent context bundles and report their estimated token sizes.
+
+Each employee's standing context (SOUL/IDENTITY/ROLE/TOOLS plus the shared
+handbook and communication protocol) is assembled into one de-duplicated
+bundle under ``.vwork/context/``.  Bundles are rebuilt only when an input
+file's content changed.
+
+Usage::
+
+    python scripts/context.py                         # all employees
+    python scripts/context.py --budget 2000           # flag larger bundles
+    python scripts/context.py --employee director-chen --parts
+    python scripts/context.py --employee director-chen --show
+    python scripts/context.py --json
+"""
+
+from __future__ import annotations
+
+import click
+
+import _common
+
+
+@click.command()
+@click.option(
+    "--employee",
+    "employee_id",
+    default=None,
+    help="Build only this employee's bundle. Omit for all.",
+)
+@click.option(
+    "--budget",
+    default=4000,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="Estimated tokens above which a bundle is flagged (0 = no limit).",
+)
+@click.option(
+    "--parts",
+    "show_parts",
+    is_flag=True,
+    default=False,
+    help="Break each bundle down by input file.",
+)
+@click.option(
+    "--show",
+    "show_bundle",
+    is_flag=True,
+    default=False,
+    help="Print the bundle text (requires --employee).",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Emit per-employee bundle details as JSON.",
+)
+def main(
+    employee_id: str | None,
+    budget: int,
+    show_parts: bool,
+    show_bundle: bool,
+    as_json: bool,
+) -> None:
+    """Build context bundles and report estimated token counts."""
+    as_json = _common.json_mode(as_json)
+    cfg = _common.load_config(as_json=as_json)
+
+    if employee_id is not None and employee_id not in cfg.employees:
+        _common.fail(f"Unknown employee '{employee_id}'.", as_json=as_json)
+    if show_bundle and employee_id is None:
+        _common.fail("--show needs --employee.", as_json=as_json)
+
+    from lib.context import ContextBundler
+
+    bundler = ContextBundler(cfg)
+    bundles = bundler.build_all([employee_id] if employee_id is not None else None)
+    bundler.save()
+
+    if show_bundle:
+        click.echo(bundles[0].path.read_text(encoding="utf-8"), nl=False)
+        return
+
+    over = [b for b in bundles if budget and b.tokens > budget]
+    if as_json:
+        _common.emit_json({
+            "budget": budget,
+            "rebuilt": bundler.rebuilds,
+            "over_budget": [b.employee for b in over],
+            "bundles": [b.to_dict() for b in bundles],
+        })
+        return
+
+    from rich.table import Table
+
+    console = _common.get_console()
+
+    table = Table(
+        title="Agent Context Bundles",
+        show_header=True,
+        header_style="bold cyan",
+        expand=True,
+        padding=(0, 1),
+    )
+    table.add_column("Employee", style="bold", min_width=20)
+    table.add_column("Tokens", justify="right")
+    table.add_column("Deduped", justify="right")
+    table.add_column("Largest part")
+    table.add_column("Bundle", style="dim")
+    for b in sorted(bundles, key=lambda b: b.tokens, reverse=True):
+        tokens = f"{b.tokens:,}"
+        if b in over:
+            tokens = f"[yellow]{tokens}[/yellow]"
+        largest = max(b.parts, key=lambda p: p.tokens, default=None)
+        table.add_row(
+            b.employee,
+            tokens,
+            f"{b.duplicate_tokens:,}",
+            f"{largest.name} ({largest.tokens:,})" if largest else "-",
+            b.key[:12] + (" (rebuilt)" if b.rebuilt else ""),
+        )
+        if show_parts:
+            for p in b.parts:
+                table.add_row(
+                    f"  [dim]{p.name}[/dim]",
+                    f"[dim]{p.tokens:,}[/dim]",
+                    f"[dim]{p.duplicate_tokens:,}[/dim]",
+                    "",
+                    "",
+                )
+            for name in b.missing:
+                table.add_row(f"  [red]{name} (missing)[/red]", "", "", "", "")
+    console.print(table)
+    console.print(
+        f"[dim]{len(bundles)} bundle(s), {bundler.rebuilds} rebuilt; "
+        "token counts are estimates.[/dim]"
+    )
+    if over:
+        console.print(
+            f"[yellow]Over the {budget:,}-token budget: "
+            f"{', '.join(b.employee for b in over)}[/yellow]"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Send each idle employee their most urgent ready task.
+
+Tasks are taken from per-employee priority queues with aging and served
+most-urgent first, up to ``runtime.max_concurrent_agents`` busy agents.
+A delivered task is started under a lease that the agent renews through
+its ``HEARTBEAT.md`` or ``vwork task renew``.  Each pass first expires
+overdue leases: the task is re-queued (up to ``runtime.lease_max_retries``
+times), then handed to ``runtime.lease_fallback`` or marked blocked.
+
+Usage::
+
+    python scripts/dispatch.py                         # one pass
+    python scripts/dispatch.py --dry-run               # show what would happen
+    python scripts/dispatch.py --division content-studio --max-active 2
+    python scripts/dispatch.py --watch --interval 60   # daemon
+    python scripts/dispatch.py --json
+"""
+
+from __future__ import annotations
+
+import time
+
+import click
+
+import _common
+
+
+@click.command()
+@click.option(
+    "--division",
+    "division_id",
+    default=None,
+    help="Dispatch only this division's tasks. Omit for all.",
+)
+@click.option(
+    "--max-active",
+    default=None,
+    type=click.IntRange(min=0),
+    help="Busy agents allowed at once (0 = no cap) "
+    "[default: runtime.max_concurrent_agents].",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Show expiries and sends without changing the board or sending.",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    default=False,
+    help="Keep dispatching every --interval seconds until Ctrl-C.",
+)
+@click.option(
+    "--interval",
+    default=60.0,
+    show_default=True,
+    type=click.FloatRange(min=1),
+    help="Seconds between passes with --watch.",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Emit each pass as JSON (one line per pass with --watch).",
+)
+def main(
+    division_id: str | None,
+    max_active: int | None,
+    dry_run: bool,
+    watch: bool,
+    interval: float,
+    as_json: bool,
+) -> None:
+    """Dispatch ready tasks to idle employees in priority order."""
+    as_json = _common.json_mode(as_json)
+    cfg = _common.load_config(as_json=as_json)
+
+    if division_id is not None and division_id not in cfg.divisions:
+        _common.fail(
+            f"Unknown division '{division_id}'.",
+            as_json=as_json,
+            hint=f"Known divisions: {', '.join(cfg.divisions)}",
+        )
+    if watch and dry_run:
+        _common.fail("--dry-run cannot be combined with --watch.", as_json=as_json)
+
+    from lib.dispatch import DispatchReport, Dispatcher
+
+    try:
+        dispatcher = Dispatcher(cfg, max_active=max_active)
+    except KeyError as exc:
+        _common.fail(
+            str(exc.args[0]),
+            as_json=as_json,
+            hint="Fix runtime.lease_fallback in company.yaml.",
+        )
+    divisions = [division_id] if division_id is not None else None
+    console = None if as_json else _common.get_console()
+
+    def report(result: DispatchReport) -> None:
+        if as_json:
+            _common.emit_json(
+                {
+                    "event": "dispatch",
+                    "at": time.time(),
+                    "max_active": dispatcher.max_active,
+                    **result.to_dict(),
+                },
+                stream=watch,
+            )
+            return
+
+        from rich.markup import escape
+
+        for e in result.expired:
+            target = "" if e.action == "blocked" else f" -> {e.assignee}"
+            console.print(
+                f"[yellow]lease expired[/yellow] {e.task.id} "
+                f"({escape(e.task.title)}, attempt {e.task.attempts}, "
+                f"{e.task.assignee}): {e.action}{target}"
+            )
+        for d in result.dispatched:
+            if result.dry_run:
+                state = "[dim]would send[/dim]"
+            elif d.ok:
+                state = "[green]started[/green]"
+            else:
+                state = f"[red]send failed (exit {d.result.returncode})[/red]"
+            console.print(
+                f"{state} {d.task.id} \\[{d.task.priority_name}] "
+                f"{escape(d.task.title)} -> {d.task.assignee}"
+            )
+
+    if watch:
+        if console is not None:
+            console.print(
+                f"[dim]Dispatching every {interval:g}s. Ctrl-C to stop.[/dim]"
+            )
+        try:
+            dispatcher.run(
+                interval=interval,
+                division_ids=divisions,
+                on_report=report,
+                on_error=_common.pass_failed("dispatch", as_json=as_json),
+            )
+        except KeyboardInterrupt:
+            pass
+        return
+
+    result = dispatcher.tick(divisions, dry_run=dry_run)
+    report(result)
+    if console is not None and not (result.expired or result.dispatched):
+        console.print(
+            "[dim]Nothing to dispatch (no idle employee has a ready task).[/dim]"
+        )
+
+
+if __name__ == "__main__":
+    main()
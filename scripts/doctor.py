@@ -0,0 +1,126 @@
+"""Check employee workspaces against their templates.
+
+Every workspace file is hashed (in parallel, only when its size or mtime
+changed) and each template file is checked for existence, unfilled
+placeholders, and drift of the lines and sections managed by
+``org/roles.yaml``, ``org/divisions.yaml`` and ``org/employees.yaml``.
+Exits with status 1 while problems remain.
+
+Usage::
+
+    python scripts/doctor.py                        # check everyone
+    python scripts/doctor.py --employee director-chen
+    python scripts/doctor.py --fix                  # repair what is broken
+    python scripts/doctor.py --json
+"""
+
+from __future__ import annotations
+
+import time
+
+import click
+
+import _common
+
+
+@click.command()
+@click.option(
+    "--employee",
+    "employee_id",
+    default=None,
+    help="Check a single employee's workspace. Omit for all.",
+)
+@click.option(
+    "--fix",
+    is_flag=True,
+    default=False,
+    help="Re-render missing files and patch drifted sections in place.",
+)
+@click.option(
+    "--workers",
+    default=8,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Threads used for hashing and checking.",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Emit the problems (and fixes) as JSON.",
+)
+def main(employee_id: str | None, fix: bool, workers: int, as_json: bool) -> None:
+    """Verify workspaces against templates and org config."""
+    as_json = _common.json_mode(as_json)
+    cfg = _common.load_config(as_json=as_json)
+
+    if employee_id is not None and employee_id not in cfg.employees:
+        _common.fail(f"Unknown employee '{employee_id}'.", as_json=as_json)
+
+    from lib.doctor import WorkspaceDoctor
+
+    start = time.perf_counter()
+    doctor = WorkspaceDoctor(cfg, max_workers=workers)
+    checks = doctor.check([employee_id] if employee_id is not None else None)
+    problems = [c for c in checks if not c.ok]
+    reads = doctor.reads
+    if fix and problems:
+        problems = doctor.fix(problems)
+    doctor.save()
+    elapsed = time.perf_counter() - start
+    remaining = [c for c in problems if not c.ok]
+
+    if as_json:
+        _common.emit_json({
+            "checked": len(checks),
+            "read": reads,
+            "seconds": round(elapsed, 4),
+            "problems": [c.to_dict() for c in problems],
+            "remaining": len(remaining),
+        })
+        raise SystemExit(1 if remaining else 0)
+
+    console = _common.get_console()
+    if problems:
+        from rich.markup import escape
+        from rich.table import Table
+
+        table = Table(
+            title="Workspace Doctor",
+            show_header=True,
+            header_style="bold cyan",
+            expand=True,
+            padding=(0, 1),
+        )
+        table.add_column("Employee", style="bold", min_width=20)
+        table.add_column("File", min_width=12)
+        table.add_column("Status", min_width=10)
+        table.add_column("Problems")
+        styles = {"missing": "red", "error": "red", "unrendered": "yellow",
+                  "drift": "yellow"}
+        for c in problems:
+            if c.fixed:
+                status = "[green]fixed[/green]"
+            else:
+                style = styles.get(c.status, "white")
+                status = f"[{style}]{c.status}[/{style}]"
+            table.add_row(
+                c.employee, c.file, status, escape("; ".join(c.problems))
+            )
+        console.print(table)
+
+    employees = len({c.employee for c in checks})
+    console.print(
+        f"[dim]{len(checks)} file(s) in {employees} workspace(s) checked "
+        f"({reads} read) in {elapsed * 1000:.0f} ms.[/dim]"
+    )
+    if remaining:
+        hint = "" if fix else " Run with --fix to repair."
+        console.print(f"[yellow]{len(remaining)} problem(s) remain.{hint}[/yellow]")
+        raise SystemExit(1)
+    console.print("[green]All workspaces healthy.[/green]")
+
+
+if __name__ == "__main__":
+    main()
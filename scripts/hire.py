@@ -11,48 +11,162 @@ Usage::
     python scripts/hire.py --name Echo --id sound-designer-echo \\
         --role sound-designer --division content-studio \\
         --emoji "🔊" --no-register
+
+    # Bulk: validate the whole manifest, provision in parallel,
+    # write employees.yaml once and register agents concurrently.
+    python scripts/hire.py --manifest staff.yaml
+    python scripts/hire.py --manifest staff.yaml --division content-studio
+
+A manifest looks like::
+
+    defaults:
+      division: content-studio
+    employees:
+      - id: sound-designer-echo
+        name: Echo
+        role: vfx-artist
+        emoji: "🔊"
 """
 
 from __future__ import annotations
 
-import sys
 from pathlib import Path
-
-# Ensure the vwork root is on sys.path so ``import lib`` works.
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from typing import TYPE_CHECKING, Any
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-from lib import CompanyConfig, EmployeeManager, OpenClawGateway
+import _common
+
+if TYPE_CHECKING:
+    from lib import CompanyConfig
+
+
+def _hire_batch(
+    cfg: CompanyConfig,
+    manifest: Path,
+    defaults: dict[str, str],
+    register: bool,
+    workers: int,
+    as_json: bool,
+) -> None:
+    """Hire every employee listed in *manifest* in one batch."""
+    from lib import EmployeeManager, OpenClawGateway
+    from lib.employee import load_manifest
+
+    try:
+        specs = load_manifest(manifest, defaults)
+    except ValueError as exc:
+        _common.fail(str(exc), as_json=as_json)
+    if not specs:
+        _common.fail(f"No employees listed in {manifest}.", as_json=as_json)
+
+    if not as_json:
+        _common.get_console().print(
+            f"Hiring [bold]{len(specs)}[/bold] employee(s) from {manifest}..."
+        )
+
+    mgr = EmployeeManager(cfg)
+    try:
+        workspaces = mgr.create_employees(specs, max_workers=workers)
+    except (ValueError, OSError) as exc:
+        _common.fail(f"Error creating employees: {exc}", as_json=as_json)
 
+    results = {}
+    if register:
+        gw = OpenClawGateway(_common.reload_config())
+        results = gw.register_agents(workspaces)
 
-console = Console()
+    if as_json:
+        _common.emit_json({
+            "employees": [
+                {
+                    "id": spec.id,
+                    "name": spec.name,
+                    "role": spec.role,
+                    "division": spec.division,
+                    "workspace": str(workspaces[spec.id]),
+                    "registration": (
+                        {
+                            "ok": results[spec.id].ok,
+                            "returncode": results[spec.id].returncode,
+                            "stderr": results[spec.id].stderr.strip(),
+                        }
+                        if spec.id in results
+                        else None
+                    ),
+                }
+                for spec in specs
+            ],
+        })
+        return
+
+    from rich.table import Table
+
+    console = _common.get_console()
+    table = Table(
+        title="Employees Created",
+        show_header=True,
+        header_style="bold cyan",
+        expand=True,
+        padding=(0, 1),
+    )
+    table.add_column("Employee", style="bold", min_width=20)
+    table.add_column("Role")
+    table.add_column("Division")
+    table.add_column("Agent", min_width=10)
+    for spec in specs:
+        result = results.get(spec.id)
+        if result is None:
+            agent = "[dim]skipped[/dim]"
+        elif result.ok:
+            agent = "[green]OK[/green]"
+        else:
+            agent = f"[red]FAIL ({result.returncode})[/red]"
+        table.add_row(
+            f"{spec.emoji} {spec.name} ({spec.id})".strip(),
+            spec.role,
+            spec.division,
+            agent,
+        )
+    console.print()
+    console.print(table)
 
 
 @click.command()
 @click.option(
     "--name",
-    required=True,
+    default=None,
     help="Employee display name (e.g. 'Echo').",
 )
 @click.option(
     "--id",
     "employee_id",
-    required=True,
+    default=None,
     help="Employee ID slug (e.g. 'sound-designer-echo').",
 )
 @click.option(
     "--role",
-    required=True,
-    help="Role ID from roles.yaml (e.g. 'sound-designer').",
+    default=None,
+    help="Role ID from roles.yaml (e.g. 'sound-designer'). "
+    "With --manifest, the default role for entries without one.",
 )
 @click.option(
     "--division",
-    required=True,
-    help="Division ID (e.g. 'content-studio').",
+    default=None,
+    help="Division ID (e.g. 'content-studio'). "
+    "With --manifest, the default division for entries without one.",
+)
+@click.option(
+    "--manifest",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="YAML manifest listing several employees to hire in one batch.",
+)
+@click.option(
+    "--workers",
+    default=8,
+    show_default=True,
+    help="Parallel workspace provisioning threads for --manifest.",
 )
 @click.option(
     "--emoji",
@@ -65,44 +179,82 @@ console = Console()
     show_default=True,
     help="Also register employee as an OpenClaw agent.",
 )
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Emit the result as JSON instead of rich output.",
+)
 def main(
-    name: str,
-    employee_id: str,
-    role: str,
-    division: str,
+    name: str | None,
+    employee_id: str | None,
+    role: str | None,
+    division: str | None,
+    manifest: Path | None,
+    workers: int,
     emoji: str,
     register: bool,
+    as_json: bool,
 ) -> None:
     """Create a new VWork employee and provision their workspace."""
-    try:
-        cfg = CompanyConfig()
-    except FileNotFoundError as exc:
-        console.print(f"[red]Error:[/red] {exc}")
-        raise SystemExit(1)
+    as_json = _common.json_mode(as_json)
+
+    if manifest is not None:
+        if name or employee_id:
+            raise click.UsageError("--name/--id cannot be combined with --manifest.")
+        cfg = _common.load_config(as_json=as_json)
+        defaults = {
+            k: v
+            for k, v in (("role", role), ("division", division), ("emoji", emoji))
+            if v
+        }
+        _hire_batch(cfg, manifest, defaults, register, workers, as_json)
+        return
+
+    missing = [
+        flag
+        for flag, value in (
+            ("--name", name), ("--id", employee_id),
+            ("--role", role), ("--division", division),
+        )
+        if not value
+    ]
+    if missing:
+        raise click.UsageError(
+            f"Missing option(s) {', '.join(missing)} (or use --manifest)."
+        )
+    cfg = _common.load_config(as_json=as_json)
+
+    from lib import EmployeeManager, OpenClawGateway
 
     mgr = EmployeeManager(cfg)
 
     # -- Validate inputs early ----------------------------------------
     if division not in cfg.divisions:
-        console.print(f"[red]Error:[/red] Unknown division '{division}'.")
-        console.print(
-            f"Available divisions: {', '.join(cfg.divisions.keys())}"
+        _common.fail(
+            f"Unknown division '{division}'.",
+            as_json=as_json,
+            hint=f"Available divisions: {', '.join(cfg.divisions.keys())}",
         )
-        raise SystemExit(1)
 
     if role not in cfg.roles:
-        console.print(f"[red]Error:[/red] Unknown role '{role}'.")
-        console.print(f"Available roles: {', '.join(cfg.roles.keys())}")
-        raise SystemExit(1)
+        _common.fail(
+            f"Unknown role '{role}'.",
+            as_json=as_json,
+            hint=f"Available roles: {', '.join(cfg.roles.keys())}",
+        )
 
     if employee_id in cfg.employees:
-        console.print(
-            f"[red]Error:[/red] Employee '{employee_id}' already exists."
+        _common.fail(
+            f"Employee '{employee_id}' already exists.", as_json=as_json
         )
-        raise SystemExit(1)
 
     # -- Create the employee ------------------------------------------
-    console.print(f"Creating employee [bold]{name}[/bold] ({employee_id})...")
+    if not as_json:
+        _common.get_console().print(
+            f"Creating employee [bold]{name}[/bold] ({employee_id})..."
+        )
 
     try:
         workspace = mgr.create_employee(
@@ -113,8 +265,35 @@ def main(
             emoji=emoji,
         )
     except (ValueError, FileExistsError, KeyError) as exc:
-        console.print(f"[red]Error creating employee:[/red] {exc}")
-        raise SystemExit(1)
+        _common.fail(f"Error creating employee: {exc}", as_json=as_json)
+
+    if as_json:
+        payload: dict[str, Any] = {
+            "employee": {
+                "id": employee_id,
+                "name": name,
+                "role": role,
+                "division": division,
+                "emoji": emoji,
+                "workspace": str(workspace),
+            },
+        }
+        if register:
+            gw = OpenClawGateway(_common.reload_config())
+            result = gw.register_agent(employee_id)
+            payload["registration"] = {
+                "ok": result.ok,
+                "returncode": result.returncode,
+                "stdout": result.stdout.strip(),
+                "stderr": result.stderr.strip(),
+            }
+        _common.emit_json(payload)
+        return
+
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = _common.get_console()
 
     # -- Success summary ----------------------------------------------
     info_table = Table(show_header=False, box=None, padding=(0, 2))
@@ -139,8 +318,7 @@ def main(
         console.print("Registering OpenClaw agent...")
 
         # Reload config so the new employee is visible
-        cfg = CompanyConfig()
-        gw = OpenClawGateway(cfg)
+        gw = OpenClawGateway(_common.reload_config())
         result = gw.register_agent(employee_id)
 
         if result.ok:
@@ -0,0 +1,253 @@
+"""Search and compact employee memory files.
+
+``search`` indexes the ``memory/`` directories of the searched workspaces
+incrementally into ``.vwork/memory.sqlite`` (only changed files are
+re-read) and answers from the full-text index, archived entries included.
+``compact`` rolls old memory files into compressed monthly segments under
+``memory/archive/`` and reports the space reclaimed; ``show`` prints one
+entry, hot or archived.
+
+Usage::
+
+    python scripts/memory.py search "render budget"
+    python scripts/memory.py search 预算 --division content-studio
+    python scripts/memory.py search deadline --employee director-chen --json
+    python scripts/memory.py compact --dry-run
+    python scripts/memory.py compact --employee director-chen --hot-days 7
+    python scripts/memory.py show director-chen memory/archive/2026-01.zip#notes.md
+"""
+
+from __future__ import annotations
+
+import time
+
+import click
+
+import _common
+
+
+@click.group()
+def main() -> None:
+    """Search and compact employee memory files."""
+
+
+@main.command()
+@click.argument("query", nargs=-1, required=True)
+@click.option(
+    "--employee",
+    "employee_id",
+    default=None,
+    help="Search only this employee's memory.",
+)
+@click.option(
+    "--division",
+    "division_id",
+    default=None,
+    help="Search only employees of this division.",
+)
+@click.option(
+    "--limit",
+    default=20,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Maximum number of results.",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Emit matches as JSON.",
+)
+def search(
+    query: tuple[str, ...],
+    employee_id: str | None,
+    division_id: str | None,
+    limit: int,
+    as_json: bool,
+) -> None:
+    """Full-text search memory files (every term must match)."""
+    as_json = _common.json_mode(as_json)
+    cfg = _common.load_config(as_json=as_json)
+
+    if employee_id is not None and employee_id not in cfg.employees:
+        _common.fail(f"Unknown employee '{employee_id}'.", as_json=as_json)
+    if division_id is not None and division_id not in cfg.divisions:
+        _common.fail(
+            f"Unknown division '{division_id}'.",
+            as_json=as_json,
+            hint=f"Known divisions: {', '.join(cfg.divisions)}",
+        )
+
+    from lib.employee import EmployeeManager
+
+    text = " ".join(query)
+    start = time.perf_counter()
+    hits = EmployeeManager(cfg).search_memory(
+        text, employee=employee_id, division=division_id, limit=limit
+    )
+    elapsed = time.perf_counter() - start
+
+    if as_json:
+        _common.emit_json({
+            "query": text,
+            "seconds": round(elapsed, 4),
+            "hits": [hit.to_dict() for hit in hits],
+        })
+        return
+
+    from rich.markup import escape
+
+    console = _common.get_console()
+    if not hits:
+        console.print(f"[dim]No memory matches for '{escape(text)}'.[/dim]")
+        return
+    for hit in hits:
+        console.print(
+            f"[bold cyan]{hit.employee}[/bold cyan] [dim]{hit.path}[/dim]"
+        )
+        console.print(f"  {escape(hit.snippet)}")
+    console.print(
+        f"[dim]{len(hits)} match(es) in {elapsed * 1000:.0f} ms.[/dim]"
+    )
+
+
+@main.command()
+@click.option(
+    "--employee",
+    "employee_id",
+    default=None,
+    help="Compact only this employee's memory. Omit for all.",
+)
+@click.option(
+    "--hot-days",
+    default=None,
+    type=click.FloatRange(min=0),
+    help="Archive files older than this many days [default: runtime.memory_hot_days].",
+)
+@click.option(
+    "--hot-files",
+    default=None,
+    type=click.IntRange(min=0),
+    help="Always keep this many newest files [default: runtime.memory_hot_files].",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Report what would be archived without touching any file.",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Emit the per-employee report as JSON.",
+)
+def compact(
+    employee_id: str | None,
+    hot_days: float | None,
+    hot_files: int | None,
+    dry_run: bool,
+    as_json: bool,
+) -> None:
+    """Archive old memory files into compressed segments."""
+    as_json = _common.json_mode(as_json)
+    cfg = _common.load_config(as_json=as_json)
+
+    if employee_id is not None and employee_id not in cfg.employees:
+        _common.fail(f"Unknown employee '{employee_id}'.", as_json=as_json)
+
+    from lib.compaction import MemoryCompactor
+
+    compactor = MemoryCompactor(
+        cfg, hot_days=hot_days, hot_files=hot_files, dry_run=dry_run
+    )
+    reports = compactor.compact_all(
+        [employee_id] if employee_id is not None else None
+    )
+
+    if as_json:
+        _common.emit_json({
+            "dry_run": dry_run,
+            "hot_days": compactor.hot_days,
+            "hot_files": compactor.hot_files,
+            "employees": [r.to_dict() for r in reports],
+            "reclaimed": None if dry_run else sum(r.reclaimed for r in reports),
+        })
+        return
+
+    from rich.table import Table
+
+    console = _common.get_console()
+
+    table = Table(
+        title="Memory Compaction" + (" (dry run)" if dry_run else ""),
+        show_header=True,
+        header_style="bold cyan",
+        expand=True,
+        padding=(0, 1),
+    )
+    table.add_column("Employee", style="bold", min_width=20)
+    table.add_column("Archived", justify="right")
+    table.add_column("Hot before", justify="right")
+    table.add_column("Hot after", justify="right")
+    table.add_column("Archive", justify="right")
+    table.add_column("Budget", justify="right")
+    for r in reports:
+        hot_after = _kib(r.hot_bytes_after)
+        if r.over_budget:
+            hot_after = f"[yellow]{hot_after}[/yellow]"
+        table.add_row(
+            r.employee,
+            f"{r.files} ({_kib(r.archived_bytes)})",
+            _kib(r.hot_bytes_before),
+            hot_after,
+            _kib(r.archive_bytes_after),
+            _kib(r.budget) if r.budget else "-",
+        )
+    console.print(table)
+
+    files = sum(r.files for r in reports)
+    if dry_run:
+        console.print(
+            f"[dim]Would archive {files} file(s), "
+            f"{_kib(sum(r.archived_bytes for r in reports))} uncompressed.[/dim]"
+        )
+    else:
+        console.print(
+            f"[dim]Archived {files} file(s); reclaimed "
+            f"{_kib(sum(r.reclaimed for r in reports))}.[/dim]"
+        )
+    over = [r.employee for r in reports if r.over_budget]
+    if over:
+        console.print(
+            f"[yellow]Still over budget (hot tail too large): "
+            f"{', '.join(over)}[/yellow]"
+        )
+
+
+@main.command()
+@click.argument("employee_id")
+@click.argument("path")
+def show(employee_id: str, path: str) -> None:
+    """Print one memory entry (PATH as reported by search)."""
+    cfg = _common.load_config()
+    if employee_id not in cfg.employees:
+        _common.fail(f"Unknown employee '{employee_id}'.")
+
+    from lib.compaction import read_memory
+
+    try:
+        text = read_memory(cfg, employee_id, path)
+    except (FileNotFoundError, IsADirectoryError):
+        _common.fail(f"No memory entry '{path}' for {employee_id}.")
+    click.echo(text, nl=not text.endswith("\n"))
+
+
+def _kib(size: int) -> str:
+    return f"{size / 1024:.1f} KiB"
+
+
+if __name__ == "__main__":
+    main()
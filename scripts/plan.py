@@ -0,0 +1,117 @@
+"""Show the critical path through the task dependency graph.
+
+Durations are estimated from the archive (median start-to-completion
+hours per role), so the schedule sharpens as more tasks are completed.
+Tasks with zero slack are on the critical path: any delay to them delays
+the whole board.
+
+Usage::
+
+    python scripts/plan.py                    # schedule of every open task
+    python scripts/plan.py --critical-only    # just the critical tasks
+    python scripts/plan.py --default-hours 4  # estimate when there is no history
+    python scripts/plan.py --json
+"""
+
+from __future__ import annotations
+
+import click
+
+import _common
+
+
+@click.command()
+@click.option(
+    "--critical-only",
+    is_flag=True,
+    default=False,
+    help="List only the tasks with zero slack.",
+)
+@click.option(
+    "--default-hours",
+    default=8.0,
+    show_default=True,
+    type=click.FloatRange(min=0, min_open=True),
+    help="Task estimate used when the archive has no completed tasks.",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Emit the schedule as JSON instead of rich output.",
+)
+def main(critical_only: bool, default_hours: float, as_json: bool) -> None:
+    """Estimate task durations and find the critical path."""
+    as_json = _common.json_mode(as_json)
+    cfg = _common.load_config(as_json=as_json)
+
+    from lib.plan import ProjectPlanner
+
+    try:
+        plan = ProjectPlanner(cfg, default_hours=default_hours).plan()
+    except ValueError as exc:
+        _common.fail(
+            str(exc),
+            as_json=as_json,
+            hint="Remove one of the depends_on links in board/active.yaml.",
+        )
+
+    schedules = [
+        s for s in plan.tasks.values() if s.critical or not critical_only
+    ]
+    if as_json:
+        payload = plan.to_dict()
+        payload["tasks"] = [s.to_dict() for s in schedules]
+        _common.emit_json(payload)
+        return
+
+    from rich.markup import escape
+    from rich.table import Table
+
+    console = _common.get_console()
+    if not plan.tasks:
+        console.print("[dim]No open tasks on the board.[/dim]")
+        return
+
+    table = Table(title="Task Schedule (hours from now)")
+    table.add_column("", width=1)
+    table.add_column("Task", style="cyan")
+    table.add_column("Title")
+    table.add_column("Assignee")
+    table.add_column("Est.", justify="right")
+    table.add_column("Start", justify="right")
+    table.add_column("Finish", justify="right")
+    table.add_column("Slack", justify="right")
+    table.add_column("Depends on", style="dim")
+    for s in schedules:
+        table.add_row(
+            "[bold red]*[/bold red]" if s.critical else "",
+            s.task.id,
+            escape(s.task.title),
+            s.task.assignee,
+            f"{s.duration:.1f}",
+            f"{s.earliest_start:.1f}",
+            f"{s.earliest_finish:.1f}",
+            "-" if s.critical else f"{s.slack:.1f}",
+            ", ".join(s.task.depends_on),
+        )
+    console.print(table)
+
+    console.print(
+        f"\nCritical path ({len(plan.critical)} tasks): "
+        + " -> ".join(f"[bold]{tid}[/bold]" for tid in plan.critical)
+    )
+    console.print(
+        f"Estimated completion: [bold]{plan.finish_at:%Y-%m-%d %H:%M}[/bold] "
+        f"({plan.makespan:.1f} h of work along the critical path)"
+    )
+    for tid, deps in plan.missing.items():
+        console.print(
+            f"[dim]{tid}: {', '.join(deps)} no longer on the board "
+            "(treated as done).[/dim]"
+        )
+
+
+if __name__ == "__main__":
+    main()
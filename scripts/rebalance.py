@@ -0,0 +1,136 @@
+"""Move unstarted tasks from overloaded employees to idle peers.
+
+Within a division (and, by default, a role) an employee with an empty
+queue takes one unstarted task from the peer with the longest queue.  The
+rules come from the ``rebalance_*`` settings under ``runtime`` in
+``company.yaml``.  Every affected employee gets one OpenClaw message
+listing all of their moves.
+
+Usage::
+
+    python scripts/rebalance.py                       # one pass
+    python scripts/rebalance.py --dry-run             # show the moves only
+    python scripts/rebalance.py --division content-studio --no-notify
+    python scripts/rebalance.py --watch --interval 300
+    python scripts/rebalance.py --json
+"""
+
+from __future__ import annotations
+
+import time
+
+import click
+
+import _common
+
+
+@click.command()
+@click.option(
+    "--division",
+    "division_id",
+    default=None,
+    help="Rebalance only this division. Omit for all.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Show the moves without reassigning or notifying anyone.",
+)
+@click.option(
+    "--notify/--no-notify",
+    default=True,
+    show_default=True,
+    help="Message affected employees via OpenClaw.",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    default=False,
+    help="Keep rebalancing every --interval seconds until Ctrl-C.",
+)
+@click.option(
+    "--interval",
+    default=300.0,
+    show_default=True,
+    type=click.FloatRange(min=1),
+    help="Seconds between passes with --watch.",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Emit the moves as JSON (one line per pass with --watch).",
+)
+def main(
+    division_id: str | None,
+    dry_run: bool,
+    notify: bool,
+    watch: bool,
+    interval: float,
+    as_json: bool,
+) -> None:
+    """Move unstarted tasks from overloaded to idle employees."""
+    as_json = _common.json_mode(as_json)
+    cfg = _common.load_config(as_json=as_json)
+
+    if division_id is not None and division_id not in cfg.divisions:
+        _common.fail(
+            f"Unknown division '{division_id}'.",
+            as_json=as_json,
+            hint=f"Known divisions: {', '.join(cfg.divisions)}",
+        )
+    if watch and dry_run:
+        _common.fail("--dry-run cannot be combined with --watch.", as_json=as_json)
+
+    from lib.rebalance import RebalanceReport, Rebalancer
+
+    divisions = [division_id] if division_id is not None else None
+    balancer = Rebalancer(cfg)
+    console = None if as_json else _common.get_console()
+
+    def report(result: RebalanceReport) -> None:
+        if as_json:
+            _common.emit_json(
+                {"event": "rebalance", "at": time.time(), **result.to_dict()},
+                stream=watch,
+            )
+            return
+        verb = "would move" if result.dry_run else "moved"
+        for move in result.moves:
+            console.print(
+                f"[cyan]{move.source}[/cyan] -> [green]{move.target}[/green] "
+                f"{verb} {move.task.id} ({move.task.title})"
+            )
+        for eid, sent in result.notified.items():
+            if not sent.ok:
+                console.print(
+                    f"  [red]notify failed[/red] {eid} (exit {sent.returncode})"
+                )
+
+    if watch:
+        if console is not None:
+            console.print(
+                f"[dim]Rebalancing every {interval:g}s. Ctrl-C to stop.[/dim]"
+            )
+        try:
+            balancer.run(
+                interval=interval,
+                division_ids=divisions,
+                notify=notify,
+                on_report=report,
+                on_error=_common.pass_failed("rebalance", as_json=as_json),
+            )
+        except KeyboardInterrupt:
+            pass
+        return
+
+    result = balancer.rebalance_once(divisions, dry_run=dry_run, notify=notify)
+    report(result)
+    if console is not None and not result.moves:
+        console.print("[green]Queues are balanced; nothing to move.[/green]")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,24 +7,16 @@ Usage::
 
     python scripts/register_agents.py               # all employees
     python scripts/register_agents.py --employee director-chen  # single
+    python scripts/register_agents.py --json        # machine-readable
 """
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
-# Ensure the vwork root is on sys.path so ``import lib`` works.
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from typing import Any
 
 import click
-from rich.console import Console
-from rich.table import Table
-
-from lib import CompanyConfig, OpenClawGateway
-
 
-console = Console()
+import _common
 
 
 @click.command()
@@ -34,27 +26,53 @@ console = Console()
     default=None,
     help="Register a single employee by ID. Omit to register all.",
 )
-def main(employee_id: str | None) -> None:
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Emit per-employee results as JSON instead of rich output.",
+)
+def main(employee_id: str | None, as_json: bool) -> None:
     """Register VWork employees as OpenClaw agents."""
-    try:
-        cfg = CompanyConfig()
-    except FileNotFoundError as exc:
-        console.print(f"[red]Error:[/red] {exc}")
-        raise SystemExit(1)
+    as_json = _common.json_mode(as_json)
+    cfg = _common.load_config(as_json=as_json)
+
+    from lib import OpenClawGateway
 
     gw = OpenClawGateway(cfg)
 
     # Determine which employees to register
     if employee_id is not None:
         if employee_id not in cfg.employees:
-            console.print(
-                f"[red]Error:[/red] Unknown employee '{employee_id}'."
+            _common.fail(
+                f"Unknown employee '{employee_id}'.", as_json=as_json
             )
-            raise SystemExit(1)
         targets = [employee_id]
     else:
         targets = list(cfg.employees.keys())
 
+    if as_json:
+        results: list[dict[str, Any]] = []
+        for eid in targets:
+            result = gw.register_agent(eid)
+            results.append(
+                {
+                    "employee": eid,
+                    "agent_id": cfg.employee(eid).agent_id,
+                    "ok": result.ok,
+                    "returncode": result.returncode,
+                    "stdout": result.stdout.strip(),
+                    "stderr": result.stderr.strip(),
+                }
+            )
+        _common.emit_json({"results": results})
+        return
+
+    from rich.table import Table
+
+    console = _common.get_console()
+
     if not targets:
         console.print("[yellow]No employees found to register.[/yellow]")
         return
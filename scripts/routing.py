@@ -0,0 +1,151 @@
+"""Compare traffic, latency and volume of the model tiers.
+
+Reads ``.vwork/routing.jsonl``, where every routed OpenClaw message is
+logged with its tier (default or premium), the reason for it, the
+estimated tokens sent and the gateway latency.  ``--task`` previews the
+tier a task's dispatch message would get.
+
+Usage::
+
+    python scripts/routing.py                 # the last 7 days
+    python scripts/routing.py --days 30
+    python scripts/routing.py --task 2026-02-05-001
+    python scripts/routing.py --json
+"""
+
+from __future__ import annotations
+
+import time
+
+import click
+
+import _common
+
+
+@click.command()
+@click.option(
+    "--days",
+    default=7.0,
+    show_default=True,
+    type=click.FloatRange(min=0, min_open=True),
+    help="Summarise messages from this many days back.",
+)
+@click.option(
+    "--task",
+    "task_id",
+    default=None,
+    help="Show which tier this active task's dispatch would use instead.",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Emit the summary as JSON instead of rich output.",
+)
+def main(days: float, task_id: str | None, as_json: bool) -> None:
+    """Summarise model routing decisions per tier."""
+    as_json = _common.json_mode(as_json)
+    cfg = _common.load_config(as_json=as_json)
+
+    from lib.routing import ModelRouter, summarise
+
+    router = ModelRouter(cfg)
+
+    if task_id is not None:
+        from lib.dispatch import task_message
+        from lib.orchestrator import Orchestrator
+
+        try:
+            task = Orchestrator(cfg).get_task(task_id)
+        except KeyError as exc:
+            _common.fail(str(exc.args[0]), as_json=as_json)
+        if task.assignee not in cfg.employees:
+            _common.fail(
+                f"Task '{task_id}' is assigned to unknown employee "
+                f"'{task.assignee}'.",
+                as_json=as_json,
+            )
+        decision = router.route(task.assignee, task_message(task), task=task)
+        if as_json:
+            _common.emit_json({
+                "task": task.id,
+                "employee": decision.employee,
+                "tier": decision.tier,
+                "model": decision.model,
+                "reason": decision.reason,
+                "tokens": decision.tokens,
+                "routing_enabled": cfg.runtime.model_routing,
+            })
+            return
+        console = _common.get_console()
+        console.print(
+            f"{task.id} -> [bold]{decision.tier}[/bold] ({decision.model}), "
+            f"reason: {decision.reason}, ~{decision.tokens} tokens"
+        )
+        if not cfg.runtime.model_routing:
+            console.print(
+                "[yellow]runtime.model_routing is off: agents use their "
+                "registered model.[/yellow]"
+            )
+        return
+
+    since = time.time() - days * 86400
+    stats = summarise(router.log.records(since=since))
+    total = sum(s.messages for s in stats.values())
+
+    if as_json:
+        _common.emit_json({
+            "days": days,
+            "messages": total,
+            "routing_enabled": cfg.runtime.model_routing,
+            "models": {
+                "default": cfg.runtime.default_model,
+                "premium": cfg.runtime.premium_model,
+            },
+            "tiers": [s.to_dict() for s in stats.values()],
+        })
+        return
+
+    from rich.table import Table
+
+    console = _common.get_console()
+    if not total:
+        console.print(
+            f"[dim]No routed messages in the last {days:g} days "
+            f"({router.log.path}).[/dim]"
+        )
+        return
+
+    table = Table(title=f"Model Routing (last {days:g} days)")
+    table.add_column("Tier", style="bold", no_wrap=True)
+    table.add_column("Messages", justify="right")
+    table.add_column("Share", justify="right")
+    table.add_column("Failed", justify="right")
+    table.add_column("Tokens", justify="right")
+    table.add_column("Mean s", justify="right")
+    table.add_column("p50 s", justify="right")
+    table.add_column("p95 s", justify="right")
+    table.add_column("Reasons", style="dim")
+    for s in stats.values():
+        table.add_row(
+            s.tier,
+            str(s.messages),
+            f"{s.messages / total:.0%}",
+            f"[red]{s.failed}[/red]" if s.failed else "0",
+            f"{s.tokens:,}",
+            f"{s.mean_seconds:.2f}",
+            f"{s.p50_seconds:.2f}",
+            f"{s.p95_seconds:.2f}",
+            ", ".join(f"{r} {n}" for r, n in sorted(s.reasons.items())),
+        )
+    console.print(table)
+    if not cfg.runtime.model_routing:
+        console.print(
+            "[yellow]runtime.model_routing is off; no new messages are "
+            "being logged.[/yellow]"
+        )
+
+
+if __name__ == "__main__":
+    main()
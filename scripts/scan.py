@@ -0,0 +1,138 @@
+"""Scan employee workspaces into the persistent workspace index.
+
+Walks every workspace once, re-hashing only files whose size or mtime
+changed since the last scan, and saves the result to
+``.vwork/workspace-index.json`` for other commands to query.
+
+Usage::
+
+    python scripts/scan.py                          # all workspaces
+    python scripts/scan.py --employee director-chen
+    python scripts/scan.py --stale-after 24         # flag old heartbeats
+    python scripts/scan.py --json
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import click
+
+import _common
+
+
+@click.command()
+@click.option(
+    "--employee",
+    "employee_id",
+    default=None,
+    help="Rescan a single employee's workspace. Omit for all.",
+)
+@click.option(
+    "--stale-after",
+    "stale_hours",
+    default=24.0,
+    show_default=True,
+    type=click.FloatRange(min=0),
+    help="Hours after which a HEARTBEAT.md counts as stale.",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Emit scan statistics and per-workspace totals as JSON.",
+)
+def main(employee_id: str | None, stale_hours: float, as_json: bool) -> None:
+    """Index employee workspace files (sizes, mtimes, hashes)."""
+    as_json = _common.json_mode(as_json)
+    cfg = _common.load_config(as_json=as_json)
+
+    if employee_id is not None and employee_id not in cfg.employees:
+        _common.fail(f"Unknown employee '{employee_id}'.", as_json=as_json)
+
+    from lib.workspace import WorkspaceIndex
+
+    index = WorkspaceIndex(cfg)
+    stats = index.scan([employee_id] if employee_id is not None else None)
+    index.save()
+
+    ids = [employee_id] if employee_id is not None else index.employees()
+    stale = set(index.stale_heartbeats(stale_hours * 3600))
+    now = time.time()
+    rows: list[dict[str, Any]] = []
+    for eid in ids:
+        if eid not in index.employees():
+            continue
+        hb = index.heartbeat(eid)
+        rows.append({
+            "employee": eid,
+            "files": len(index.records(eid)),
+            "memory_files": len(index.memory_files(eid)),
+            "bytes": index.total_size(eid),
+            "heartbeat_age": round(now - hb.mtime, 1) if hb else None,
+            "stale": eid in stale,
+        })
+
+    if as_json:
+        _common.emit_json({
+            "index": str(index.path),
+            "stats": {
+                "workspaces": stats.workspaces,
+                "files": stats.files,
+                "hashed": stats.hashed,
+                "unchanged": stats.unchanged,
+                "removed": stats.removed,
+                "missing": stats.missing,
+                "seconds": round(stats.seconds, 4),
+            },
+            "workspaces": rows,
+        })
+        return
+
+    from rich.table import Table
+
+    console = _common.get_console()
+
+    table = Table(
+        title="Workspace Index",
+        show_header=True,
+        header_style="bold cyan",
+        expand=True,
+        padding=(0, 1),
+    )
+    table.add_column("Employee", style="bold", min_width=20)
+    table.add_column("Files", justify="right")
+    table.add_column("Memory", justify="right")
+    table.add_column("Size", justify="right")
+    table.add_column("Heartbeat", min_width=12)
+    for row in rows:
+        age = row["heartbeat_age"]
+        if age is None:
+            heartbeat = "[red]missing[/red]"
+        else:
+            heartbeat = f"{age / 3600:.1f}h ago"
+            if row["stale"]:
+                heartbeat = f"[yellow]{heartbeat}[/yellow]"
+        table.add_row(
+            row["employee"],
+            str(row["files"]),
+            str(row["memory_files"]),
+            f"{row['bytes'] / 1024:.1f} KiB",
+            heartbeat,
+        )
+    console.print(table)
+    console.print(
+        f"[dim]{stats.files} file(s) in {stats.workspaces} workspace(s): "
+        f"{stats.hashed} hashed, {stats.unchanged} unchanged, "
+        f"{stats.removed} removed in {stats.seconds * 1000:.0f} ms.[/dim]"
+    )
+    if stats.missing:
+        console.print(
+            f"[yellow]No workspace for: {', '.join(stats.missing)}[/yellow]"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,82 @@
 """Daily standup report for VWork.
 
-Collects status from each division -- active tasks, employee headcount,
-and heartbeat summaries -- then prints a formatted Markdown report.
-Optionally sends the report to the founder via Telegram through OpenClaw.
+Collects status from each division -- active tasks, the employee roster
+and heartbeat summaries, read concurrently under one deadline for the
+whole report -- then prints a formatted Markdown report.
+Optionally sends the report via Telegram through OpenClaw: split into
+chunks that fit the channel limit, to the founder's relay and/or each
+division director (their own section only), recipients in parallel and
+chunks in order per recipient.
 
 Usage::
 
     python scripts/standup.py                          # print all
     python scripts/standup.py --division content-studio # one division
     python scripts/standup.py --send                   # print + send
+    python scripts/standup.py --json                   # machine-readable
+    python scripts/standup.py --timeout 2              # skip slow divisions
+    python scripts/standup.py --since-last --send      # only what changed
+    python scripts/standup.py --send --route both      # + each director
+
+``--since-last`` compares against the last report that was sent
+successfully: the sections are stored only after every chunk
+was delivered, so previews and failed sends never move the baseline.
 """
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
-# Ensure the vwork root is on sys.path so ``import lib`` works.
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from typing import TYPE_CHECKING, Any
 
 import click
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
 
-from lib import CompanyConfig, OpenClawGateway, Orchestrator
+import _common
+
+if TYPE_CHECKING:
+    from lib import CompanyConfig
+    from lib.orchestrator import StandupEntry
+    from lib.standup import DeliveryResult
 
 
-console = Console()
+def _entry_payload(entry: StandupEntry) -> dict[str, Any]:
+    """Return a JSON-serialisable view of a standup entry."""
+    return {
+        "division_id": entry.division_id,
+        "division_name": entry.division_name,
+        "director": entry.director,
+        "employee_count": entry.employee_count,
+        "active_tasks": [t.to_dict() for t in entry.active_tasks],
+        "heartbeat_summary": entry.heartbeat_summary,
+        "timed_out": entry.timed_out,
+        "employees": [
+            {
+                "id": emp.id,
+                "name": emp.name,
+                "role": emp.role,
+                "status": emp.status,
+                "task_count": emp.task_count,
+                "heartbeat_summary": emp.heartbeat_summary,
+                "heartbeat_updated": emp.heartbeat_updated or None,
+            }
+            for emp in entry.employees
+        ],
+    }
+
+
+def _delivery_payload(delivery: DeliveryResult) -> dict[str, Any]:
+    return {
+        "recipient": delivery.recipient,
+        "ok": delivery.ok,
+        "chunks": delivery.total,
+        "sent": delivery.sent,
+        "results": [
+            {
+                "ok": r.ok,
+                "returncode": r.returncode,
+                "stderr": r.stderr.strip(),
+            }
+            for r in delivery.results
+        ],
+    }
 
 
 @click.command()
@@ -43,41 +92,117 @@ console = Console()
     show_default=True,
     help="Send the report to the founder via Telegram.",
 )
-def main(division_id: str | None, send: bool) -> None:
+@click.option(
+    "--route",
+    type=click.Choice(["founder", "directors", "both"]),
+    default="founder",
+    show_default=True,
+    help="With --send: whole report to the founder, each director's own "
+    "section to them, or both.",
+)
+@click.option(
+    "--chunk-size",
+    default=4000,
+    show_default=True,
+    type=click.IntRange(min=200),
+    help="Maximum characters per message; longer reports are split.",
+)
+@click.option(
+    "--since-last",
+    is_flag=True,
+    default=False,
+    help="Only include divisions that changed since the previous standup.",
+)
+@click.option(
+    "--timeout",
+    default=5.0,
+    show_default=True,
+    type=click.FloatRange(min=0),
+    help="Deadline in seconds for all heartbeat reads; divisions not fully "
+    "read by then are reported as timed out.",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Emit the report and entries as JSON instead of rich output.",
+)
+def main(
+    division_id: str | None,
+    send: bool,
+    route: str,
+    chunk_size: int,
+    since_last: bool,
+    timeout: float,
+    as_json: bool,
+) -> None:
     """Generate and display a daily standup report."""
-    try:
-        cfg = CompanyConfig()
-    except FileNotFoundError as exc:
-        console.print(f"[red]Error:[/red] {exc}")
-        raise SystemExit(1)
+    as_json = _common.json_mode(as_json)
+    cfg = _common.load_config(as_json=as_json)
 
     # Validate division if specified
     if division_id is not None and division_id not in cfg.divisions:
-        console.print(
-            f"[red]Error:[/red] Unknown division '{division_id}'."
-        )
-        console.print(
-            f"Available divisions: {', '.join(cfg.divisions.keys())}"
+        _common.fail(
+            f"Unknown division '{division_id}'.",
+            as_json=as_json,
+            hint=f"Available divisions: {', '.join(cfg.divisions.keys())}",
         )
-        raise SystemExit(1)
+
+    from lib import Orchestrator
+    from lib.standup import StandupSectionCache
 
     orch = Orchestrator(cfg)
 
-    # Collect standup entries
-    entries = orch.daily_standup()
+    # Collect standup entries (only the requested division's files are read)
+    entries = orch.daily_standup(
+        division_ids=[division_id] if division_id is not None else None,
+        division_timeout=timeout,
+    )
 
-    # Filter to a single division if requested
     if division_id is not None:
-        entries = [e for e in entries if e.division_id == division_id]
         if not entries:
-            console.print(
-                f"[yellow]No standup data for division "
-                f"'{division_id}'.[/yellow]"
-            )
+            if as_json:
+                _common.emit_json({"report": "", "entries": []})
+            else:
+                _common.get_console().print(
+                    f"[yellow]No standup data for division "
+                    f"'{division_id}'.[/yellow]"
+                )
             return
 
-    # Format to Markdown
-    report = orch.format_standup(entries)
+    # Format to Markdown, noting the sections that read differently now
+    sections = StandupSectionCache.for_config(cfg)
+    report = orch.format_standup(
+        entries, sections=sections, changed_only=since_last
+    )
+    unchanged = False
+    if since_last:
+        entries = [e for e in entries if e.division_id in sections.changed]
+        # Nothing new is not worth a Telegram message
+        unchanged = not entries
+        send = send and not unchanged
+
+    if as_json:
+        payload: dict[str, Any] = {
+            "report": report,
+            "entries": [_entry_payload(e) for e in entries],
+            "changed": sections.changed,
+        }
+        if send:
+            delivered = _deliver(cfg, entries, report, route, chunk_size, True)
+            payload["delivery"] = [_delivery_payload(d) for d in delivered]
+            if all(d.ok for d in delivered):
+                sections.save()
+        _common.emit_json(payload)
+        if send and not all(d.ok for d in delivered):
+            raise SystemExit(1)
+        return
+
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+
+    console = _common.get_console()
 
     # Display
     console.print()
@@ -93,39 +218,62 @@ def main(division_id: str | None, send: bool) -> None:
     # Optionally send via Telegram
     if send:
         console.print()
-        console.print("Sending standup report to founder via Telegram...")
-
-        gw = OpenClawGateway(cfg)
+        console.print("Sending standup report via Telegram...")
 
-        # Find a director or ops-manager to relay the message through.
-        # We pick the first available employee to act as the sender.
-        sender_id = _pick_sender(cfg)
-        if sender_id is None:
+        delivered = _deliver(cfg, entries, report, route, chunk_size, False)
+        for d in delivered:
+            if d.ok:
+                console.print(
+                    f"[green]Sent {d.total} message(s) "
+                    f"via {d.recipient}.[/green]"
+                )
+                continue
+            failed = d.results[-1]
             console.print(
-                "[red]Error:[/red] No active employees found to send through."
+                f"[red]Failed to send to {d.recipient} after "
+                f"{d.sent}/{d.total} message(s) "
+                f"(exit {failed.returncode}).[/red]"
             )
+            if failed.stderr.strip():
+                console.print(f"  [dim]{failed.stderr.strip()}[/dim]")
+        if not all(d.ok for d in delivered):
             raise SystemExit(1)
-
-        result = gw.send_message(sender_id, report)
-
-        if result.ok:
-            console.print(
-                f"[green]Report sent successfully "
-                f"via {sender_id}.[/green]"
-            )
-        else:
-            console.print(
-                f"[red]Failed to send report "
-                f"(exit {result.returncode}).[/red]"
-            )
-            if result.stderr.strip():
-                console.print(f"  [dim]{result.stderr.strip()}[/dim]")
+        sections.save()
+    elif unchanged:
+        console.print("\n[dim]No changes since the last standup.[/dim]")
     else:
         console.print(
             "\n[dim]Use --send to deliver this report via Telegram.[/dim]"
         )
 
 
+def _deliver(
+    cfg: CompanyConfig,
+    entries: list[StandupEntry],
+    report: str,
+    route: str,
+    chunk_size: int,
+    as_json: bool,
+) -> list[DeliveryResult]:
+    """Split the report per recipient and send the chunks concurrently."""
+    from lib import OpenClawGateway
+    from lib.standup import deliver, plan_delivery
+
+    relay = _pick_sender(cfg)
+    if relay is None and route != "directors":
+        _common.fail("No active employees found to send through.", as_json=as_json)
+    plan = plan_delivery(
+        cfg, entries, report, relay=relay, route=route, limit=chunk_size
+    )
+    if not plan:
+        _common.fail("No recipients for this route.", as_json=as_json)
+    return deliver(
+        OpenClawGateway(cfg),
+        plan,
+        max_workers=cfg.runtime.max_concurrent_agents,
+    )
+
+
 def _pick_sender(cfg: CompanyConfig) -> str | None:
     """Choose the best employee to act as the Telegram relay.
 
@@ -1,46 +1,73 @@
 """VWork company status dashboard.
 
 Displays a rich terminal overview of the company: divisions, employees,
-projects, heartbeat summaries, and active task counts.
+projects, heartbeat summaries, and active task counts.  ``--json`` emits the
+same data as JSON without importing rich.
+
+``--watch`` keeps the dashboard on screen with ``rich.live``.  It sleeps on
+file-change events for the board, the org files and the division
+heartbeats, and rebuilds only the panels whose data changed, so an idle
+dashboard costs nothing.  With ``--json`` it emits one JSON line per change.
+
+``--format json|prom`` is the monitoring endpoint: task counters from the
+cached board index, headcount, heartbeat ages and gateway health, without
+rich or a full board parse.
 
 Usage::
 
     python scripts/status.py
+    python scripts/status.py --json
+    python scripts/status.py --watch
+    python scripts/status.py --format prom    # monitoring counters
     pixi run status
 """
 
 from __future__ import annotations
 
 import sys
-from pathlib import Path
-
-# Ensure the vwork root is on sys.path so ``import lib`` works.
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from typing import TYPE_CHECKING, Any
 
 import click
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
 
-from lib import CompanyConfig, DivisionManager, Orchestrator
+import _common
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from lib import CompanyConfig, DivisionManager, Orchestrator
+
 
+def _heartbeat_preview(
+    dm: DivisionManager,
+    division_id: str,
+    max_lines: int = 3,
+) -> str:
+    """Return the first *max_lines* of a heartbeat, trimmed.
 
-console = Console()
+    Only the start of the file is read, so huge heartbeats stay cheap.
+    """
+    summary = dm.get_heartbeat_summary(division_id, max_lines=max_lines)
+    if summary.truncated:
+        return summary.text + "\n..."
+    return summary.text
 
 
-def _heartbeat_preview(heartbeat: str, max_lines: int = 3) -> str:
-    """Return the first *max_lines* of a heartbeat, trimmed."""
-    lines = heartbeat.splitlines()
-    preview = "\n".join(lines[:max_lines])
-    if len(lines) > max_lines:
-        preview += "\n..."
-    return preview
+def _director_display(cfg: CompanyConfig, director_id: str) -> str:
+    """Return ``Name (id)`` for a director, or the raw ID if unknown."""
+    try:
+        director_emp = cfg.employee(director_id)
+        return f"{director_emp.name} ({director_emp.id})"
+    except KeyError:
+        return director_id or "(none)"
 
 
 def _build_division_table(cfg: CompanyConfig, dm: DivisionManager) -> Table:
     """Build a rich Table summarising every division."""
+    from rich.table import Table
+
     table = Table(
         title="Divisions",
         show_header=True,
@@ -54,54 +81,86 @@ def _build_division_table(cfg: CompanyConfig, dm: DivisionManager) -> Table:
     table.add_column("Projects", justify="right", min_width=6)
     table.add_column("Heartbeat", ratio=1)
 
-    for div_status in dm.list_divisions():
-        director_display = div_status.director or "(none)"
-        # Try to resolve director name from config
-        try:
-            director_emp = cfg.employee(div_status.director)
-            director_display = f"{director_emp.name} ({director_emp.id})"
-        except KeyError:
-            pass
-
-        heartbeat_preview = _heartbeat_preview(div_status.heartbeat)
-
+    for div in cfg.divisions.values():
         table.add_row(
-            f"{div_status.name}\n[dim]{div_status.name_cn}[/dim]",
-            director_display,
-            str(len(div_status.employees)),
-            str(len(div_status.projects)),
-            heartbeat_preview,
+            f"{div.name}\n[dim]{div.name_cn}[/dim]",
+            _director_display(cfg, div.director),
+            str(len(dm.get_employees(div.id))),
+            str(len(div.projects)),
+            _heartbeat_preview(dm, div.id),
         )
 
     return table
 
 
-def _build_task_summary(orch: Orchestrator) -> str:
-    """Return a one-line task summary string."""
+def _task_counts(orch: Orchestrator) -> dict[str, int]:
+    """Return total / active / blocked task counts."""
     all_tasks = orch.list_tasks()
-    active = [t for t in all_tasks if t.status == "active"]
-    blocked = [t for t in all_tasks if t.status == "blocked"]
+    return {
+        "total": len(all_tasks),
+        "active": sum(1 for t in all_tasks if t.status == "active"),
+        "blocked": sum(1 for t in all_tasks if t.status == "blocked"),
+    }
+
+
+def _build_task_summary(counts: dict[str, int]) -> str:
+    """Return a one-line task summary string."""
     parts: list[str] = []
-    parts.append(f"{len(all_tasks)} total")
-    parts.append(f"{len(active)} active")
-    if blocked:
-        parts.append(f"{len(blocked)} blocked")
+    parts.append(f"{counts['total']} total")
+    parts.append(f"{counts['active']} active")
+    if counts["blocked"]:
+        parts.append(f"{counts['blocked']} blocked")
     return ", ".join(parts)
 
 
-@click.command()
-def main() -> None:
-    """Display the VWork company status dashboard."""
-    try:
-        cfg = CompanyConfig()
-    except FileNotFoundError as exc:
-        console.print(f"[red]Error:[/red] {exc}")
-        raise SystemExit(1)
-
-    dm = DivisionManager(cfg)
-    orch = Orchestrator(cfg)
+def _status_payload(
+    cfg: CompanyConfig,
+    dm: DivisionManager,
+    orch: Orchestrator,
+) -> dict[str, Any]:
+    """Collect the dashboard data as plain JSON-serialisable values."""
+    return {
+        "company": {
+            "name": cfg.company.name,
+            "name_cn": cfg.company.name_cn,
+            "tagline": cfg.company.tagline,
+            "founder": cfg.company.founder,
+            "founded": cfg.company.founded,
+            "platform": cfg.runtime.platform,
+            "default_model": cfg.runtime.default_model,
+        },
+        "divisions": [
+            {
+                "id": div.id,
+                "name": div.name,
+                "name_cn": div.name_cn,
+                "director": div.director,
+                "employees": len(dm.get_employees(div.id)),
+                "projects": len(div.projects),
+                "has_heartbeat": dm.has_heartbeat(div.id),
+                "heartbeat_preview": _heartbeat_preview(dm, div.id),
+            }
+            for div in cfg.divisions.values()
+        ],
+        "tasks": _task_counts(orch),
+        "employees": [
+            {
+                "id": emp.id,
+                "name": emp.name,
+                "role": emp.role,
+                "division": emp.division,
+                "status": emp.status,
+            }
+            for emp in cfg.employees.values()
+        ],
+    }
+
+
+def _company_panel(cfg: CompanyConfig) -> Panel:
+    """Build the company header panel."""
+    from rich.panel import Panel
+    from rich.text import Text
 
-    # -- Company header ------------------------------------------------
     header_text = Text()
     header_text.append(cfg.company.name, style="bold magenta")
     header_text.append(f" ({cfg.company.name_cn})", style="dim")
@@ -111,25 +170,24 @@ def main() -> None:
     header_text.append(f"  |  Platform: {cfg.runtime.platform}")
     header_text.append(f"  |  Model: {cfg.runtime.default_model}")
 
-    console.print(Panel(header_text, title="Company Info", border_style="blue"))
+    return Panel(header_text, title="Company Info", border_style="blue")
 
-    # -- Division table ------------------------------------------------
-    console.print()
-    console.print(_build_division_table(cfg, dm))
 
-    # -- Task board summary -------------------------------------------
-    console.print()
-    task_summary = _build_task_summary(orch)
-    console.print(
-        Panel(
-            f"[bold]{task_summary}[/bold]",
-            title="Task Board",
-            border_style="green",
-        )
+def _task_panel(counts: dict[str, int]) -> Panel:
+    """Build the task board summary panel."""
+    from rich.panel import Panel
+
+    return Panel(
+        f"[bold]{_build_task_summary(counts)}[/bold]",
+        title="Task Board",
+        border_style="green",
     )
 
-    # -- Employee roster (compact) ------------------------------------
-    console.print()
+
+def _build_employee_table(cfg: CompanyConfig) -> Table:
+    """Build the compact employee roster."""
+    from rich.table import Table
+
     emp_table = Table(
         title="All Employees",
         show_header=True,
@@ -153,7 +211,234 @@ def main() -> None:
             f"[{status_style}]{emp.status}[/{status_style}]",
         )
 
-    console.print(emp_table)
+    return emp_table
+
+
+def _render(cfg: CompanyConfig, dm: DivisionManager, orch: Orchestrator) -> None:
+    """Print the rich dashboard."""
+    console = _common.get_console()
+
+    console.print(_company_panel(cfg))
+    console.print()
+    console.print(_build_division_table(cfg, dm))
+    console.print()
+    console.print(_task_panel(_task_counts(orch)))
+    console.print()
+    console.print(_build_employee_table(cfg))
+
+
+# ---------------------------------------------------------------------------
+# Watch mode
+# ---------------------------------------------------------------------------
+
+
+class _Dashboard:
+    """Per-panel fingerprints and renderables for ``--watch``.
+
+    A panel is rebuilt only when the data it shows changed, and the screen
+    is only redrawn when at least one panel was rebuilt.
+    """
+
+    PANELS = ("company", "divisions", "tasks", "employees")
+
+    def __init__(self, cfg: CompanyConfig) -> None:
+        self._fingerprints: dict[str, object] = {}
+        self._renderables: dict[str, Any] = {}
+        self.bind(cfg)
+
+    def bind(self, cfg: CompanyConfig) -> None:
+        from lib import DivisionManager, Orchestrator
+
+        self.cfg = cfg
+        self.dm = DivisionManager(cfg)
+        self.orch = Orchestrator(cfg)
+
+    def watch_paths(self) -> list[Path]:
+        """Return the files whose changes can alter the dashboard."""
+        cfg = self.cfg
+        return [
+            cfg.root / "company.yaml",
+            cfg.paths.org,
+            cfg.paths.board / "active.yaml",
+            *(self.dm.heartbeat_path(div_id) for div_id in cfg.divisions),
+        ]
+
+    def refresh(self, panels: tuple[str, ...] | set[str] = PANELS) -> bool:
+        """Rebuild the given panels if their data changed; report whether any did."""
+        changed = False
+        for panel in panels:
+            fingerprint = self._fingerprint(panel)
+            if self._fingerprints.get(panel) == fingerprint:
+                continue
+            self._fingerprints[panel] = fingerprint
+            self._renderables[panel] = self._build(panel, fingerprint)
+            changed = True
+        return changed
+
+    def renderable(self) -> Any:
+        from rich.console import Group
+        from rich.text import Text
+
+        parts: list[Any] = []
+        for panel in self.PANELS:
+            if parts:
+                parts.append(Text(""))
+            parts.append(self._renderables[panel])
+        return Group(*parts)
+
+    def _fingerprint(self, panel: str) -> object:
+        cfg = self.cfg
+        if panel == "company":
+            return (cfg.company, cfg.runtime)
+        if panel == "divisions":
+            return tuple(
+                (
+                    div.name,
+                    div.name_cn,
+                    _director_display(cfg, div.director),
+                    len(self.dm.get_employees(div.id)),
+                    len(div.projects),
+                    _heartbeat_preview(self.dm, div.id),
+                )
+                for div in cfg.divisions.values()
+            )
+        if panel == "tasks":
+            return tuple(_task_counts(self.orch).items())
+        return tuple(
+            (e.id, e.emoji, e.name, e.role, e.division, e.status)
+            for e in cfg.employees.values()
+        )
+
+    def _build(self, panel: str, fingerprint: Any) -> Any:
+        if panel == "company":
+            return _company_panel(self.cfg)
+        if panel == "divisions":
+            return _build_division_table(self.cfg, self.dm)
+        if panel == "tasks":
+            return _task_panel(dict(fingerprint))
+        return _build_employee_table(self.cfg)
+
+
+def _panels_for(changed: set[Path], dash: _Dashboard) -> set[str] | None:
+    """Map changed paths to dashboard panels; ``None`` means reload config."""
+    cfg = dash.cfg
+    panels: set[str] = set()
+    for path in changed:
+        if path == cfg.root / "company.yaml" or path.parent == cfg.paths.org:
+            return None
+        if path == cfg.paths.board / "active.yaml":
+            panels.add("tasks")
+        elif path.name == "HEARTBEAT.md":
+            panels.add("divisions")
+    return panels
+
+
+def _watch(cfg: CompanyConfig, *, as_json: bool) -> None:
+    """Re-render (or re-emit) the dashboard whenever its inputs change."""
+    import yaml
+
+    from lib.config import CompanyConfig as _CompanyConfig
+    from lib.watch import make_watcher
+
+    dash = _Dashboard(cfg)
+    watcher = make_watcher()
+    for path in dash.watch_paths():
+        watcher.add(path)
+
+    def updates():
+        """Yield after each batch of changes that touched the dashboard."""
+        while True:
+            changed = watcher.wait()
+            panels = _panels_for(changed, dash)
+            if panels is None:
+                try:
+                    dash.bind(_CompanyConfig(dash.cfg.root))
+                except (OSError, ValueError, KeyError, yaml.YAMLError):
+                    continue  # mid-edit; wait for the next save
+                for path in dash.watch_paths():
+                    watcher.add(path)
+                panels = set(dash.PANELS)
+            if panels and dash.refresh(panels):
+                yield
+
+    try:
+        if as_json:
+            payload = _status_payload(dash.cfg, dash.dm, dash.orch)
+            _common.emit_json(payload, stream=True)
+            for _ in updates():
+                latest = _status_payload(dash.cfg, dash.dm, dash.orch)
+                if latest != payload:
+                    payload = latest
+                    _common.emit_json(payload, stream=True)
+            return
+
+        from rich.live import Live
+
+        dash.refresh()
+        with Live(
+            dash.renderable(),
+            console=_common.get_console(),
+            auto_refresh=False,
+        ) as live:
+            for _ in updates():
+                live.update(dash.renderable(), refresh=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+
+@click.command()
+@click.option(
+    "--watch",
+    is_flag=True,
+    default=False,
+    help="Keep running and redraw the panels whose data changes.",
+)
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(["table", "json", "prom"]),
+    default="table",
+    show_default=True,
+    help="json/prom: emit monitoring counters from cached indexes only.",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Emit machine-readable JSON instead of the rich dashboard.",
+)
+def main(watch: bool, fmt: str, as_json: bool) -> None:
+    """Display the VWork company status dashboard."""
+    as_json = _common.json_mode(as_json)
+    cfg = _common.load_config(as_json=as_json or fmt != "table")
+
+    if fmt != "table":
+        from lib.metrics import collect_metrics, format_prometheus
+
+        metrics = collect_metrics(cfg)
+        if fmt == "prom":
+            sys.stdout.write(format_prometheus(metrics))
+        else:
+            _common.emit_json(metrics)
+        return
+
+    if watch:
+        _watch(cfg, as_json=as_json)
+        return
+
+    from lib import DivisionManager, Orchestrator
+
+    dm = DivisionManager(cfg)
+    orch = Orchestrator(cfg)
+
+    if as_json:
+        _common.emit_json(_status_payload(cfg, dm, orch))
+        return
+
+    _render(cfg, dm, orch)
 
 
 if __name__ == "__main__":
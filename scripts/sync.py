@@ -0,0 +1,180 @@
+"""Re-provision only what changed since the last sync.
+
+Compares the current org config against the baseline snapshot written by
+the previous successful sync (``.vwork/synced.snapshot``), re-registers
+only agents whose resolved model or workspace changed, and in workspace
+files whose placeholders now render differently rewrites only the lines
+and sections holding those values; what agents wrote is kept.  Without a
+baseline every employee is registered once, like ``register_agents.py``;
+a baseline written by an older VWork (a different config layout) is
+treated the same way and replaced after the sync.
+
+Usage::
+
+    python scripts/sync.py --dry-run     # show the diff and plan
+    python scripts/sync.py               # apply it
+    python scripts/sync.py --json
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import click
+
+import _common
+
+
+BASELINE_FILENAME = "synced.snapshot"
+
+
+@click.command()
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Only print the diff and the planned actions.",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Emit the diff, plan and results as JSON instead of rich output.",
+)
+def main(dry_run: bool, as_json: bool) -> None:
+    """Re-register and re-render only what changed since the last sync."""
+    as_json = _common.json_mode(as_json)
+    cfg = _common.load_config(as_json=as_json)
+
+    from lib import EmployeeManager, OpenClawGateway
+    from lib.diff import SyncPlan, diff_configs, plan_sync
+    from lib.snapshot import ConfigSnapshot, publish_snapshot
+
+    baseline_path = cfg.paths.state / BASELINE_FILENAME
+    mgr = EmployeeManager(cfg)
+
+    old = None
+    notice: str | None = None
+    if baseline_path.exists():
+        try:
+            with ConfigSnapshot(baseline_path) as snap:
+                old = snap.config
+        except ValueError as exc:
+            notice = f"Ignoring unusable sync baseline: {exc}"
+
+    if old is not None:
+        diff = diff_configs(old, cfg)
+        plan = plan_sync(old, cfg, mgr, diff)
+        diff_payload: dict[str, Any] | None = diff.to_dict()
+    else:
+        # No baseline yet: register everyone, leave workspaces as they are.
+        diff_payload = None
+        plan = SyncPlan(register=list(cfg.employees))
+
+    results: list[dict[str, Any]] = []
+    failed = False
+    if not dry_run:
+        gw = OpenClawGateway(cfg)
+        for eid in plan.register:
+            result = gw.register_agent(eid)
+            failed = failed or not result.ok
+            results.append({
+                "employee": eid,
+                "action": "register",
+                "ok": result.ok,
+                "detail": (result.stderr or result.stdout).strip(),
+            })
+        for eid, files in plan.rerender.items():
+            try:
+                written = mgr.rerender_files(
+                    eid, files, previous=plan.previous.get(eid)
+                )
+            except FileNotFoundError as exc:
+                failed = True
+                results.append({
+                    "employee": eid,
+                    "action": "rerender",
+                    "ok": False,
+                    "detail": str(exc),
+                })
+                continue
+            results.append({
+                "employee": eid,
+                "action": "rerender",
+                "ok": True,
+                "detail": ", ".join(p.name for p in written),
+            })
+        # Keep the old baseline on failure so the next run retries.
+        if not failed:
+            publish_snapshot(cfg, baseline_path)
+
+    if as_json:
+        _common.emit_json({
+            "diff": diff_payload,
+            "plan": {
+                "register": plan.register,
+                "rerender": plan.rerender,
+                "removed": plan.removed,
+            },
+            "dry_run": dry_run,
+            "results": results,
+            "notice": notice,
+        })
+        if failed:
+            raise SystemExit(1)
+        return
+
+    from rich.markup import escape
+    from rich.table import Table
+
+    console = _common.get_console()
+
+    if diff_payload is None:
+        reason = "No sync baseline found" if notice is None else escape(notice)
+        console.print(
+            f"[yellow]{reason} -- registering all "
+            f"{len(plan.register)} employee(s).[/yellow]"
+        )
+    elif plan.is_empty and not plan.removed:
+        console.print("[green]Everything is in sync.[/green]")
+        return
+
+    plan_table = Table(
+        title="Sync Plan" + (" (dry run)" if dry_run else ""),
+        show_header=True,
+        header_style="bold cyan",
+        expand=True,
+        padding=(0, 1),
+    )
+    plan_table.add_column("Employee", style="bold", min_width=20)
+    plan_table.add_column("Action", min_width=10)
+    plan_table.add_column("Details", ratio=1)
+    for eid in plan.register:
+        plan_table.add_row(eid, "register", cfg.employee_model(eid))
+    for eid, files in plan.rerender.items():
+        plan_table.add_row(eid, "re-render", ", ".join(files))
+    for eid in plan.removed:
+        plan_table.add_row(eid, "[dim]removed[/dim]", "(agent left registered)")
+    console.print(plan_table)
+
+    if dry_run:
+        return
+
+    fail_rows = [r for r in results if not r["ok"]]
+    console.print()
+    if fail_rows:
+        for row in fail_rows:
+            console.print(
+                f"[red]FAIL[/red] {row['action']} {row['employee']}: "
+                f"{row['detail']}"
+            )
+        console.print(
+            "[yellow]Baseline not updated; the next sync will retry.[/yellow]"
+        )
+        raise SystemExit(1)
+    console.print(f"[green]Sync complete: {len(results)} action(s).[/green]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""Work with individual tasks on the board.
+
+``next`` shows (and with ``--start`` claims) the next ready task from the
+priority queue of an employee, a division or the whole company.  Waiting
+tasks age towards urgent (``runtime.priority_aging_hours``), so old
+low-priority work is eventually served.  ``start`` marks a task as being
+worked on.  ``renew`` extends the lease of a dispatched task; agents call
+it (or touch their ``HEARTBEAT.md``) so the dispatcher does not hand the
+task to someone else.
+
+Usage::
+
+    python scripts/task.py next --employee director-chen
+    python scripts/task.py next --division content-studio --start
+    python scripts/task.py start 2026-02-05-001
+    python scripts/task.py renew 2026-02-05-001 --minutes 90
+    python scripts/task.py next --json
+"""
+
+from __future__ import annotations
+
+import click
+
+import _common
+
+
+@click.group()
+def main() -> None:
+    """Work with individual tasks on the board."""
+
+
+@main.command("next")
+@click.option(
+    "--employee",
+    "employee_id",
+    default=None,
+    help="Next task of this employee.",
+)
+@click.option(
+    "--division",
+    "division_id",
+    default=None,
+    help="Next task of this division.",
+)
+@click.option(
+    "--start",
+    is_flag=True,
+    default=False,
+    help="Also mark the task as started.",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Emit the task as JSON (null if the queue is empty).",
+)
+def next_task(
+    employee_id: str | None,
+    division_id: str | None,
+    start: bool,
+    as_json: bool,
+) -> None:
+    """Show the most urgent ready task."""
+    as_json = _common.json_mode(as_json)
+    cfg = _common.load_config(as_json=as_json)
+
+    if employee_id is not None and division_id is not None:
+        _common.fail("Pass --employee or --division, not both.", as_json=as_json)
+    if employee_id is not None and employee_id not in cfg.employees:
+        _common.fail(f"Unknown employee '{employee_id}'.", as_json=as_json)
+    if division_id is not None and division_id not in cfg.divisions:
+        _common.fail(f"Unknown division '{division_id}'.", as_json=as_json)
+
+    from lib import Orchestrator
+    from lib.ready import ReadyQueues
+
+    orch = Orchestrator(cfg)
+    queues = ReadyQueues.from_tasks(
+        orch.list_tasks(), cfg.runtime.priority_aging_hours
+    )
+    task = queues.pop(assignee=employee_id, division=division_id)
+    if task is not None and start:
+        task = orch.start_task(task.id)
+
+    if as_json:
+        _common.emit_json({
+            "task": task.to_dict() if task is not None else None,
+            "waiting": len(queues),
+        })
+        return
+
+    from rich.markup import escape
+
+    console = _common.get_console()
+    if task is None:
+        console.print("[dim]No ready tasks.[/dim]")
+        return
+    state = "[green]started[/green]" if start else "ready"
+    console.print(
+        f"[bold]{task.id}[/bold] \\[{task.priority_name}] {escape(task.title)} "
+        f"(-> {task.assignee}, {state})"
+    )
+    if task.description:
+        console.print(f"  {escape(task.description)}")
+    console.print(f"[dim]{len(queues)} other ready task(s) on the board.[/dim]")
+
+
+@main.command()
+@click.argument("task_id")
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Emit the task as JSON.",
+)
+def start(task_id: str, as_json: bool) -> None:
+    """Mark TASK_ID as started by its assignee."""
+    as_json = _common.json_mode(as_json)
+    cfg = _common.load_config(as_json=as_json)
+
+    from lib import Orchestrator
+
+    try:
+        task = Orchestrator(cfg).start_task(task_id)
+    except KeyError as exc:
+        _common.fail(str(exc.args[0]), as_json=as_json)
+
+    if as_json:
+        _common.emit_json({"task": task.to_dict()})
+        return
+    _common.get_console().print(
+        f"[green]Started[/green] {task.id} ({task.title}) at {task.started}"
+    )
+
+
+@main.command()
+@click.argument("task_id")
+@click.option(
+    "--minutes",
+    default=None,
+    type=click.FloatRange(min=1),
+    help="New lease length from now [default: runtime.lease_minutes, or "
+    "the role's heartbeat SLA].",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Emit the task as JSON.",
+)
+def renew(task_id: str, minutes: float | None, as_json: bool) -> None:
+    """Extend the dispatch lease of TASK_ID."""
+    as_json = _common.json_mode(as_json)
+    cfg = _common.load_config(as_json=as_json)
+
+    from lib.lease import LeaseManager
+
+    try:
+        task = LeaseManager(cfg, fallback="").renew(
+            task_id, seconds=None if minutes is None else minutes * 60
+        )
+    except KeyError as exc:
+        _common.fail(str(exc.args[0]), as_json=as_json)
+    except ValueError as exc:
+        _common.fail(
+            str(exc),
+            as_json=as_json,
+            hint="Only tasks handed out by `vwork dispatch` hold a lease.",
+        )
+
+    if as_json:
+        _common.emit_json({"task": task.to_dict()})
+        return
+    _common.get_console().print(
+        f"[green]Renewed[/green] {task.id} ({task.title}) until {task.lease_until}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Unified ``vwork`` command-line entry point.
+
+Multiplexes the individual scripts as subcommands of one click group.  A
+subcommand's module is only imported when that subcommand runs, and rich is
+only imported by commands that render to the terminal, so ``vwork --help``
+and ``vwork --json <command>`` stay cheap to start.
+
+Usage::
+
+    python scripts/vwork.py status
+    python scripts/vwork.py --json status
+    python scripts/vwork.py standup --division content-studio
+    python scripts/vwork.py sync --dry-run
+    pixi run vwork assign --to director-chen --task "Review EP002 script"
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+
+import click
+
+import _common
+
+
+# Subcommand name -> (script module, one-line help shown by ``--help``)
+_COMMANDS: dict[str, tuple[str, str]] = {
+    "status": ("status", "Display the VWork company status dashboard."),
+    "hire": ("hire", "Create a new employee and provision their workspace."),
+    "assign": ("assign", "Create a task and assign it to an employee."),
+    "standup": ("standup", "Generate and display a daily standup report."),
+    "register-agents": (
+        "register_agents",
+        "Register employees as OpenClaw agents.",
+    ),
+    "sync": ("sync", "Re-provision only what changed since the last sync."),
+    "scan": ("scan", "Index employee workspace files (sizes, mtimes, hashes)."),
+    "task": ("task", "Show the next ready task, start a task or renew its lease."),
+    "dispatch": (
+        "dispatch",
+        "Dispatch ready tasks to idle employees in priority order.",
+    ),
+    "rebalance": (
+        "rebalance",
+        "Move unstarted tasks from overloaded to idle employees.",
+    ),
+    "plan": ("plan", "Estimate task durations and find the critical path."),
+    "routing": ("routing", "Summarise model routing decisions per tier."),
+    "doctor": ("doctor", "Verify workspaces against templates and org config."),
+    "memory": ("memory", "Search and compact employee memory files."),
+    "context": ("context", "Build context bundles and report estimated token counts."),
+    "watchdog": (
+        "watchdog",
+        "Flag agents whose heartbeat has not advanced within their SLA.",
+    ),
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports a subcommand's module on first use."""
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(_COMMANDS)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        spec = _COMMANDS.get(cmd_name)
+        if spec is None:
+            return None
+        module = import_module(spec[0])
+        return module.main
+
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        # Use the static help strings so ``--help`` imports no subcommand.
+        rows = [(name, _COMMANDS[name][1]) for name in self.list_commands(ctx)]
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+@click.group(cls=LazyGroup)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Emit JSON from the subcommand and skip rich entirely.",
+)
+@click.pass_context
+def cli(ctx: click.Context, as_json: bool) -> None:
+    """VWork virtual company management."""
+    ctx.meta[_common.JSON_META_KEY] = as_json
+
+
+if __name__ == "__main__":
+    cli()
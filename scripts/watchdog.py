@@ -0,0 +1,145 @@
+"""Watch running tasks and flag agents whose heartbeat went quiet.
+
+Each assignee of an active task must touch their ``HEARTBEAT.md`` within
+their role's SLA (``heartbeat_sla_minutes`` in ``org/roles.yaml``, falling
+back to ``runtime.heartbeat_sla_minutes`` in ``company.yaml``).  Workspaces
+are watched through inotify where available, otherwise by batched polling.
+
+With ``--redispatch`` the tasks of a stale agent are handed back to the
+dispatcher as if their leases had run out: re-queued while
+``runtime.lease_max_retries`` allows, then given to
+``runtime.lease_fallback`` or blocked.  The dispatcher sends them again.
+
+Usage::
+
+    python scripts/watchdog.py                     # run until Ctrl-C
+    python scripts/watchdog.py --once              # single check (cron)
+    python scripts/watchdog.py --redispatch        # hand stale tasks back
+    python scripts/watchdog.py --json              # one JSON line per event
+"""
+
+from __future__ import annotations
+
+import time
+
+import click
+
+import _common
+
+
+@click.command()
+@click.option(
+    "--interval",
+    default=60.0,
+    show_default=True,
+    type=click.FloatRange(min=1),
+    help="Seconds between SLA checks.",
+)
+@click.option(
+    "--once",
+    is_flag=True,
+    default=False,
+    help="Check once and exit (status 1 if any agent is stale).",
+)
+@click.option(
+    "--redispatch/--no-redispatch",
+    default=None,
+    help="Expire the leases of stale tasks so the dispatcher sends them "
+    "again. Defaults to runtime.redispatch_stale.",
+)
+@click.option(
+    "--poll",
+    is_flag=True,
+    default=False,
+    help="Use mtime polling even where inotify is available.",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Emit stale agents as JSON instead of rich output.",
+)
+def main(
+    interval: float,
+    once: bool,
+    redispatch: bool | None,
+    poll: bool,
+    as_json: bool,
+) -> None:
+    """Flag agents whose heartbeat has not advanced within their SLA."""
+    as_json = _common.json_mode(as_json)
+    cfg = _common.load_config(as_json=as_json)
+
+    from lib.watch import Watcher, make_watcher
+    from lib.watchdog import StaleAgent, Watchdog
+
+    console = None if as_json else _common.get_console()
+
+    def report(agent: StaleAgent) -> None:
+        if as_json:
+            _common.emit_json(
+                {"event": "stale", "at": time.time(), **agent.to_dict()},
+                stream=True,
+            )
+            return
+        tasks = ", ".join(f"{t.id} ({t.title})" for t in agent.tasks)
+        console.print(
+            f"[yellow]STALE[/yellow] {agent.employee}: no heartbeat for "
+            f"{agent.quiet_for / 60:.0f} min (SLA {agent.sla / 60:.0f} min) "
+            f"-- {tasks}"
+        )
+        for e in agent.handed_off:
+            target = "" if e.action == "blocked" else f" -> {e.assignee}"
+            console.print(
+                f"  [cyan]{e.action}[/cyan] {e.task.id} "
+                f"(attempt {e.task.attempts}){target}"
+            )
+
+    def watchdog(watcher: Watcher | None = None) -> Watchdog:
+        try:
+            return Watchdog(cfg, watcher=watcher, redispatch=redispatch)
+        except KeyError as exc:
+            if watcher is not None:
+                watcher.close()
+            _common.fail(
+                str(exc.args[0]),
+                as_json=as_json,
+                hint="Fix runtime.lease_fallback in company.yaml.",
+            )
+
+    if once:
+        dog = watchdog()
+        stale = dog.check_once()
+        if as_json:
+            _common.emit_json({"stale": [a.to_dict() for a in stale]})
+        else:
+            for agent in stale:
+                report(agent)
+            if not stale:
+                console.print(
+                    "[green]All running tasks have a fresh heartbeat.[/green]"
+                )
+        if stale:
+            raise SystemExit(1)
+        return
+
+    watcher = make_watcher(poll_interval=min(interval, 5.0), polling=poll)
+    with watchdog(watcher) as dog:
+        if console is not None:
+            console.print(
+                f"[dim]Watching with {type(watcher).__name__}; "
+                f"checking every {interval:g}s. Ctrl-C to stop.[/dim]"
+            )
+        try:
+            dog.run(
+                interval=interval,
+                on_stale=report,
+                on_error=_common.pass_failed("watchdog", as_json=as_json),
+            )
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()